@@ -8,7 +8,9 @@ Implemented using generators to allow for asynchronous plugins.
 """
 
 from typing import (
+    Any,
     AnyStr,
+    Deque,
     Dict,
     Generator,
     List,
@@ -26,14 +28,26 @@ OctStr = NewType("OctStr", str)
 DEFAULT_COMPRESS_LEVEL_ZIP = 9
 DEFAULT_COMPRESS_LEVEL_TAR = 9
 
-from os import DirEntry, stat, chmod
-from os.path import commonpath
+# The amount of entries the workers listing directories in parallel can be ahead of the plugin.
+ENTRIES_BUFFER_SIZE = 1000
+
+# The interval in seconds that a worker checks if the listing was stopped while the entries buffer is full.
+ENTRIES_POLL_INTERVAL = 0.1
+
+# Marks the end of the entries listed in parallel.
+_ENTRIES_END = object()
+
+from collections import deque
+from os import DirEntry, scandir, sep, stat, chmod
+from os.path import basename, commonpath, join, normcase
 from shutil import copy, copy2, copytree, move, rmtree
 from subprocess import Popen, PIPE
 from dataclasses import dataclass, asdict
-from pathlib import Path
+from pathlib import Path, PurePath
+from queue import Full, Queue
+from threading import Condition, Event, Thread
 from json import dumps
-from re import compile
+from re import IGNORECASE, Pattern, compile, escape
 import stat as _stat
 import zipfile
 import tarfile
@@ -82,6 +96,156 @@ class Entry:
         return self.path
 
 
+@dataclass
+class EntryChange(Entry):
+    """Represents a change of an entry (files, directories, ...) since a snapshot of the entries.
+    The change is either `created`, `modified` or `deleted`, deleted entries have no metadata.
+    The class is JSON serializable in order to be easily
+    represented in the data stores.
+    """
+
+    change: Literal["created", "modified", "deleted"]
+
+
+class _EntryMatcher:
+    """Matches the paths of entries on a list of glob patterns compiled into a single regular expression.
+    Patterns are matched like `Path.match`, a relative pattern matches the last parts of the path and an absolute pattern
+    the full path. A `**` part matches any amount of parts, as the last part it matches one or more parts.
+
+    :param patterns: The glob patterns to match
+    :type patterns: List[str]
+    :raises ValueError: If any pattern is empty
+    """
+
+    def __init__(self, patterns: List[str]):
+        expressions, prune_expressions = [], []
+        for pattern in patterns:
+            _pattern = PurePath(pattern)
+            if not _pattern.parts:
+                raise ValueError(f"Invalid empty pattern in patterns: {patterns}")
+
+            expressions.append(self._translate(_pattern, _pattern.parts))
+
+            # Every entry below a directory matching the prefix of `prefix/*` or `prefix/**` is matched.
+            prefix = _pattern.parts[1:-1] if _pattern.anchor else _pattern.parts[:-1]
+            if prefix and _pattern.parts[-1] in ["*", "**"]:
+                prune_expressions.append(
+                    self._translate(_pattern, _pattern.parts[:-1])
+                )
+
+        flags = IGNORECASE if normcase("A") == "a" else 0
+        self.expression: Optional[Pattern] = (
+            compile("|".join(expressions), flags) if expressions else None
+        )
+        self.prune_expression: Optional[Pattern] = (
+            compile("|".join(prune_expressions), flags) if prune_expressions else None
+        )
+
+    def match(self, path: str) -> bool:
+        """Check if the path matches any of the patterns.
+
+        :param path: The path to match
+        :type path: str
+        :return: If the path matches
+        :rtype: bool
+        """
+        if self.expression is None:
+            return False
+
+        return self.expression.search(self._normalize(path)) is not None
+
+    def prunes(self, path: str) -> bool:
+        """Check if every entry below the directory at the path matches any of the patterns.
+
+        :param path: The path to the directory
+        :type path: str
+        :return: If every entry below the directory matches
+        :rtype: bool
+        """
+        if self.prune_expression is None:
+            return False
+
+        return self.prune_expression.search(self._normalize(path)) is not None
+
+    def _normalize(self, path: str) -> str:
+        """Normalize the separators of the path to `/` which the patterns are translated for.
+
+        :param path: The path to normalize
+        :type path: str
+        :return: The normalized path
+        :rtype: str
+        """
+        return path if sep == "/" else path.replace(sep, "/")
+
+    def _translate(self, pattern: PurePath, parts: Tuple[str, ...]) -> str:
+        """Translate the parts of a pattern to a regular expression matching the paths with the same last parts,
+        or the same parts if the pattern is absolute.
+
+        :param pattern: The pattern the parts are from
+        :type pattern: PurePath
+        :param parts: The parts of the pattern to translate
+        :type parts: Tuple[str, ...]
+        :return: The regular expression
+        :rtype: str
+        """
+        if pattern.anchor:
+            expression = "^" + escape(pattern.anchor.replace(sep, "/"))
+            parts = parts[1:]
+        else:
+            expression = "(?:^|/)"
+
+        for index, part in enumerate(parts):
+            last = index == len(parts) - 1
+            if part == "**":
+                expression += ".+" if last else "(?:[^/]+/)*"
+            else:
+                expression += self._translate_part(part) + ("" if last else "/")
+
+        return f"(?:{expression}\\Z)"
+
+    def _translate_part(self, part: str) -> str:
+        """Translate a part of a pattern to a regular expression, like `fnmatch.translate` but never matching a `/`.
+
+        :param part: The part of the pattern
+        :type part: str
+        :return: The regular expression
+        :rtype: str
+        """
+        expression, index = "", 0
+        while index < len(part):
+            char = part[index]
+            index += 1
+            if char == "*":
+                expression += "[^/]*"
+            elif char == "?":
+                expression += "[^/]"
+            elif char == "[":
+                end = index
+                if end < len(part) and part[end] == "!":
+                    end += 1
+                if end < len(part) and part[end] == "]":
+                    end += 1
+                while end < len(part) and part[end] != "]":
+                    end += 1
+
+                if end >= len(part):
+                    expression += "\\["
+                    continue
+
+                characters = part[index:end].replace("\\", "\\\\")
+                index = end + 1
+                if characters[0] == "!":
+                    characters = "^/" + characters[1:]
+                elif characters[0] in ["^", "["]:
+                    characters = "\\" + characters
+
+                expression += f"[{characters}]"
+            else:
+                expression += escape(char)
+
+        return expression
+
+
 def entry(path: str, follow_symlinks: bool = True, exceptions: bool = True) -> Entry:
     """Given an absolute path to an entry returns its entry representation.
 
@@ -114,80 +278,439 @@ def entries(
     exclude: List[str] = None,
     follow_symlinks: bool = True,
     exceptions: bool = True,
+    workers: int = 1,
+    metadata: bool = True,
 ) -> Generator[Entry, None, None]:
     """Lists all the entries at the specific path.
     Defaults to only scan the current depth (0) of entries.
+    The directories are listed with `os.scandir` so the type of each entry is known without a `stat` call
+    and the metadata reuses the `stat` result cached by the directory entry.
 
     :param path: Path to start listing from
     :type path: str
-    :param patterns: List of patterns to match entries on in regex form, defaults to None
+    :param patterns: List of glob patterns to match entries on, matched like `Path.match` with support for `**` matching any amount of directories, defaults to None
     :type patterns: List[str], optional
     :param depth: Max depth of directories that the scanner will visit, if the depth is -1 then the scanner will traverse until it reaches the end, defaults to 0
     :type depth: int, optional
-    :param exclude: Entries to exclude, if the entry is a directory then that entire path will be skipped, defaults to None
+    :param exclude: Glob patterns of entries to exclude, if the entry is a directory then that entire path will be skipped, as will directories where a pattern like `directory/*` or `directory/**` matches every entry below it, defaults to None
     :type exclude: List[str], optional
     :param exceptions: Raise exceptions that occur to the plugin for it to handle, if set to `False` no exceptions will be raised, defaults to `False`
     :type exceptions: bool, optional
+    :param workers: The amount of threads listing directories at the same time, with more than one worker the entries are yielded in the order they are found, defaults to 1
+    :type workers: int, optional
+    :param metadata: Include the metadata of the entries, if set to `False` the entries are listed without any `stat` call and the `stat` of each entry is `None`, defaults to `True`
+    :type metadata: bool, optional
+    :raises ValueError: If the amount of workers is not an integer greater than 0 or if any pattern is empty
     :yield: Entry
     :returns: Generator of entries matching the pattern
     :rtype: Generator[Entry, None, None]
     """
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError(
+            f"Invalid amount of workers: '{workers}', value must be an integer greater than 0"
+        )
 
-    def _generator(
-        iterator: Generator[Path, None, None],
-        patterns: List[str],
-        current_depth: int,
-        exclude: List[str],
-        follow_symlinks: bool,
-    ):
-        try:
-            while True:
-                _object = next(iterator)
-                if exclude is not None and any(
-                    [
-                        _object.match(pattern) or Path(_object.name).match(pattern)
-                        for pattern in exclude
-                    ]
-                ):
+    # The patterns are compiled once for the whole listing.
+    patterns = _EntryMatcher(patterns) if patterns is not None else None
+    exclude = _EntryMatcher(exclude) if exclude is not None else None
+    if workers > 1:
+        return _entries_parallel(
+            str(Path(path)),
+            patterns,
+            depth,
+            exclude,
+            follow_symlinks,
+            exceptions,
+            workers,
+            metadata,
+        )
+
+    def _generator(directory: str, current_depth: int) -> Generator[Entry, None, None]:
+        with scandir(directory) as iterator:
+            for _object in iterator:
+                if _entry_excluded(_object, exclude):
                     continue
 
                 try:
-                    if (
-                        _object.is_dir()
-                        and (current_depth < depth or depth == -1)
-                        and (
-                            (_object.is_symlink() and follow_symlinks)
-                            or not _object.is_symlink()
-                        )
+                    if _entry_descends(
+                        _object, current_depth, depth, follow_symlinks, exclude
                     ):
-                        for _inner in _generator(
-                            _object.iterdir(),
-                            patterns,
-                            current_depth + 1,
-                            exclude,
-                            follow_symlinks,
-                        ):
+                        for _inner in _generator(_object.path, current_depth + 1):
                             yield _inner
                 except Exception as exc:
                     if exceptions:
                         raise exc from None
 
-                if patterns is None or any(
-                    [
-                        _object.match(pattern) or Path(_object.name).match(pattern)
-                        for pattern in patterns
+                if _entry_matches(_object, patterns):
+                    yield _directory_entry(_object, metadata, exceptions)
+
+    return _generator(str(Path(path)), 0)
+
+
+def _directory_entry(_object: DirEntry, metadata: bool, exceptions: bool) -> Entry:
+    """Create the entry representation of a directory entry listed by `os.scandir`.
+
+    :param _object: The directory entry
+    :type _object: DirEntry
+    :param metadata: Include the metadata of the entry, reusing the `stat` result cached by the directory entry
+    :type metadata: bool
+    :param exceptions: Raise exceptions that occur when reading the metadata
+    :type exceptions: bool
+    :return: The entry
+    :rtype: Entry
+    """
+    return Entry(
+        path=_object.path,
+        name=_object.name,
+        stat=entry_metadata(_object, exceptions=exceptions) if metadata else None,
+    )
+
+
+def _entry_excluded(_object: DirEntry, exclude: Optional[_EntryMatcher]) -> bool:
+    """Check if the object matches any of the patterns to exclude.
+
+    :param _object: The object to check
+    :type _object: DirEntry
+    :param exclude: The patterns to exclude, `None` excludes nothing
+    :type exclude: Optional[_EntryMatcher]
+    :return: If the object is excluded
+    :rtype: bool
+    """
+    return exclude is not None and exclude.match(_object.path)
+
+
+def _entry_matches(_object: DirEntry, patterns: Optional[_EntryMatcher]) -> bool:
+    """Check if the object matches any of the patterns.
+
+    :param _object: The object to check
+    :type _object: DirEntry
+    :param patterns: The patterns to match, `None` matches everything
+    :type patterns: Optional[_EntryMatcher]
+    :return: If the object matches
+    :rtype: bool
+    """
+    return patterns is None or patterns.match(_object.path)
+
+
+def _entry_descends(
+    _object: DirEntry,
+    current_depth: int,
+    depth: int,
+    follow_symlinks: bool,
+    exclude: Optional[_EntryMatcher],
+) -> bool:
+    """Check if the entries of the object should be listed, the object has to be a directory within the max depth.
+    The type of the object is given by the directory listing, only symbolic links need a `stat` call.
+    Directories where every entry would be excluded are not listed.
+
+    :param _object: The object to check
+    :type _object: DirEntry
+    :param current_depth: The depth of the object
+    :type current_depth: int
+    :param depth: Max depth of directories to visit, -1 to visit every depth
+    :type depth: int
+    :param follow_symlinks: If directories that are symbolic links are visited
+    :type follow_symlinks: bool
+    :param exclude: The patterns to exclude, `None` excludes nothing
+    :type exclude: Optional[_EntryMatcher]
+    :return: If the entries of the object should be listed
+    :rtype: bool
+    """
+    return (
+        (current_depth < depth or depth == -1)
+        and _object.is_dir()
+        and (follow_symlinks or not _object.is_symlink())
+        and (exclude is None or not exclude.prunes(_object.path))
+    )
+
+
+def _entries_parallel(
+    path: str,
+    patterns: Optional[_EntryMatcher],
+    depth: int,
+    exclude: Optional[_EntryMatcher],
+    follow_symlinks: bool,
+    exceptions: bool,
+    workers: int,
+    metadata: bool,
+) -> Generator[Entry, None, None]:
+    """Lists the entries at the specific path with a pool of threads listing directories at the same time.
+    Every worker lists the directories it finds itself first, most recently found first, and steals the oldest
+    directory from another worker once it has none left. The entries are streamed through a bounded queue as they are found,
+    the workers are stopped when the generator is closed.
+
+    :param path: Path to start listing from
+    :type path: str
+    :param patterns: The patterns to match entries on
+    :type patterns: Optional[_EntryMatcher]
+    :param depth: Max depth of directories to visit, -1 to visit every depth
+    :type depth: int
+    :param exclude: The patterns of entries to exclude, excluded directories are not visited
+    :type exclude: Optional[_EntryMatcher]
+    :param follow_symlinks: If directories that are symbolic links are visited
+    :type follow_symlinks: bool
+    :param exceptions: Raise exceptions that occur when listing the directories below the path
+    :type exceptions: bool
+    :param workers: The amount of threads listing directories
+    :type workers: int
+    :param metadata: Include the metadata of the entries
+    :type metadata: bool
+    :yield: Entry
+    :rtype: Generator[Entry, None, None]
+    """
+    directories: List[Deque[Tuple[str, int]]] = [deque() for _ in range(workers)]
+    directories[0].append((path, 0))
+    condition = Condition()
+    state = {"available": 1, "pending": 1}
+    results: Queue = Queue(maxsize=ENTRIES_BUFFER_SIZE)
+    stop_event = Event()
+
+    def _put(result: Union[Entry, Exception, object]) -> bool:
+        while not stop_event.is_set():
+            try:
+                results.put(result, timeout=ENTRIES_POLL_INTERVAL)
+                return True
+            except Full:
+                pass
+
+        return False
+
+    def _take(index: int) -> Optional[Tuple[str, int]]:
+        with condition:
+            while not state["available"]:
+                if not state["pending"] or stop_event.is_set():
+                    return None
+
+                condition.wait()
+
+            state["available"] -= 1
+
+        # A directory is reserved so one is left in the deques, even if another worker takes the first one scanned.
+        while True:
+            try:
+                return directories[index].pop()
+            except IndexError:
+                pass
+
+            for _index in range(index + 1, index + workers):
+                try:
+                    return directories[_index % workers].popleft()
+                except IndexError:
+                    continue
+
+    def _worker(index: int) -> NoReturn:
+        while True:
+            directory = _take(index)
+            if directory is None:
+                return
+
+            _directory, current_depth = directory
+            found = []
+            try:
+                with scandir(_directory) as iterator:
+                    for _object in iterator:
+                        if _entry_excluded(_object, exclude):
+                            continue
+
+                        try:
+                            if _entry_descends(
+                                _object, current_depth, depth, follow_symlinks, exclude
+                            ):
+                                found.append((_object.path, current_depth + 1))
+                        except Exception as exc:
+                            if exceptions and not _put(exc):
+                                return
+
+                        if _entry_matches(_object, patterns) and not _put(
+                            _directory_entry(_object, metadata, exceptions)
+                        ):
+                            return
+            except Exception as exc:
+                if (exceptions or current_depth == 0) and not _put(exc):
+                    return
+            finally:
+                directories[index].extend(found)
+                with condition:
+                    state["available"] += len(found)
+                    state["pending"] += len(found) - 1
+                    if not state["pending"]:
+                        _put(_ENTRIES_END)
+
+                    condition.notify_all()
+
+    threads = [
+        Thread(
+            target=_worker, args=(index,), name=f"TridentEntries-{index}", daemon=True
+        )
+        for index in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            result = results.get()
+            if result is _ENTRIES_END:
+                break
+
+            if isinstance(result, Exception):
+                raise result from None
+
+            yield result
+    finally:
+        stop_event.set()
+        with condition:
+            condition.notify_all()
+
+        for thread in threads:
+            thread.join()
+
+
+def entries_changed(
+    path: str,
+    snapshot: Dict[str, Any],
+    patterns: List[str] = None,
+    depth: int = 0,
+    exclude: List[str] = None,
+    follow_symlinks: bool = True,
+    exceptions: bool = True,
+    modified: bool = True,
+) -> Generator[EntryChange, None, None]:
+    """Lists the entries at the specific path that were created, modified or deleted since the snapshot.
+    The snapshot is a JSON serializable index of the entries listed before, it is updated once every entry has been listed
+    so it can be kept in the `plugin_state` of the plugin to be stored with the checkpoint of the runner.
+    Use one snapshot for each combination of path, patterns, depth and exclude, the changes are listed as created for an empty snapshot.
+    An entry is modified when the inode, size, modification time or change time of the entry has changed.
+
+    :param path: Path to start listing from
+    :type path: str
+    :param snapshot: The snapshot of the entries listed before, an empty dictionary to start a new snapshot
+    :type snapshot: Dict[str, Any]
+    :param patterns: List of glob patterns to match entries on, like for `entries`, defaults to None
+    :type patterns: List[str], optional
+    :param depth: Max depth of directories that the scanner will visit, if the depth is -1 then the scanner will traverse until it reaches the end, defaults to 0
+    :type depth: int, optional
+    :param exclude: Glob patterns of entries to exclude, like for `entries`, defaults to None
+    :type exclude: List[str], optional
+    :param follow_symlinks: If directories that are symbolic links are visited, defaults to `True`
+    :type follow_symlinks: bool, optional
+    :param exceptions: Raise exceptions that occur to the plugin for it to handle, if set to `False` the entries below a directory that can't be listed are kept as they were, defaults to `True`
+    :type exceptions: bool, optional
+    :param modified: List modified entries, if set to `False` only created and deleted entries are listed and directories with the same modification time as in the snapshot are not listed again, since the modification time of a directory only changes when entries are created or deleted in it, defaults to `True`
+    :type modified: bool, optional
+    :raises ValueError: If any pattern is empty
+    :yield: EntryChange
+    :returns: Generator of the changed entries, the deleted entries are listed last
+    :rtype: Generator[EntryChange, None, None]
+    """
+    _patterns = _EntryMatcher(patterns) if patterns is not None else None
+    _exclude = _EntryMatcher(exclude) if exclude is not None else None
+    previous_entries: Dict[str, Optional[List[int]]] = snapshot.get("entries", {})
+    previous_directories: Dict[str, List[Any]] = snapshot.get("directories", {})
+    current_entries: Dict[str, Optional[List[int]]] = {}
+    current_directories: Dict[str, List[Any]] = {}
+
+    def _keep(directory: str) -> NoReturn:
+        prefix = join(directory, "")
+        for _path, key in previous_entries.items():
+            if _path.startswith(prefix):
+                current_entries.setdefault(_path, key)
+
+        for _path, record in previous_directories.items():
+            if _path == directory or _path.startswith(prefix):
+                current_directories.setdefault(_path, record)
+
+    def _unchanged(
+        directory: str, record: List[Any], current_depth: int
+    ) -> Generator[EntryChange, None, None]:
+        _, names, subdirectories = record
+        current_directories[directory] = record
+        for name in names:
+            _path = join(directory, name)
+            if _path in previous_entries:
+                current_entries[_path] = previous_entries[_path]
+
+        for name in subdirectories:
+            _path = join(directory, name)
+            try:
+                yield from _walk(_path, stat(_path).st_mtime_ns, current_depth + 1)
+            except Exception as exc:
+                if exceptions:
+                    raise exc from None
+
+                _keep(_path)
+
+    def _walk(
+        directory: str, mtime: int, current_depth: int
+    ) -> Generator[EntryChange, None, None]:
+        record = previous_directories.get(directory)
+        if not modified and record is not None and record[0] == mtime:
+            yield from _unchanged(directory, record, current_depth)
+            return
+
+        names, subdirectories = [], []
+        with scandir(directory) as iterator:
+            for _object in iterator:
+                if _entry_excluded(_object, _exclude):
+                    continue
+
+                try:
+                    if _entry_descends(
+                        _object, current_depth, depth, follow_symlinks, _exclude
+                    ):
+                        subdirectories.append(_object.name)
+                        yield from _walk(
+                            _object.path, _object.stat().st_mtime_ns, current_depth + 1
+                        )
+                except Exception as exc:
+                    if exceptions:
+                        raise exc from None
+
+                    _keep(_object.path)
+
+                if not _entry_matches(_object, _patterns):
+                    continue
+
+                created = _object.path not in previous_entries
+                key = None
+                if modified:
+                    try:
+                        _stat = _object.stat()
+                    except Exception as exc:
+                        if exceptions:
+                            raise exc from None
+
+                        continue
+
+                    key = [
+                        _stat.st_ino,
+                        _stat.st_size,
+                        _stat.st_mtime_ns,
+                        _stat.st_ctime_ns,
                     ]
-                ):
-                    yield Entry(
-                        path=str(_object),
+
+                names.append(_object.name)
+                current_entries[_object.path] = key
+                if created or (modified and previous_entries[_object.path] != key):
+                    yield EntryChange(
+                        path=_object.path,
                         name=_object.name,
                         stat=entry_metadata(_object, exceptions=exceptions),
+                        change="created" if created else "modified",
                     )
 
-        except StopIteration:
-            pass
+        current_directories[directory] = [mtime, names, subdirectories]
+
+    root = str(Path(path))
+    yield from _walk(root, stat(root).st_mtime_ns, 0)
+    for _path in previous_entries:
+        if _path not in current_entries:
+            yield EntryChange(
+                path=_path, name=basename(_path), stat=None, change="deleted"
+            )
 
-    return _generator(Path(path).iterdir(), patterns, 0, exclude, follow_symlinks)
+    snapshot["entries"] = current_entries
+    snapshot["directories"] = current_directories
 
 
 def execute(
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident Plugin: Filesystem Watch Library
+Includes operations like watching entries (files, directories, ...) for changes, ...
+Implemented with inotify on Linux through `ctypes` to not depend on any library outside of the standard library.
+Implemented using generators to allow for asynchronous plugins.
+@author: Jacob Wahlman
+"""
+
+from typing import Dict, Generator, List, NoReturn, Optional, Tuple
+
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from os import close, fsdecode, fsencode, read, scandir, sep, strerror
+from os.path import isdir, join
+from pathlib import Path
+from select import select
+from struct import calcsize, unpack_from
+from threading import Event
+import sys
+
+from plugins.lib.files.files import (
+    EntryChange,
+    _EntryMatcher,
+    _entry_descends,
+    _entry_excluded,
+    _entry_matches,
+    entry_metadata,
+)
+
+# The inotify events and flags, defined in `sys/inotify.h`.
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# The interval in seconds that the watch checks the thread event while waiting for changes.
+WATCH_POLL_INTERVAL = 0.1
+
+# The amount of bytes of events read at a time.
+WATCH_READ_SIZE = 64 * 1024
+
+# The header of each event, followed by the null padded name of the entry.
+_EVENT_HEADER = "iIII"
+_EVENT_HEADER_SIZE = calcsize(_EVENT_HEADER)
+
+
+class _Inotify:
+    """Inotify instance watching directories for changes, the functions are loaded from libc with `ctypes`.
+
+    :raises NotImplementedError: If the platform is not Linux
+    :raises OSError: If the inotify instance could not be created
+    """
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise NotImplementedError(
+                f"Watching entries is only supported on Linux, not: '{sys.platform}'"
+            )
+
+        self._libc = CDLL(find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            self._raise_error()
+
+    def __del__(self):
+        self.close()
+
+    def add_watch(self, directory: str, follow_symlinks: bool) -> int:
+        """Watch the directory for changes of the entries in it.
+
+        :param directory: Path to the directory
+        :type directory: str
+        :param follow_symlinks: If the directory is watched when it is a symbolic link to a directory
+        :type follow_symlinks: bool
+        :raises OSError: If the directory could not be watched
+        :return: The watch descriptor of the directory
+        :rtype: int
+        """
+        watch = self._libc.inotify_add_watch(
+            self.fd,
+            fsencode(directory),
+            WATCH_MASK | IN_ONLYDIR | (0 if follow_symlinks else IN_DONT_FOLLOW),
+        )
+        if watch < 0:
+            self._raise_error(directory)
+
+        return watch
+
+    def remove_watch(self, watch: int) -> NoReturn:
+        """Stop watching the directory of the watch descriptor, the directory might already be removed.
+
+        :param watch: The watch descriptor of the directory
+        :type watch: int
+        """
+        self._libc.inotify_rm_watch(self.fd, watch)
+
+    def read_events(self, timeout: float) -> List[Tuple[int, int, str]]:
+        """Read the events that are available, waits at most for the timeout for an event.
+
+        :param timeout: The seconds to wait for an event
+        :type timeout: float
+        :return: The watch descriptor, the event mask and the name of the entry for each event
+        :rtype: List[Tuple[int, int, str]]
+        """
+        readable, _, _ = select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        try:
+            data = read(self.fd, WATCH_READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        events, offset = [], 0
+        while offset < len(data):
+            watch, mask, _, length = unpack_from(_EVENT_HEADER, data, offset)
+            offset += _EVENT_HEADER_SIZE
+            events.append(
+                (watch, mask, fsdecode(data[offset : offset + length].rstrip(b"\0")))
+            )
+            offset += length
+
+        return events
+
+    def close(self) -> NoReturn:
+        """Close the inotify instance, removing every watch."""
+        if getattr(self, "fd", -1) >= 0:
+            close(self.fd)
+            self.fd = -1
+
+    def _raise_error(self, path: Optional[str] = None) -> NoReturn:
+        """Raise the error of the last failed call to libc.
+
+        :param path: The path that the call failed for
+        :type path: Optional[str]
+        :raises OSError: The error of the call
+        """
+        errno = get_errno()
+        raise OSError(errno, strerror(errno), path)
+
+
+def watch_entries(
+    path: str,
+    patterns: List[str] = None,
+    depth: int = 0,
+    exclude: List[str] = None,
+    follow_symlinks: bool = True,
+    exceptions: bool = True,
+    thread_event: Optional[Event] = None,
+) -> Generator[EntryChange, None, None]:
+    """Watches the entries at the specific path and lists the entries that are created, modified or deleted.
+    The directories are watched when the function is called, directories created later within the max depth are watched
+    as they are created and the entries already in them are listed as created. Moved entries are listed as deleted and created.
+    The generator runs until the thread event is set, so it can be used as the generator of a long running plugin.
+
+    :param path: Path to the directory to watch
+    :type path: str
+    :param patterns: List of glob patterns to match entries on, like for `entries`, defaults to None
+    :type patterns: List[str], optional
+    :param depth: Max depth of directories to watch, if the depth is -1 then every directory below the path is watched, defaults to 0
+    :type depth: int, optional
+    :param exclude: Glob patterns of entries to exclude, like for `entries`, excluded directories are not watched, defaults to None
+    :type exclude: List[str], optional
+    :param follow_symlinks: If directories that are symbolic links are watched, defaults to `True`
+    :type follow_symlinks: bool, optional
+    :param exceptions: Raise exceptions that occur to the plugin for it to handle, if set to `False` directories that can't be watched are skipped and lost events are ignored, defaults to `True`
+    :type exceptions: bool, optional
+    :param thread_event: The thread event of the plugin, the watch stops once the event is set, defaults to watching until the watched directory is removed
+    :type thread_event: Optional[Event], optional
+    :raises NotImplementedError: If the platform is not Linux
+    :raises OSError: If the path could not be watched
+    :yield: EntryChange
+    :returns: Generator of the changed entries
+    :rtype: Generator[EntryChange, None, None]
+    """
+    _patterns = _EntryMatcher(patterns) if patterns is not None else None
+    _exclude = _EntryMatcher(exclude) if exclude is not None else None
+    inotify = _Inotify()
+    directories: Dict[int, Tuple[str, int]] = {}
+
+    def _watch(directory: str, current_depth: int, created: bool) -> List[EntryChange]:
+        changes = []
+        try:
+            directories[inotify.add_watch(directory, follow_symlinks)] = (
+                directory,
+                current_depth,
+            )
+            with scandir(directory) as iterator:
+                for _object in iterator:
+                    if _entry_excluded(_object, _exclude):
+                        continue
+
+                    if _entry_descends(
+                        _object, current_depth, depth, follow_symlinks, _exclude
+                    ):
+                        changes.extend(_watch(_object.path, current_depth + 1, created))
+
+                    # Entries created before the directory was watched have no events.
+                    if created and _entry_matches(_object, _patterns):
+                        changes.append(
+                            EntryChange(
+                                path=_object.path,
+                                name=_object.name,
+                                stat=entry_metadata(_object, exceptions=False),
+                                change="created",
+                            )
+                        )
+        except Exception as exc:
+            if exceptions or current_depth == 0:
+                raise exc from None
+
+        return changes
+
+    def _unwatch(directory: str) -> NoReturn:
+        prefix = join(directory, "")
+        for watch, (_directory, _) in list(directories.items()):
+            if _directory == directory or _directory.startswith(prefix):
+                inotify.remove_watch(watch)
+                del directories[watch]
+
+    def _generator() -> Generator[EntryChange, None, None]:
+        try:
+            while directories:
+                previous = None
+                for watch, mask, name in inotify.read_events(WATCH_POLL_INTERVAL):
+                    if mask & IN_Q_OVERFLOW:
+                        if exceptions:
+                            raise OSError(
+                                f"Events were lost for the entries at: '{path}', the inotify event queue overflowed"
+                            )
+
+                        continue
+
+                    if watch not in directories:
+                        continue
+
+                    directory, current_depth = directories[watch]
+                    if mask & IN_IGNORED:
+                        del directories[watch]
+                        continue
+
+                    _path = join(directory, name)
+                    if _exclude is not None and _exclude.match(_path):
+                        continue
+
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        change = "created"
+                        if (
+                            (current_depth < depth or depth == -1)
+                            and (
+                                mask & IN_ISDIR or (follow_symlinks and isdir(_path))
+                            )
+                            and (_exclude is None or not _exclude.prunes(_path))
+                        ):
+                            yield from _watch(_path, current_depth + 1, True)
+                    elif mask & (IN_DELETE | IN_MOVED_FROM):
+                        change = "deleted"
+                        if mask & IN_ISDIR:
+                            _unwatch(_path)
+                    else:
+                        change = "modified"
+
+                    # Writing to a file gives many events in a row, only the first is listed.
+                    if (_path, change) == previous:
+                        continue
+
+                    previous = (_path, change)
+                    if _patterns is None or _patterns.match(_path):
+                        yield EntryChange(
+                            path=_path,
+                            name=name,
+                            stat=entry_metadata(_path, exceptions=False)
+                            if change != "deleted"
+                            else None,
+                            change=change,
+                        )
+
+                if thread_event is not None and thread_event.is_set():
+                    return
+        finally:
+            inotify.close()
+
+    try:
+        _watch(str(Path(path)), 0, False)
+    except Exception as exc:
+        inotify.close()
+        raise exc from None
+
+    return _generator()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import socket
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+
+class HTTPStandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connected(self.request)
+
+    def finish(self):
+        self.server.disconnected(self.request)
+        super().finish()
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def log_message(self, format, *args):
+        return
+
+    def _respond(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.received(self.command, self.path, body)
+        self.send_response(500 if self.path == "/error" else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class HTTPStandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), HTTPStandInHandler)
+        self.connections = 0
+        self.requests = []
+        self._sockets = set()
+        self._lock = Lock()
+
+    @property
+    def url(self):
+        return "http://{}:{}".format(*self.server_address)
+
+    def connected(self, sock):
+        with self._lock:
+            self.connections += 1
+            self._sockets.add(sock)
+
+    def disconnected(self, sock):
+        with self._lock:
+            self._sockets.discard(sock)
+
+    def received(self, method, path, body):
+        with self._lock:
+            self.requests.append((method, path, body))
+
+    def drop_connections(self):
+        with self._lock:
+            for sock in self._sockets:
+                sock.shutdown(socket.SHUT_RDWR)
+
+
+@pytest.fixture
+def http_server():
+    server = HTTPStandInServer()
+    thread = Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import socket
+import socketserver
+from threading import Lock, Thread
+
+
+class SMTPStandInHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.connected(self.request)
+        receivers = []
+        try:
+            self._reply("220 localhost Trident stand-in SMTP")
+            for line in self.rfile:
+                command = line.decode().strip()
+                verb = command[:4].upper()
+                if verb in ["HELO", "EHLO"]:
+                    self._reply("250 localhost")
+                elif verb == "MAIL":
+                    receivers = []
+                    self._reply("250 OK")
+                elif verb == "RCPT":
+                    receivers.append(command.split(":", 1)[1].strip(" <>"))
+                    self._reply("250 OK")
+                elif verb == "DATA":
+                    self._reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = b"".join(iter(self.rfile.readline, b".\r\n"))
+                    self.server.received(receivers, data.decode())
+                    self._reply("250 OK")
+                elif verb in ["RSET", "NOOP"]:
+                    self._reply("250 OK")
+                elif verb == "QUIT":
+                    self._reply("221 Bye")
+                    return
+                else:
+                    self._reply("502 Command not implemented")
+        except OSError:
+            return
+        finally:
+            self.server.disconnected(self.request)
+
+    def _reply(self, reply):
+        self.wfile.write(f"{reply}\r\n".encode())
+
+
+class SMTPStandInServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPStandInHandler)
+        self.connections = 0
+        self.messages = []
+        self._sockets = set()
+        self._lock = Lock()
+
+    @property
+    def address(self):
+        return "{}:{}".format(*self.server_address)
+
+    def connected(self, sock):
+        with self._lock:
+            self.connections += 1
+            self._sockets.add(sock)
+
+    def disconnected(self, sock):
+        with self._lock:
+            self._sockets.discard(sock)
+
+    def received(self, receivers, data):
+        with self._lock:
+            self.messages.append((receivers, data))
+
+    def drop_connections(self):
+        with self._lock:
+            for sock in self._sockets:
+                sock.shutdown(socket.SHUT_RDWR)
+
+
+@pytest.fixture
+def smtp_server():
+    server = SMTPStandInServer()
+    thread = Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -660,3 +660,197 @@ def trident_daemon_invalid_argument_store_async(tmpdir):
             },
         )
     )
+
+
+@pytest.fixture
+def trident_daemon_sync_jsonl(tmpdir):
+    return TridentDaemon(
+        TridentDaemonConfig(
+            workers=1,
+            plugins={
+                "test0": {
+                    "path": "tests.plugins.test_plugin",
+                    "args": {
+                        "store": {
+                            "path_store": tmpdir,
+                            "no_store": False,
+                            "global_store": None,
+                            "backend": "jsonl",
+                        },
+                        "runner": {"dont_store_on_error": False},
+                        "notification": {},
+                        "checkpoint": {"checkpoint_path": tmpdir},
+                    },
+                }
+            },
+        )
+    )
+
+
+@pytest.fixture
+def trident_daemon_async_global_jsonl(tmpdir):
+    return TridentDaemon(
+        TridentDaemonConfig(
+            workers=5,
+            plugins={
+                f"test{index}": {
+                    "path": "tests.plugins.test_plugin",
+                    "args": {
+                        "store": {
+                            "path_store": tmpdir,
+                            "no_store": False,
+                            "global_store": f"{tmpdir}/global.jsonl",
+                            "backend": "jsonl",
+                        },
+                        "runner": {"dont_store_on_error": False},
+                        "notification": {},
+                        "checkpoint": {"checkpoint_path": tmpdir},
+                    },
+                }
+                for index in range(0, 5)
+            },
+        )
+    )
+
+
+@pytest.fixture
+def trident_daemon_sync_flush(request, tmpdir):
+    backend, flush = request.param
+    return TridentDaemon(
+        TridentDaemonConfig(
+            workers=1,
+            plugins={
+                "test0": {
+                    "path": "tests.plugins.test_plugin",
+                    "name": "TestPluginCount",
+                    "plugin_args": {"count": 50},
+                    "args": {
+                        "store": {
+                            "path_store": tmpdir,
+                            "no_store": False,
+                            "global_store": None,
+                            "backend": backend,
+                            "flush": flush,
+                        },
+                        "runner": {"dont_store_on_error": False},
+                        "notification": {},
+                        "checkpoint": {"checkpoint_path": tmpdir},
+                    },
+                }
+            },
+        )
+    )
+
+
+@pytest.fixture
+def trident_daemon_sync_runner(request, tmpdir):
+    return TridentDaemon(
+        TridentDaemonConfig(
+            workers=1,
+            plugins={
+                "test0": {
+                    "path": "tests.plugins.test_plugin",
+                    "name": "TestPluginCount",
+                    "plugin_args": {"count": 50},
+                    "args": {
+                        "store": {
+                            "path_store": tmpdir,
+                            "no_store": False,
+                            "global_store": None,
+                        },
+                        "runner": {"dont_store_on_error": False, **request.param},
+                        "notification": {},
+                        "checkpoint": {"checkpoint_path": tmpdir},
+                    },
+                }
+            },
+        )
+    )
+
+
+@pytest.fixture
+def trident_daemon_async_runners(tmpdir):
+    plugins = {
+        f"test{index}": {
+            "path": "tests.plugins.test_plugin",
+            "name": "TestPluginAsync",
+            "plugin_args": {"count": 10},
+            "args": {
+                "store": {
+                    "path_store": tmpdir,
+                    "no_store": False,
+                    "global_store": None,
+                },
+                "runner": {"dont_store_on_error": False, "batch_size": 4},
+                "notification": {},
+                "checkpoint": {"checkpoint_path": tmpdir},
+            },
+        }
+        for index in range(0, 20)
+    }
+    plugins["test0"]["name"] = "TestPluginAsyncReturn"
+    plugins["test0"]["plugin_args"] = {}
+    return TridentDaemon(TridentDaemonConfig(workers=1, plugins=plugins))
+
+
+@pytest.fixture
+def trident_daemon_steps(request, tmpdir):
+    return TridentDaemon(
+        TridentDaemonConfig(
+            workers=request.param["workers"],
+            plugins={
+                "test0": {
+                    "name": "TestSteps",
+                    "plugin_args": request.param.get("plugin_args", {}),
+                    "steps": request.param["steps"],
+                    "args": {
+                        "store": {
+                            "path_store": tmpdir,
+                            "no_store": False,
+                            "global_store": None,
+                        },
+                        "runner": {
+                            "dont_store_on_error": False,
+                            **request.param.get("runner", {}),
+                        },
+                        "notification": {},
+                        "checkpoint": {"checkpoint_path": tmpdir},
+                    },
+                }
+            },
+        )
+    )
+
+
+@pytest.fixture
+def trident_daemon_scheduler(request, tmpdir):
+    def plugin_config(count, name="TestPluginCount", dont_store_on_error=False):
+        return {
+            "path": "tests.plugins.test_plugin",
+            "name": name,
+            "plugin_args": {"count": count},
+            "args": {
+                "store": {
+                    "path_store": tmpdir,
+                    "no_store": False,
+                    "global_store": None,
+                },
+                "runner": {"dont_store_on_error": dont_store_on_error},
+                "notification": {},
+                "checkpoint": {"checkpoint_path": tmpdir},
+            },
+        }
+
+    return TridentDaemon(
+        TridentDaemonConfig(
+            workers=2,
+            scheduler=True,
+            plugins={
+                "test0": {
+                    **plugin_config(5, **getattr(request, "param", {})),
+                    "schedule": {"interval": 0.2},
+                },
+                "test1": plugin_config(3),
+            },
+        )
+    )
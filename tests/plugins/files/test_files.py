@@ -2,11 +2,203 @@
 # -*- coding: utf-8 -*-
 
 
+import json
 import pytest
+import sys
+import threading
 
 from pathlib import Path
 
 from tests.fixtures.trident_daemon import *
+from plugins.lib.files import files
+from plugins.lib.files.files import entries, entries_changed
+from plugins.lib.files.watch import watch_entries
+
+
+def entries_tree(tmpdir):
+    for directory in ["a", "a/b", "a/b/c", "d", "d/skip", "e"]:
+        tmpdir.mkdir(*directory.split("/"))
+
+    for index, directory in enumerate(["", "a", "a/b", "a/b/c", "d", "d/skip"]):
+        tmpdir.join(*directory.split("/"), f"file{index}.txt").write("content")
+        tmpdir.join(*directory.split("/"), f"file{index}.log").write("content")
+
+    return tmpdir
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"depth": 0},
+        {"depth": 2},
+        {"depth": -1},
+        {"depth": -1, "patterns": ["*.txt"]},
+        {"depth": -1, "exclude": ["skip", "*.log"]},
+    ],
+)
+def test_entries_workers(tmpdir, args):
+    path = str(entries_tree(tmpdir))
+    expected = sorted(entry.path for entry in entries(path, **args))
+    assert expected
+    for workers in [2, 4]:
+        results = [entry.path for entry in entries(path, workers=workers, **args)]
+        assert sorted(results) == expected
+
+
+def test_entries_workers_close(tmpdir):
+    path = str(entries_tree(tmpdir))
+    generator = entries(path, depth=-1, workers=4)
+    assert next(generator).path.startswith(path)
+    generator.close()
+    assert not any(
+        thread.name.startswith("TridentEntries") for thread in threading.enumerate()
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_entries_metadata(tmpdir, monkeypatch, workers):
+    path = str(entries_tree(tmpdir))
+    tmpdir.join("link").mksymlinkto(tmpdir.join("a"))
+    # The metadata of the entries is read from the directory entries instead of the paths.
+    monkeypatch.setattr(files, "stat", None)
+    results = {
+        str(Path(entry.path).relative_to(path)): entry
+        for entry in entries(path, depth=-1, follow_symlinks=False, workers=workers)
+    }
+    assert results["file0.txt"].stat.size == len("content")
+    assert results["link"].stat.inode == results["a"].stat.inode
+    assert "link/file1.txt" not in results
+    assert set(results) == {
+        str(_path.relative_to(path)) for _path in Path(path).rglob("*")
+    }
+    assert all(
+        entry.stat is None
+        for entry in entries(path, depth=-1, workers=workers, metadata=False)
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_entries_patterns(tmpdir, monkeypatch, workers):
+    path = str(entries_tree(tmpdir))
+    listed = []
+    scandir = files.scandir
+    monkeypatch.setattr(
+        files,
+        "scandir",
+        lambda directory: listed.append(directory) or scandir(directory),
+    )
+    results = {
+        str(Path(entry.path).relative_to(path))
+        for entry in entries(
+            path,
+            patterns=["a/**/*.txt", "*.log", f"{path}/e"],
+            exclude=["d/*", "c/**"],
+            depth=-1,
+            workers=workers,
+        )
+    }
+    assert results == {
+        "a/file1.txt",
+        "a/b/file2.txt",
+        "e",
+        "file0.log",
+        "a/file1.log",
+        "a/b/file2.log",
+    }
+    # Every entry in the excluded directories is excluded so they are never listed.
+    assert sorted(Path(directory).name for directory in listed[1:]) == ["a", "b", "e"]
+
+
+def list_changes(path, snapshot, **args):
+    changes = {
+        str(Path(change.path).relative_to(path)): change.change
+        for change in entries_changed(path, snapshot, depth=-1, **args)
+    }
+    # The snapshot is stored as JSON in the checkpoint of the runner.
+    snapshot.update(json.loads(json.dumps(snapshot)))
+    return changes
+
+
+def test_entries_changed(tmpdir):
+    path, snapshot = str(entries_tree(tmpdir)), {}
+    changes = list_changes(path, snapshot, patterns=["*.txt"], exclude=["skip"])
+    assert changes == {
+        f"{directory}file{index}.txt": "created"
+        for index, directory in enumerate(["", "a/", "a/b/", "a/b/c/", "d/"])
+    }
+    assert list_changes(path, snapshot, patterns=["*.txt"], exclude=["skip"]) == {}
+
+    tmpdir.join("a", "file1.txt").write("changed content")
+    tmpdir.join("a", "b", "new.txt").write("content")
+    tmpdir.join("d", "file4.txt").remove()
+    assert list_changes(path, snapshot, patterns=["*.txt"], exclude=["skip"]) == {
+        "a/file1.txt": "modified",
+        "a/b/new.txt": "created",
+        "d/file4.txt": "deleted",
+    }
+
+
+def test_entries_changed_unmodified(tmpdir, monkeypatch):
+    path, snapshot = str(entries_tree(tmpdir)), {}
+    assert len(list_changes(path, snapshot, modified=False)) == 18
+    listed = []
+    scandir = files.scandir
+    monkeypatch.setattr(
+        files,
+        "scandir",
+        lambda directory: listed.append(directory) or scandir(directory),
+    )
+    tmpdir.join("a", "file1.txt").write("changed content")
+    tmpdir.join("a", "b", "new.txt").write("content")
+    tmpdir.join("d", "skip", "file5.txt").remove()
+    assert list_changes(path, snapshot, modified=False) == {
+        "a/b/new.txt": "created",
+        "d/skip/file5.txt": "deleted",
+    }
+    # Only the directories where entries were created or deleted are listed again.
+    assert sorted(Path(directory).name for directory in listed) == ["b", "skip"]
+    assert list_changes(path, snapshot, modified=False) == {}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires inotify")
+def test_watch_entries(tmpdir):
+    path, thread_event = str(entries_tree(tmpdir)), threading.Event()
+    # The directories are watched when called, so every change below is listed.
+    changes = watch_entries(path, depth=-1, exclude=["d/*"], thread_event=thread_event)
+    tmpdir.join("a", "created.txt").write("content")
+    tmpdir.join("file0.txt").write("changed content")
+    tmpdir.join("a", "b", "file2.txt").remove()
+    tmpdir.join("d", "file4.txt").remove()
+    tmpdir.mkdir("new").join("file.txt").write("content")
+    thread_event.set()
+    results = {}
+    for change in changes:
+        results.setdefault(str(Path(change.path).relative_to(path)), []).append(
+            change.change
+        )
+
+    assert results == {
+        "a/created.txt": ["created", "modified"],
+        "file0.txt": ["modified"],
+        "a/b/file2.txt": ["deleted"],
+        "new": ["created"],
+        "new/file.txt": ["created"],
+    }
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires inotify")
+def test_watch_entries_stop(tmpdir):
+    path, thread_event = str(entries_tree(tmpdir)), threading.Event()
+    threading.Timer(0.2, thread_event.set).start()
+    assert list(watch_entries(path, thread_event=thread_event)) == []
+    with pytest.raises(FileNotFoundError):
+        watch_entries(str(tmpdir.join("missing")))
+
+
+@pytest.mark.parametrize("workers", [0, 1.5, True])
+def test_entries_workers_invalid(tmpdir, workers):
+    with pytest.raises(ValueError):
+        entries(str(tmpdir), workers=workers)
 
 
 @pytest.mark.parametrize(
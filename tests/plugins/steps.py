@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from threading import current_thread
+
+
+def produce(count):
+    for index in range(0, count):
+        yield index
+
+
+def meet(barrier):
+    barrier.wait(timeout=5)
+    return current_thread().name
+
+
+def combine(first, second):
+    return {"first": first, "second": second}
+
+
+def collect(first, **variables):
+    return {"first": first, "variables": sorted(variables.keys())}
+
+
+def produce_tracked(count, tracker):
+    for index in range(0, count):
+        tracker["produced"] += 1
+        yield index
+
+
+def double(numbers):
+    for number in numbers:
+        yield number * 2
+
+
+def consume(doubled, tracker):
+    total = 0
+    for number in doubled:
+        tracker["consumed"] += 1
+        tracker["lag"] = max(tracker["lag"], tracker["produced"] - tracker["consumed"])
+        total += number
+
+    return total
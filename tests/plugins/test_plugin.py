@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from asyncio import sleep as async_sleep
 from random import randint
+from threading import current_thread
+from time import sleep
 
 
 class TestPlugin:
@@ -22,3 +25,45 @@ class TestPlugin:
     def execute_plugin(self, thread_event):
         for _ in range(0, 10):
             yield self._add(randint(0, 10), randint(0, 10))
+
+
+class TestPluginCount:
+    def execute_plugin(self, thread_event, count):
+        for index in range(0, count):
+            if thread_event.is_set():
+                return
+
+            yield {"index": index}
+
+
+class TestPluginFail:
+    def execute_plugin(self, thread_event, count):
+        for index in range(0, count):
+            yield {"index": index}
+
+        raise RuntimeError("Plugin failed")
+
+
+class TestPluginWait:
+    def execute_plugin(self, thread_event):
+        index = 0
+        while not thread_event.is_set():
+            yield {"index": index}
+            index += 1
+            sleep(0.01)
+
+
+class TestPluginAsync:
+    async def execute_plugin(self, thread_event, count):
+        for index in range(0, count):
+            if thread_event.is_set():
+                return
+
+            await async_sleep(0)
+            yield {"index": index, "thread": current_thread().name}
+
+
+class TestPluginAsyncReturn:
+    async def execute_plugin(self, thread_event):
+        await async_sleep(0)
+        return {"index": 0, "thread": current_thread().name}
@@ -4,7 +4,18 @@
 from tests.fixtures.trident_daemon import *
 
 from pathlib import Path
-from json import load
+from json import load, loads
+from time import sleep
+from sqlite3 import connect
+from types import SimpleNamespace
+
+from trident.lib.daemon.data_storage import TridentDataDaemonConfig
+from trident.lib.runner.trident import TridentRunner
+from trident.lib.store.backend import (
+    STORE_BACKENDS,
+    TridentStoreJSONBackend,
+    compact_store,
+)
 
 
 def test_runner_store_sync(trident_daemon_sync):
@@ -84,3 +95,225 @@ def test_invalid_store_arguments_async(trident_daemon_invalid_argument_store_asy
         iter(trident_daemon_invalid_argument_store_async._future_runners.values())
     )
     assert runner.data_daemon.daemon_config.store_path is None
+
+
+def test_jsonl_store_appends_runs(trident_daemon_sync_jsonl):
+    trident_daemon_sync_jsonl.start_all_runners()
+    runner = next(iter(trident_daemon_sync_jsonl._future_runners.values()))
+    store_path = runner.data_daemon.daemon_config.store_path
+    assert store_path.suffix == ".jsonl"
+    with open(store_path, "r") as store_obj:
+        first_run = store_obj.read()
+
+    assert len(first_run.splitlines()) == 10
+    assert all(loads(line)["run"] == "0" for line in first_run.splitlines())
+
+    next_runner = TridentRunner(runner.runner_config, runner.runner_id)
+    assert next_runner.data_daemon.run_index == "1"
+    next_runner.start_runner()
+    next_runner.data_daemon.write_to_store()
+    with open(store_path, "r") as store_obj:
+        content = store_obj.read()
+
+    assert content.startswith(first_run)
+    assert len(content.splitlines()) == 20
+
+
+def test_jsonl_store_compaction(trident_daemon_async_global_jsonl):
+    trident_daemon_async_global_jsonl.start_all_runners()
+    runner = next(iter(trident_daemon_async_global_jsonl._future_runners.values()))
+    compacted_path = compact_store(runner.data_daemon.daemon_config.store_path)
+    assert compacted_path.suffix == ".json"
+    with open(compacted_path, "r") as store_obj:
+        store_data = load(store_obj)
+
+    assert len(store_data["runners"]) == 5
+    for results in store_data["runners"].values():
+        assert len(results["results"]["0"]) == 10
+
+
+def test_store_index_open(trident_daemon_sync, monkeypatch):
+    trident_daemon_sync.start_all_runners()
+    runner = next(iter(trident_daemon_sync._future_runners.values()))
+    store_path = runner.data_daemon.daemon_config.store_path
+    assert Path(f"{store_path}.index").exists()
+
+    def _read_store_data(self):
+        raise AssertionError("Store was parsed when opened")
+
+    with monkeypatch.context() as context:
+        context.setattr(TridentStoreJSONBackend, "_read_store_data", _read_store_data)
+        next_runner = TridentRunner(runner.runner_config, runner.runner_id)
+
+    assert next_runner.data_daemon.run_index == "1"
+    next_runner.start_runner()
+    next_runner.data_daemon.write_to_store()
+    with open(store_path, "r") as store_obj:
+        results = load(store_obj)["runners"][runner.runner_id]["results"]
+
+    assert set(results.keys()) == {"0", "1"}
+    assert next_runner.data_daemon.load_run_results("0") == results["0"]
+
+
+def test_jsonl_store_index_offsets(trident_daemon_async_global_jsonl):
+    trident_daemon_async_global_jsonl.start_all_runners()
+    runner = next(iter(trident_daemon_async_global_jsonl._future_runners.values()))
+    store_path = runner.data_daemon.daemon_config.store_path
+    with open(f"{store_path}.index", "r") as index_obj:
+        index_data = load(index_obj)
+
+    assert len(index_data["runners"]) == 5
+    assert all(
+        content["run_index"] == "0" and None not in content["runs"]["0"]
+        for content in index_data["runners"].values()
+    )
+
+    results = runner.data_daemon.load_run_results("0")
+    assert len(results) == 10
+    assert results == {
+        str(index): result
+        for index, result in runner.data_daemon.store_data["runners"][
+            runner.runner_id
+        ]["results"]["0"].items()
+    }
+
+    Path(f"{store_path}.index").unlink()
+    next_runner = TridentRunner(runner.runner_config, runner.runner_id)
+    assert next_runner.data_daemon.run_index == "1"
+    assert Path(f"{store_path}.index").exists()
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_flush",
+    [
+        ("json", {"results": 10}),
+        ("jsonl", {"results": 10}),
+        ("jsonl", {"bytes": 64}),
+        ("sqlite", {"results": 10}),
+    ],
+    indirect=["trident_daemon_sync_flush"],
+)
+def test_flush_policy(trident_daemon_sync_flush, caplog):
+    trident_daemon_sync_flush.start_all_runners()
+    backend = trident_daemon_sync_flush.runners[0].runner_config.store_config["backend"]
+    warned = any(
+        "rewrites the whole store" in record.message
+        for record in caplog.get_records("setup")
+    )
+    assert warned == (backend == "json")
+    runner = next(iter(trident_daemon_sync_flush._future_runners.values()))
+    if runner.data_daemon.store_backend is not None:
+        assert not runner.data_daemon.store_data["runners"][runner.runner_id][
+            "results"
+        ]["0"]
+
+    results = runner.data_daemon.load_run_results("0")
+    assert len(results) == 50
+    assert results["49"] == {"index": 49}
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_flush",
+    [("jsonl", {"interval": 0.01})],
+    indirect=["trident_daemon_sync_flush"],
+)
+def test_flush_policy_interval(trident_daemon_sync_flush):
+    runner = trident_daemon_sync_flush.runners[0]
+    runner.data_daemon.store_runner_result({0: "result"})
+    for _ in range(0, 100):
+        if runner.data_daemon.load_run_results("0"):
+            break
+
+        sleep(0.01)
+
+    assert runner.data_daemon.load_run_results("0") == {"0": "result"}
+
+
+def test_global_store_writer(trident_daemon_async_global):
+    trident_daemon_async_global.start_all_runners()
+    runner = next(iter(trident_daemon_async_global._future_runners.values()))
+    global_store = runner.data_daemon.daemon_config.store_path
+    assert list(trident_daemon_async_global._store_writers.keys()) == [global_store]
+    assert not trident_daemon_async_global._store_writers[global_store].is_alive()
+
+    with open(global_store, "r") as store_obj:
+        store_data = load(store_obj)
+
+    assert set(store_data["runners"].keys()) == {
+        runner.runner_id for runner in trident_daemon_async_global.runners
+    }
+    for results in store_data["runners"].values():
+        assert len(results["results"]["0"]) == 10
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_flush",
+    [("sqlite", None)],
+    indirect=["trident_daemon_sync_flush"],
+)
+def test_sqlite_store(trident_daemon_sync_flush):
+    trident_daemon_sync_flush.start_all_runners()
+    runner = next(iter(trident_daemon_sync_flush._future_runners.values()))
+    store_path = runner.data_daemon.daemon_config.store_path
+    assert store_path.suffix == ".sqlite"
+    with connect(store_path) as connection:
+        ((journal_mode,),) = connection.execute("PRAGMA journal_mode").fetchall()
+        assert journal_mode == "wal"
+        assert connection.execute("SELECT COUNT(*) FROM results").fetchone() == (50,)
+
+    next_runner = TridentRunner(runner.runner_config, runner.runner_id)
+    assert next_runner.data_daemon.run_index == "1"
+    next_runner.start_runner()
+    next_runner.data_daemon.write_to_store()
+    assert next_runner.data_daemon.load_run_results("1") == {
+        str(index): {"index": index} for index in range(0, 50)
+    }
+
+    with open(compact_store(store_path), "r") as store_obj:
+        results = load(store_obj)["runners"][runner.runner_id]["results"]
+
+    assert set(results.keys()) == {"0", "1"}
+
+
+@pytest.mark.parametrize("backend", ["json", "jsonl", "sqlite"])
+def test_store_backend_unserializable(backend, tmpdir):
+    store_backend = STORE_BACKENDS[backend](Path(tmpdir) / f"store{backend}")
+    store_backend.write_results(
+        {("good", "0"): {0: {"index": 0}}, ("bad", "0"): {0: {1, 2}, 1: "result"}}
+    )
+    assert store_backend.load_run("good", "0") == {"0": {"index": 0}}
+    assert store_backend.load_run("bad", "0") == {"1": "result"}
+    store_backend.close()
+
+
+@pytest.mark.parametrize(
+    "store_path,backend,expected",
+    [
+        ("global.json", "jsonl", "global.jsonl"),
+        ("global.jsonl", "sqlite", "global.sqlite"),
+        ("global.sqlite", "json", "global.json"),
+        (".", "jsonl", "t0.jsonl"),
+        ("store", "json", "store/t0.json"),
+    ],
+)
+def test_store_path_backend(store_path, backend, expected, tmpdir):
+    Path(tmpdir / "global.json").write_text('{"runners": {}}')
+    daemon_config = TridentDataDaemonConfig(
+        runner=SimpleNamespace(runner_id="t0"),
+        store_name="t0",
+        store_path=str(Path(tmpdir) / store_path),
+        store_backend=backend,
+    )
+    assert daemon_config.store_path == Path(tmpdir) / expected
+
+
+def test_store_path_backend_invalid(tmpdir):
+    Path(tmpdir / "notes.txt").write_text("notes")
+    with pytest.raises(ValueError):
+        TridentDataDaemonConfig(
+            runner=SimpleNamespace(runner_id="t0"),
+            store_name="t0",
+            store_path=str(Path(tmpdir) / "notes.txt"),
+            store_backend="sqlite",
+        )
+
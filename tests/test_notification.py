@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import json
+from threading import Event
+from time import perf_counter, sleep
+from types import SimpleNamespace
+from urllib.error import HTTPError
+
+from tests.fixtures.http_server import http_server
+from tests.fixtures.smtp_server import smtp_server
+from trident.lib.daemon.notification import (
+    TridentNotificationDaemon,
+    TridentNotificationDaemonConfig,
+)
+from trident.lib.notification.dispatcher import TridentNotificationDispatcher
+from trident.lib.notification.handler import (
+    TridentNotificationEmailHandler,
+    TridentNotificationEmailHandlerConfig,
+    TridentNotificationHTTPHandler,
+    TridentNotificationHTTPHandlerConfig,
+)
+
+
+class BlockingHandler:
+    def __init__(self, **notification_config):
+        self.notification_config = SimpleNamespace(name="test", **notification_config)
+        self.sent = []
+        self.started = Event()
+        self.release = Event()
+
+    def send_notification(self, content):
+        self.started.set()
+        self.release.wait()
+        self.sent.append(content)
+
+
+class FailingHandler:
+    def __init__(self, failures, **notification_config):
+        self.notification_config = SimpleNamespace(name="test", **notification_config)
+        self.failures = failures
+        self.attempts = 0
+        self.sent = []
+
+    def send_notification(self, content):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError("503 Service Unavailable")
+
+        self.sent.append(content)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = perf_counter() + timeout
+    while not condition() and perf_counter() < deadline:
+        sleep(0.01)
+
+    return condition()
+
+
+def submit_while_blocked(dispatcher, count):
+    dispatcher.submit({"index": 0})
+    dispatcher.handler.started.wait()
+    for index in range(1, count):
+        dispatcher.submit({"index": index})
+
+    dispatcher.handler.release.set()
+    dispatcher.flush()
+    return [content["index"] for content in dispatcher.handler.sent]
+
+
+def test_dispatcher_drop_oldest():
+    dispatcher = TridentNotificationDispatcher(
+        BlockingHandler(queue_size=2, backpressure="drop_oldest")
+    )
+    assert submit_while_blocked(dispatcher, 6) == [0, 4, 5]
+    assert dispatcher.dropped == 3
+
+
+def test_dispatcher_spill(tmpdir):
+    spill_path = tmpdir / "spill.jsonl"
+    dispatcher = TridentNotificationDispatcher(
+        BlockingHandler(queue_size=2, backpressure="spill", spill_path=spill_path)
+    )
+    assert submit_while_blocked(dispatcher, 6) == list(range(0, 6))
+    assert spill_path.read() == ""
+    workers = list(dispatcher._workers)
+    dispatcher.close()
+    assert workers and not any(worker.is_alive() for worker in workers)
+
+
+def test_dispatcher_spill_offset(tmpdir):
+    spill_path = tmpdir / "spill.jsonl"
+    dispatcher = TridentNotificationDispatcher(
+        BlockingHandler(queue_size=2, backpressure="spill", spill_path=spill_path)
+    )
+    for index in range(0, 5):
+        dispatcher._put_spill({"index": index})
+
+    dispatcher.notifications.get_nowait()
+    dispatcher._unspill()
+    # Only the read offset moves, the moved notification is still in the spill file.
+    assert len(spill_path.readlines()) == 3 and dispatcher._spilled == 2
+    dispatcher.close()
+    assert [json.loads(line) for line in spill_path.readlines()] == [
+        {"index": 3},
+        {"index": 4},
+    ]
+    assert TridentNotificationDispatcher(dispatcher.handler)._spilled == 2
+
+
+def test_dispatcher_block():
+    dispatcher = TridentNotificationDispatcher(
+        BlockingHandler(queue_size=1, workers=2)
+    )
+    dispatcher.handler.release.set()
+    for index in range(0, 20):
+        dispatcher.submit({"index": index})
+
+    dispatcher.flush()
+    assert sorted(content["index"] for content in dispatcher.handler.sent) == list(
+        range(0, 20)
+    )
+
+
+@pytest.mark.parametrize(
+    "notification_config",
+    [
+        {"backpressure": "drop_newest"},
+        {"backpressure": "spill"},
+        {"queue_size": 0},
+        {"workers": "2"},
+    ],
+)
+def test_dispatcher_invalid(notification_config):
+    with pytest.raises(ValueError):
+        TridentNotificationDispatcher(BlockingHandler(**notification_config))
+
+
+@pytest.mark.parametrize(
+    "batch,expected",
+    [
+        ({"max_items": 4, "max_delay": 0.5}, [4, 4, 2]),
+        ({"max_bytes": 36, "max_delay": 0.5}, [3, 3, 3, 1]),
+    ],
+)
+def test_dispatcher_batch(batch, expected):
+    dispatcher = TridentNotificationDispatcher(BlockingHandler(batch=batch))
+    dispatcher.handler.release.set()
+    for index in range(0, 10):
+        dispatcher.submit({"index": index})
+
+    dispatcher.flush()
+    assert [len(contents) for contents in dispatcher.handler.sent] == expected
+    assert [
+        content for contents in dispatcher.handler.sent for content in contents
+    ] == [{"index": index} for index in range(0, 10)]
+
+
+def test_outbox_retry(tmpdir):
+    outbox = {"path": str(tmpdir / "outbox.db"), "backoff": 0.01}
+    dispatcher = TridentNotificationDispatcher(FailingHandler(3, outbox=outbox))
+    for index in range(0, 2):
+        dispatcher.submit({"index": index})
+
+    dispatcher.flush()
+    assert wait_for(lambda: dispatcher.outbox.drained == 2)
+    dispatcher.close()
+    assert sorted(content["index"] for content in dispatcher.handler.sent) == [0, 1]
+    assert dispatcher.outbox.failed == 0
+    assert dispatcher.outbox.pending == 0
+
+
+def test_outbox_failed(tmpdir):
+    outbox = {"path": str(tmpdir / "outbox.db"), "backoff": 0.01, "max_attempts": 3}
+    dispatcher = TridentNotificationDispatcher(FailingHandler(10, outbox=outbox))
+    dispatcher.submit({"index": 0})
+    dispatcher.flush()
+    assert wait_for(lambda: dispatcher.outbox.failed == 1)
+    dispatcher.close()
+    assert dispatcher.handler.attempts == 3
+    assert dispatcher.outbox.pending == 0
+
+
+def test_outbox_replay(tmpdir):
+    outbox = {"path": str(tmpdir / "outbox.db"), "backoff": 60}
+    dispatcher = TridentNotificationDispatcher(FailingHandler(10, outbox=outbox))
+    dispatcher.submit({"index": 0})
+    dispatcher.flush()
+    dispatcher.close()
+    assert dispatcher.outbox.pending == 1
+
+    dispatcher = TridentNotificationDispatcher(FailingHandler(0, outbox=outbox))
+    assert wait_for(lambda: dispatcher.outbox.drained == 1)
+    dispatcher.close()
+    assert dispatcher.handler.sent == [{"index": 0}]
+    assert dispatcher.outbox.pending == 0
+
+
+class OtherFailingHandler(FailingHandler):
+    pass
+
+
+def test_outbox_shared(tmpdir):
+    outbox = {"path": str(tmpdir / "outbox.db"), "backoff": 60}
+    dispatchers = [
+        TridentNotificationDispatcher(FailingHandler(10, outbox=outbox)),
+        TridentNotificationDispatcher(OtherFailingHandler(10, outbox=outbox)),
+    ]
+    for index, dispatcher in enumerate(dispatchers):
+        dispatcher.submit({"index": index})
+        dispatcher.flush()
+        dispatcher.close()
+        assert dispatcher.outbox.pending == 1
+
+    dispatchers = [
+        TridentNotificationDispatcher(FailingHandler(0, outbox=outbox)),
+        TridentNotificationDispatcher(OtherFailingHandler(0, outbox=outbox)),
+    ]
+    for index, dispatcher in enumerate(dispatchers):
+        assert wait_for(lambda: dispatcher.outbox.drained == 1)
+        dispatcher.close()
+        assert dispatcher.handler.sent == [{"index": index}]
+        assert dispatcher.outbox.pending == 0
+
+
+@pytest.mark.parametrize(
+    "outbox",
+    [
+        {"backoff": 1},
+        {"path": "outbox.db", "max_attempts": 1},
+        {"path": "outbox.db", "backoff": 0},
+    ],
+)
+def test_outbox_invalid(outbox):
+    with pytest.raises(ValueError):
+        TridentNotificationDispatcher(FailingHandler(0, outbox=outbox))
+
+
+@pytest.mark.parametrize("batch", [{"max_items": 0}, {"max_delay": True}])
+def test_dispatcher_batch_invalid(batch):
+    with pytest.raises(ValueError):
+        TridentNotificationDispatcher(BlockingHandler(batch=batch))
+
+
+def http_handler(http_server, path="/", **configuration):
+    return TridentNotificationHTTPHandler(
+        TridentNotificationHTTPHandlerConfig(
+            name="test",
+            configuration={
+                "destination": http_server.url + path,
+                "method": "POST",
+                "include_result": True,
+                **configuration,
+            },
+        )
+    )
+
+
+def test_http_handler_batch(http_server):
+    handler = http_handler(http_server, payload={"source": "test"})
+    handler.send_notification([{"0": 0}, None, {"1": 1}])
+    handler.close()
+    assert json.loads(http_server.requests[0][2]) == {
+        "source": "test",
+        "content": [{"0": 0}, {"1": 1}],
+    }
+    assert handler.notification_config.payload == {"source": "test"}
+
+
+def test_http_handler_pool(http_server, record_property):
+    handler = http_handler(http_server, path="/notify?source=test")
+    start = perf_counter()
+    for index in range(0, 200):
+        handler.send_notification({"index": index})
+
+    record_property("requests_per_second", round(200 / (perf_counter() - start)))
+    handler.close()
+    assert http_server.connections == 1
+    assert len(http_server.requests) == 200
+    assert http_server.requests[-1] == (
+        "POST",
+        "/notify?source=test",
+        json.dumps({"index": 199}).encode(),
+    )
+
+
+def test_http_handler_reconnect(http_server):
+    handler = http_handler(http_server)
+    handler.send_notification({"index": 0})
+    http_server.drop_connections()
+    handler.send_notification({"index": 1})
+    handler.close()
+    assert http_server.connections == 2
+    assert len(http_server.requests) == 2
+
+
+def test_http_handler_error(http_server):
+    handler = http_handler(http_server, path="/error")
+    with pytest.raises(HTTPError):
+        handler.send_notification({"index": 0})
+
+    with pytest.raises(HTTPError):
+        handler.send_notification({"index": 1})
+
+    handler.close()
+    assert http_server.connections == 1
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    [
+        {"destination": "ftp://localhost"},
+        {"pool_size": 0},
+        {"idle_timeout": -1},
+    ],
+)
+def test_http_handler_invalid(configuration):
+    with pytest.raises(ValueError):
+        TridentNotificationHTTPHandlerConfig(
+            name="test",
+            configuration={
+                "destination": "http://localhost",
+                "method": "POST",
+                **configuration,
+            },
+        )
+
+
+def notification_daemon(http_server, **configuration):
+    return TridentNotificationDaemon(
+        TridentNotificationDaemonConfig(
+            SimpleNamespace(runner_id="test"),
+            {
+                "test": {
+                    "HTTP": {
+                        "destination": http_server.url,
+                        "method": "POST",
+                        "include_result": True,
+                        **configuration,
+                    }
+                }
+            },
+        )
+    )
+
+
+def test_notification_rate_limit(http_server):
+    daemon = notification_daemon(http_server, rate_limit={"rate": 0.1, "burst": 3})
+    for index in range(0, 10):
+        daemon.send_notification({"index": index})
+
+    daemon.flush()
+    daemon.close()
+    assert [json.loads(body) for _, _, body in http_server.requests] == [
+        {"index": index} for index in range(0, 3)
+    ]
+    assert daemon.limiters[0].rate_limited == 7
+
+
+def test_notification_dedup(http_server):
+    daemon = notification_daemon(http_server, dedup_window=0.2)
+    for index in range(0, 5):
+        daemon.send_notification({index: {"a": 0, "b": 1}})
+
+    daemon.send_notification({5: {"b": 1, "a": 0}, 6: "result", 7: "result"})
+    sleep(0.3)
+    daemon.send_notification({8: "result"})
+    daemon.flush()
+    daemon.close()
+    assert [json.loads(body) for _, _, body in http_server.requests] == [
+        {"0": {"a": 0, "b": 1}},
+        {"6": "result"},
+        {"8": "result"},
+    ]
+    assert daemon.limiters[0].deduplicated == 6
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    [
+        {"rate_limit": {"rate": 0}},
+        {"rate_limit": {"rate": 1, "burst": 0.5}},
+        {"dedup_window": 0},
+    ],
+)
+def test_notification_limit_invalid(http_server, configuration):
+    with pytest.raises(ValueError):
+        notification_daemon(http_server, **configuration)
+
+
+def email_handler(smtp_server, **configuration):
+    return TridentNotificationEmailHandler(
+        TridentNotificationEmailHandlerConfig(
+            name="test",
+            configuration={
+                "smtp_server": smtp_server.address,
+                "sender": "trident@localhost",
+                "receivers": ["first@localhost", "second@localhost"],
+                "message": "Results",
+                "include_result": True,
+                **configuration,
+            },
+        )
+    )
+
+
+def test_email_handler_pool(smtp_server, record_property):
+    handler = email_handler(smtp_server)
+    start = perf_counter()
+    for index in range(0, 200):
+        handler.send_notification({"index": index})
+
+    record_property("messages_per_second", round(200 / (perf_counter() - start)))
+    handler.close()
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 200
+    assert all(
+        receivers == ["first@localhost", "second@localhost"]
+        for receivers, _ in smtp_server.messages
+    )
+
+
+def test_email_handler_reconnect(smtp_server):
+    handler = email_handler(smtp_server)
+    handler.send_notification({"index": 0})
+    smtp_server.drop_connections()
+    handler.send_notification({"index": 1})
+    assert smtp_server.connections == 2
+    assert len(smtp_server.messages) == 2
+
+
+def test_email_handler_idle_timeout(smtp_server):
+    handler = email_handler(smtp_server, idle_timeout=0.01)
+    handler.send_notification({"index": 0})
+    sleep(0.05)
+    handler.send_notification({"index": 1})
+    assert smtp_server.connections == 2
+    assert len(smtp_server.messages) == 2
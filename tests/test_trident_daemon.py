@@ -3,6 +3,10 @@
 
 from tests.fixtures.trident_daemon import *
 
+from datetime import datetime
+from threading import Timer
+
+from trident.lib.daemon.schedule import TridentSchedule
 from trident.lib.runner.trident import TridentRunner
 
 
@@ -48,3 +52,67 @@ def test_run_plugin_async(trident_daemon_async):
             )
             == 10
         )
+
+
+def test_scheduler(trident_daemon_scheduler):
+    scheduled, once = trident_daemon_scheduler.runners
+    plugin_instance = scheduled.runner_config.plugin_instance
+    stop = Timer(1, trident_daemon_scheduler.stop_scheduler)
+    stop.start()
+    trident_daemon_scheduler.start_scheduler()
+    stop.join()
+    assert scheduled.runner_config.plugin_instance is plugin_instance
+    assert int(scheduled.data_daemon.run_index) >= 3
+    for run_index in range(0, int(scheduled.data_daemon.run_index) + 1):
+        results = scheduled.data_daemon.load_run_results(str(run_index))
+        assert results == {str(index): {"index": index} for index in range(0, 5)}
+
+    assert once.data_daemon.run_index == "0"
+    assert len(once.data_daemon.load_run_results("0")) == 3
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_scheduler",
+    [
+        {"name": "TestPluginFail", "dont_store_on_error": dont_store_on_error}
+        for dont_store_on_error in [False, True]
+    ],
+    indirect=True,
+)
+def test_scheduler_failed_run(trident_daemon_scheduler):
+    failing = trident_daemon_scheduler.runners[0]
+    dont_store_on_error = failing.runner_config.dont_store_on_error
+    stop = Timer(1, trident_daemon_scheduler.stop_scheduler)
+    stop.start()
+    trident_daemon_scheduler.start_scheduler()
+    stop.join()
+    assert int(failing.data_daemon.run_index) >= 3
+    # Every failed run is finished in the store before the next run is started.
+    for run_index in range(0, int(failing.data_daemon.run_index) + 1):
+        results = failing.data_daemon.load_run_results(str(run_index))
+        if dont_store_on_error:
+            assert results == {}
+        else:
+            assert results == {str(index): {"index": index} for index in range(0, 5)}
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [{}, {"interval": 0}, {"interval": 1, "cron": "* * * * *"}, {"cron": "0 0 30 2"}],
+)
+def test_schedule_invalid(schedule):
+    with pytest.raises(ValueError):
+        TridentSchedule(schedule)
+
+
+@pytest.mark.parametrize(
+    "cron,after,expected",
+    [
+        ("*/15 9-17 * * 1-5", datetime(2026, 10, 17, 12), datetime(2026, 10, 19, 9)),
+        ("0 0 29 2 *", datetime(2026, 10, 17), datetime(2028, 2, 29)),
+        ("30 4 1,15 * 5", datetime(2026, 10, 17), datetime(2026, 10, 23, 4, 30)),
+        ("5 * * * 0", datetime(2026, 10, 18, 23, 5), datetime(2026, 10, 25, 0, 5)),
+    ],
+)
+def test_schedule_cron(cron, after, expected):
+    assert TridentSchedule({"cron": cron}).next_run(after) == expected
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from tests.fixtures.trident_daemon import *
+
+from threading import Barrier, Timer
+
+from tests.plugins.test_plugin import TestPluginWait
+from trident.lib.runner.filter import TridentResultFilter
+from trident.lib.runner.registry import TridentCallPlan, TridentPluginRegistry
+from trident.lib.runner.trident import (
+    TridentStepsRunnerConfig,
+    _TridentDefaultRunnerConfig,
+)
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_runner", [{"batch_size": 8}], indirect=True
+)
+def test_batch_size(trident_daemon_sync_runner, monkeypatch):
+    runner = trident_daemon_sync_runner.runners[0]
+    notifications = []
+    monkeypatch.setattr(
+        runner.notification_daemon,
+        "send_notification",
+        lambda content: notifications.append(content),
+    )
+    trident_daemon_sync_runner.start_all_runners()
+    results = runner.data_daemon.store_data["runners"][runner.runner_id]["results"]
+    assert results["0"] == {index: {"index": index} for index in range(0, 50)}
+    assert [len(content) for content in notifications] == [8] * 6 + [2]
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 1.5])
+def test_batch_size_invalid(batch_size):
+    with pytest.raises(ValueError):
+        _TridentDefaultRunnerConfig()._apply_runner_config({"batch_size": batch_size})
+
+
+@pytest.mark.parametrize(
+    "patterns,mode,result,expected",
+    [
+        (["abc", "x[0-9]"], "match", "abcd", True),
+        (["abc", "x[0-9]"], "match", "x1", True),
+        (["abc", "x[0-9]"], "match", "dabc", False),
+        (["abc", "x[0-9]"], "search", "dabc", True),
+        (["abc", "x[0-9]"], "fullmatch", "abcd", False),
+        (["abc", "x[0-9]"], "fullmatch", "x1", True),
+        (["a*", "b"], "match", "b", True),
+        (["(a)\\1", "b"], "match", "aa", True),
+        (["(?P<x>a)", "(?P<x>b)"], "match", "b", True),
+        (["", "[0-9]"], "match", 10, True),
+        ([""], "match", "a", False),
+    ],
+)
+def test_result_filter(patterns, mode, result, expected):
+    assert TridentResultFilter(patterns, mode).match(result) is expected
+
+
+def test_result_filter_invalid_mode():
+    with pytest.raises(ValueError):
+        TridentResultFilter(["a"], "find")
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_runner",
+    [{"filter_results": ["x", "\\{'index': 4\\d\\}"], "filter_mode": "fullmatch"}],
+    indirect=True,
+)
+def test_filter_results(trident_daemon_sync_runner):
+    trident_daemon_sync_runner.start_all_runners()
+    runner = trident_daemon_sync_runner.runners[0]
+    results = runner.data_daemon.store_data["runners"][runner.runner_id]["results"]
+    assert list(results["0"].keys()) == list(range(40, 50))
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_runner",
+    [{"executor": "process", "batch_size": 8}],
+    indirect=True,
+)
+def test_process_executor(trident_daemon_sync_runner):
+    trident_daemon_sync_runner.start_all_runners()
+    runner = trident_daemon_sync_runner.runners[0]
+    assert runner.process_executor is None
+    results = runner.data_daemon.store_data["runners"][runner.runner_id]["results"]
+    assert results["0"] == {index: {"index": index} for index in range(0, 50)}
+    assert runner.data_daemon.load_run_results("0")["49"] == {"index": 49}
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_sync_runner", [{"executor": "process"}], indirect=True
+)
+def test_process_executor_stop(trident_daemon_sync_runner):
+    runner = trident_daemon_sync_runner.runners[0]
+    runner.runner_config.plugin_name = "TestPluginWait"
+    runner.runner_config.plugin_args = {}
+    runner.runner_config.plugin_instance = TestPluginWait()
+    stop = Timer(2, runner.runner_config.thread_event.set)
+    stop.start()
+    trident_daemon_sync_runner.start_all_runners()
+    stop.join()
+    assert trident_daemon_sync_runner._process_executor is None
+
+
+def test_async_runners(trident_daemon_async_runners):
+    trident_daemon_async_runners.start_all_runners()
+    assert trident_daemon_async_runners._event_loop is None
+    for runner in trident_daemon_async_runners.runners:
+        assert runner.is_async
+        results = runner.data_daemon.store_data["runners"][runner.runner_id]["results"]
+        count = 1 if runner.runner_id == "test0" else 10
+        assert sorted(results["0"].keys()) == list(range(0, count))
+        assert {result["thread"] for result in results["0"].values()} == {
+            "TridentEventLoop"
+        }
+
+
+def test_plugin_registry(trident_daemon_async_runners):
+    registry = trident_daemon_async_runners._plugin_registry
+    runners = trident_daemon_async_runners.runners
+    assert all(runner.runner_config.plugin_registry is registry for runner in runners)
+    plugin_class = registry.resolve("tests.plugins.test_plugin", "TestPluginAsync")
+    instances = [runner.runner_config.plugin_instance for runner in runners[1:]]
+    assert all(type(instance) is plugin_class for instance in instances)
+    assert len({id(instance) for instance in instances}) == len(instances)
+    assert registry.call_plan(instances[0].execute_plugin) is registry.call_plan(
+        instances[1].execute_plugin
+    )
+
+
+def test_plugin_registry_missing():
+    with pytest.raises(ValueError):
+        TridentPluginRegistry().resolve("tests.plugins.test_plugin", "TestPluginMissing")
+
+
+def test_call_plan():
+    def method(first, /, second, *args, thread_event=None):
+        pass
+
+    def method_kwargs(first, **kwargs):
+        pass
+
+    call_plan = TridentCallPlan(method)
+    assert call_plan.parameters == {"second", "thread_event"}
+    assert call_plan.thread_event
+    assert call_plan.arguments({"first": 1, "second": 2, "third": 3}) == {"second": 2}
+    call_plan = TridentCallPlan(method_kwargs)
+    assert not call_plan.thread_event and not call_plan.accepts("third")
+    assert call_plan.arguments({"first": 1, "third": 3}) == {"first": 1}
+
+
+def step(name, ref, out=None, stream=False, **args):
+    instruction = {"ref": f"tests.plugins.steps.{ref}", "type": "method", "args": args}
+    if out is not None:
+        instruction["out"] = {"name": out, "all": True}
+
+    if stream:
+        instruction["out"] = {"name": out, "stream": True, "buffer_size": 2}
+
+    return {"name": name, "instruction": instruction}
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_steps",
+    [
+        {
+            "workers": 2,
+            "plugin_args": {"barrier": Barrier(2)},
+            "runner": {"parallel_steps": True},
+            "steps": [
+                step("first", "meet", out="first"),
+                step("second", "meet", out="second"),
+                step("combine", "combine", out="result"),
+            ],
+        }
+    ],
+    indirect=True,
+)
+def test_parallel_steps(trident_daemon_steps):
+    trident_daemon_steps.start_all_runners()
+    runner = trident_daemon_steps.runners[0]
+    assert runner.runner_config.step_dependencies == [set(), set(), {0, 1}]
+    result = runner.variables["result"]
+    assert result["first"] != result["second"]
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_steps",
+    [
+        {
+            "workers": 1,
+            "runner": {"parallel_steps": parallel_steps},
+            "steps": [
+                step("first", "produce", out="first", count=2),
+                step("second", "produce", out="second", count=3),
+                step("ignored", "produce", count=1),
+                step("combine", "combine", out="result"),
+                step("collect", "collect", out="collected"),
+            ],
+        }
+        for parallel_steps in [False, True]
+    ],
+    indirect=True,
+)
+def test_steps_single_worker(trident_daemon_steps):
+    trident_daemon_steps.start_all_runners()
+    variables = trident_daemon_steps.runners[0].variables
+    assert variables["result"] == {"first": [0, 1], "second": [0, 1, 2]}
+    # Only the named parameters are passed, never the other variables through `**kwargs`.
+    assert variables["collected"] == {"first": [0, 1], "variables": []}
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_steps",
+    [
+        {
+            "workers": 1,
+            "steps": [
+                {
+                    "name": "count",
+                    "instruction": {
+                        "ref": "tests.plugins.test_plugin",
+                        "name": "TestPluginCount",
+                        "type": "plugin",
+                        "args": {"count": 2},
+                        "out": {"name": "numbers", "all": True},
+                    },
+                }
+            ],
+        }
+    ],
+    indirect=True,
+)
+def test_plugin_step_reused(trident_daemon_steps):
+    runner = trident_daemon_steps.runners[0]
+    step_config = runner.runner_config.plugin_steps[0]
+    plugin_instance = step_config.runner_config.plugin_instance
+    assert step_config.runner_config.thread_event is runner.runner_config.thread_event
+    for _ in range(0, 2):
+        runner.start_runner()
+        assert step_config.runner_config.plugin_instance is plugin_instance
+        assert runner.variables["numbers"] == [{"index": 0}, {"index": 1}]
+
+
+def steps_runner_config(steps):
+    return TridentStepsRunnerConfig(
+        plugin_name="TestSteps",
+        plugin_args={},
+        plugin_steps=steps,
+        store_config={},
+        checkpoint_config={},
+        runner_config={"parallel_steps": True},
+        notification_config={},
+        store_writers={},
+    )
+
+
+def test_step_dependencies():
+    runner_config = steps_runner_config(
+        [
+            step("produce", "produce", out="first", count=1),
+            step("combine", "combine", out="second"),
+            step("overwrite", "produce", out="first", count=1),
+            {**step("last", "produce", count=1), "depends_on": ["produce"]},
+            step("collect", "collect", out="collected"),
+        ]
+    )
+    assert runner_config.step_dependencies == [set(), {0}, {0, 1}, {0}, {0, 2}]
+
+
+@pytest.mark.parametrize(
+    "depends_on", [[["second"], ["first"]], [["third"], []], [[], "first"]]
+)
+def test_step_dependencies_invalid(depends_on):
+    with pytest.raises(ValueError):
+        steps_runner_config(
+            [
+                {**step(name, "produce", count=1), "depends_on": _depends_on}
+                for name, _depends_on in zip(["first", "second"], depends_on)
+            ]
+        )
+
+
+@pytest.mark.parametrize(
+    "trident_daemon_steps",
+    [
+        {
+            "workers": 1,
+            "plugin_args": {"tracker": {"produced": 0, "consumed": 0, "lag": 0}},
+            "runner": {"parallel_steps": parallel_steps},
+            "steps": [
+                step(
+                    "produce", "produce_tracked", out="numbers", stream=True, count=200
+                ),
+                step("double", "double", out="doubled", stream=True),
+                step("consume", "consume", out="total"),
+            ],
+        }
+        for parallel_steps in [False, True]
+    ],
+    indirect=True,
+)
+def test_stream_steps(trident_daemon_steps):
+    trident_daemon_steps.start_all_runners()
+    runner = trident_daemon_steps.runners[0]
+    tracker = runner.runner_config.plugin_args["tracker"]
+    assert runner.variables["total"] == sum(range(0, 200)) * 2
+    assert tracker["consumed"] == 200
+    # The producer is never further ahead than the buffers and the results in flight.
+    assert tracker["lag"] <= 8
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [
+            {
+                "name": "produce",
+                "instruction": {
+                    "ref": "tests.plugins.steps.produce",
+                    "type": "method",
+                    "out": {"name": "first", "stream": True, "all": True},
+                },
+            }
+        ],
+        [
+            step("produce", "produce", out="first", stream=True, count=1),
+            step("combine", "combine", out="result"),
+            step("combine_again", "combine", out="again"),
+        ],
+    ],
+)
+def test_stream_steps_invalid(steps):
+    with pytest.raises(ValueError):
+        steps_runner_config(steps)
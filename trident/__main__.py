@@ -20,6 +20,7 @@ Namespace = NewType("Namespace", None)
 
 from trident.lib.parser.arguments import TridentArgumentParser
 from trident.lib.parser.config import TridentConfigParser
+from trident.lib.store.backend import compact_store
 from trident import TridentConfig, Trident
 from trident import LOGGER_CONFIG
 
@@ -270,12 +271,15 @@ def apply_runtime_arguments(
             "store": {
                 k: v
                 for k, v in vars(args).items()
-                if k in ["no_store", "global_store", "path_store"] and v is not None
+                if k in ["no_store", "global_store", "path_store", "backend"]
+                and v is not None
             },
             "runner": {
                 k: v
                 for k, v in vars(args).items()
-                if k in ["dont_store_on_error", "filter_results"] and v is not None
+                if k
+                in ["dont_store_on_error", "filter_results", "filter_mode", "batch_size"]
+                and v is not None
             },
             "checkpoint": {
                 k: v
@@ -290,7 +294,7 @@ def apply_runtime_arguments(
             "daemon": {
                 k: v
                 for k, v in vars(args).items()
-                if k in ["workers"] and v is not None
+                if k in ["workers", "executor", "scheduler"] and v is not None
             }
         },
         config,
@@ -305,6 +309,15 @@ if __name__ == "__main__":
         logger.fatal(f"Trident argument parser failed with unrecoverable error: {e}")
         exit(1)
 
+    if trident_argument_parser.args.compact_store is not None:
+        try:
+            compact_store(trident_argument_parser.args.compact_store)
+        except Exception as e:
+            logger.fatal(f"Trident failed to compact store with error: {e}")
+            exit(1)
+
+        exit(0)
+
     try:
         trident_config_parser = TridentConfigParser(
             config_file_path=trident_argument_parser.args.config,
@@ -8,11 +8,13 @@ Trident daemon handling the data collected by all runners under a Trident daemon
 """
 
 import json
-from os import path
 from pathlib import Path
 from dataclasses import dataclass
+from queue import Queue, Empty
+from threading import Lock, Thread
+from time import monotonic
 
-from typing import Dict, NewType, Any, NoReturn, AnyStr, Optional, Union
+from typing import Dict, NewType, Any, List, NoReturn, AnyStr, Optional, Tuple, Union
 
 TridentRunner = NewType("TridentRunner", None)
 
@@ -20,6 +22,226 @@ import logging
 
 logger = logging.getLogger("__main__")
 
+from trident.lib.store.backend import STORE_BACKENDS
+
+
+@dataclass
+class TridentDataFlushPolicy:
+    """Policy controlling when the results buffered by :class:`TridentDataDaemon` are flushed to the store.
+    The results are flushed when any of the given limits is reached, limits that are not set are ignored.
+
+    :param results: Flush when this many results are buffered.
+    :type results: Optional[int]
+    :param interval: Flush when this many seconds have passed since the last flush.
+    :type interval: Optional[float]
+    :param bytes: Flush when the buffered results exceed this many bytes when serialized.
+    :type bytes: Optional[int]
+    """
+
+    results: Optional[int]
+    interval: Optional[float]
+    bytes: Optional[int]
+
+    def __init__(self, flush_policy: Dict[AnyStr, Any]):
+        for limit in ["results", "interval", "bytes"]:
+            value = flush_policy.get(limit)
+            if value is not None and (
+                not isinstance(value, (int, float)) or value <= 0
+            ):
+                raise ValueError(
+                    f"Invalid flush limit: '{limit}' with value: '{value}', value must be greater than 0"
+                )
+
+            setattr(self, limit, value)
+
+        if self.results is None and self.interval is None and self.bytes is None:
+            raise ValueError(
+                "No flush limit was defined, expected any of 'results', 'interval' or 'bytes'"
+            )
+
+
+class TridentStoreWriter(Thread):
+    """Single background thread writing all results for a store on the disk.
+    Every :class:`TridentDataDaemon` using the same store submits its batches of results to the same writer,
+    the writer coalesces all batches queued at the time of a write so that the store is only read and rewritten
+    once for JSON stores, or appended to once per run for append-only stores, regardless of the amount of runners.
+    The writer also flushes the registered data daemons that have a flush interval.
+    The writes are done through the :class:`TridentStoreBackend` of the store.
+
+    :param store_path: The path to the store on the disk.
+    :type store_path: :class:`pathlib.Path`
+    :param store_backend: The format of the store on the disk.
+    :type store_backend: str
+    """
+
+    _registry_lock: Lock = Lock()
+
+    def __init__(self, store_path: Path, store_backend: str):
+        super().__init__(name=f"TridentStoreWriter-{Path(store_path).name}", daemon=True)
+        self.store_path = Path(store_path)
+        self.store_backend = STORE_BACKENDS[store_backend](self.store_path)
+
+        self.batches = Queue()
+        self.data_daemons = set()
+        self._data_daemons_lock = Lock()
+
+    @classmethod
+    def for_store(
+        cls,
+        store_writers: Dict[Path, "TridentStoreWriter"],
+        store_path: Path,
+        store_backend: str,
+    ) -> "TridentStoreWriter":
+        """Get the running writer for the given store from the writers shared between the runners, starting a new writer if there is none.
+
+        :param store_writers: The writers shared between the runners by store path.
+        :type store_writers: Dict[:class:`pathlib.Path`, :class:`TridentStoreWriter`]
+        :param store_path: The path to the store on the disk.
+        :type store_path: :class:`pathlib.Path`
+        :param store_backend: The format of the store on the disk.
+        :type store_backend: str
+        :return: The writer for the store.
+        :rtype: :class:`TridentStoreWriter`
+        """
+        with cls._registry_lock:
+            writer = store_writers.get(store_path)
+            if writer is None or not writer.is_alive():
+                writer = cls(store_path, store_backend)
+                writer.start()
+                store_writers[store_path] = writer
+
+            return writer
+
+    def submit(
+        self,
+        runner_id: AnyStr,
+        run_index: AnyStr,
+        batch: Dict[int, Any],
+        finished: bool = False,
+    ) -> NoReturn:
+        """Queue a batch of results to be written to the store.
+
+        :param runner_id: The runner that produced the results.
+        :type runner_id: str
+        :param run_index: The run that the results belong to.
+        :type run_index: str
+        :param batch: The results to write in the form of {[INDEX]: ...}
+        :type batch: Dict[int, Any]
+        :param finished: If this is the last batch of the run.
+        :type finished: bool
+        """
+        self.batches.put((runner_id, run_index, batch, finished))
+
+    def drain(self) -> NoReturn:
+        """Block until every queued batch has been written to the store."""
+        self.batches.join()
+
+    def stop(self) -> NoReturn:
+        """Write every queued batch to the store and stop the writer."""
+        self.batches.put(None)
+        self.join()
+
+    def register(self, data_daemon: "TridentDataDaemon") -> NoReturn:
+        """Register a data daemon to be flushed by the writer according to the interval of its flush policy.
+
+        :param data_daemon: The data daemon to flush.
+        :type data_daemon: :class:`TridentDataDaemon`
+        """
+        with self._data_daemons_lock:
+            self.data_daemons.add(data_daemon)
+
+        # Wake up the writer to pick up the interval of the new data daemon.
+        self.batches.put((None, None, {}, False))
+
+    def unregister(self, data_daemon: "TridentDataDaemon") -> NoReturn:
+        """Stop flushing a data daemon registered by :meth:`register`.
+
+        :param data_daemon: The data daemon to stop flushing.
+        :type data_daemon: :class:`TridentDataDaemon`
+        """
+        with self._data_daemons_lock:
+            self.data_daemons.discard(data_daemon)
+
+    def run(self) -> NoReturn:
+        while True:
+            try:
+                items = [self.batches.get(timeout=self._flush_interval())]
+            except Empty:
+                self._flush_on_interval()
+                continue
+
+            # Coalesce every batch queued while the previous write was in progress into a single write.
+            try:
+                while True:
+                    items.append(self.batches.get_nowait())
+            except Empty:
+                pass
+
+            try:
+                self._write(
+                    [item for item in items if item is not None and item[0] is not None]
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to write ({len(items)}) batches to store: '{self.store_path}'",
+                    exc_info=e,
+                )
+            finally:
+                for _ in items:
+                    self.batches.task_done()
+
+            if None in items:
+                self.store_backend.close()
+                return
+
+            self._flush_on_interval()
+
+    def _flush_interval(self) -> Optional[float]:
+        """Get the shortest flush interval of the registered data daemons.
+
+        :return: The interval in seconds, `None` if no registered data daemon has an interval.
+        :rtype: Optional[float]
+        """
+        with self._data_daemons_lock:
+            return min(
+                (
+                    data_daemon.daemon_config.flush_policy.interval
+                    for data_daemon in self.data_daemons
+                ),
+                default=None,
+            )
+
+    def _flush_on_interval(self) -> NoReturn:
+        """Flush the registered data daemons that have passed their flush interval."""
+        with self._data_daemons_lock:
+            data_daemons = list(self.data_daemons)
+
+        for data_daemon in data_daemons:
+            data_daemon._flush_on_interval()
+
+    def _write(
+        self, items: List[Tuple[AnyStr, AnyStr, Dict[int, Any], bool]]
+    ) -> NoReturn:
+        """Write the coalesced batches to the store in the order that they were submitted.
+
+        :param items: The queued batches in the form of (runner, run, results, finished).
+        :type items: List[Tuple[str, str, Dict[int, Any], bool]]
+        """
+        runs, finished = {}, []
+        for runner_id, run_index, batch, _finished in items:
+            runs.setdefault((runner_id, run_index), {}).update(batch)
+            if _finished:
+                finished.append((runner_id, run_index))
+
+        if not runs:
+            return
+
+        self.store_backend.write_results(runs)
+        for runner_id, run_index in finished:
+            self.store_backend.finish_run(runner_id, run_index)
+
+        self.store_path.touch(exist_ok=True)
+
 
 @dataclass
 class TridentDataDaemonConfig:
@@ -31,11 +253,20 @@ class TridentDataDaemonConfig:
     :type store_path: str
     :param store_name: Name of the store on the disk if the store path does not include file, default behavior is using the id of the runner :class:`TridentRunner`.
     :type store_name: str
+    :param store_backend: The format of the store on the disk, either `json` (default), the append-only `jsonl` or `sqlite`.
+    :type store_backend: str
+    :param flush_policy: The limits for flushing buffered results to the store while the runner is running, if not set the results are written when the runner finishes. Only the incremental `jsonl` and `sqlite` backends write just the flushed results, the `json` backend rewrites the whole store on every flush.
+    :type flush_policy: Optional[dict]
+    :param store_writers: The writers shared between the runners by store path, runners using the same store share the same :class:`TridentStoreWriter`.
+    :type store_writers: Optional[Dict[:class:`pathlib.Path`, :class:`TridentStoreWriter`]]
     """
 
     runner: TridentRunner
     store_path: Path
     store_name: str
+    store_backend: str
+    flush_policy: Optional[TridentDataFlushPolicy]
+    store_writers: Dict[Path, TridentStoreWriter]
     checkpoint_path: Optional[Path]
 
     def __init__(
@@ -44,9 +275,29 @@ class TridentDataDaemonConfig:
         store_name: str,
         store_path: str,
         checkpoint_path: Optional[str] = None,
+        store_backend: str = "json",
+        flush_policy: Optional[Dict[AnyStr, Any]] = None,
+        store_writers: Optional[Dict[Path, TridentStoreWriter]] = None,
     ):
         self.runner = runner
         self.store_name = store_name
+        self.flush_policy = (
+            TridentDataFlushPolicy(flush_policy) if flush_policy else None
+        )
+        self.store_writers = store_writers if store_writers is not None else {}
+
+        if store_backend not in STORE_BACKENDS:
+            raise ValueError(
+                f"Unsupported store backend: '{store_backend}' for runner: '{self.runner.runner_id}'"
+            )
+        self.store_backend = store_backend
+        if (
+            self.flush_policy is not None
+            and not STORE_BACKENDS[store_backend].incremental
+        ):
+            logger.warning(
+                f"Flushing results to a '{store_backend}' store rewrites the whole store on every flush for runner: '{self.runner.runner_id}', use the 'jsonl' or 'sqlite' backend to flush incrementally"
+            )
 
         if store_path is not None:
             self.store_path = self._determine_store_path(store_path)
@@ -62,32 +313,48 @@ class TridentDataDaemonConfig:
 
     def _determine_store_path(self, store_path: str) -> Path:
         """Verifies that the store path is a valid path that exists and is normalizable, returns the normalized path if valid.
-        Raises `FileNotFoundError` if the normalized store path does not exist.
+        Raises `FileNotFoundError` if the normalized store path does not exist. A path to a directory is given the store named
+        after the runner, while a path to a store file keeps its name with the suffix of the store backend, so `global.json`
+        is stored as `global.jsonl` by the `jsonl` backend.
 
         :param store_path: The store path to verify and normalize.
         :type store_path: str
         :raises FileNotFoundError: The store path does not exist on the system.
+        :raises ValueError: The store path is an existing file that is not a store and the backend is not `json`.
         :return: The :class:`pathlib.Path` object of the store on the system.
         :rtype: :class:`pathlib.Path`
         """
         store_path_n = self._normalize_store_path(store_path)
+        suffix = STORE_BACKENDS[self.store_backend].suffix
+        store_suffixes = {backend.suffix for backend in STORE_BACKENDS.values()}
+        if not store_path_n.is_dir() and not store_path_n.parent.exists():
+            raise FileNotFoundError(
+                f"Store path: '{store_path_n}' does not exist for runner: '{self.runner.runner_id}'"
+            )
+
+        if store_path_n.suffix in store_suffixes and not store_path_n.is_dir():
+            if store_path_n.suffix != suffix:
+                logger.info(
+                    f"Using store path: '{store_path_n.with_suffix(suffix)}' instead of: '{store_path_n}' for the '{self.store_backend}' store of runner: '{self.runner.runner_id}'"
+                )
+
+            return store_path_n.with_suffix(suffix)
+
         if store_path_n.is_file():
+            if self.store_backend != "json":
+                raise ValueError(
+                    f"Store path: '{store_path_n}' is not a '{self.store_backend}' store for runner: '{self.runner.runner_id}', expected a directory or a file ending with: '{suffix}'"
+                )
+
             logger.debug(
                 f"Using existing store path: '{store_path_n}' for runner: '{self.runner.runner_id}'"
             )
             return store_path_n
-        elif store_path_n.is_dir() or store_path_n.parent.exists():
-            logger.debug(
-                f"Creating store in path: '{store_path_n}' for runner: '{self.runner.runner_id}'"
-            )
-            if store_path_n.suffix == ".json":
-                return store_path_n
 
-            return self._normalize_store_path(f"{store_path}/{self.store_name}.json")
-        else:
-            raise FileNotFoundError(
-                f"Store path: '{store_path_n}' does not exist for runner: '{self.runner.runner_id}'"
-            )
+        logger.debug(
+            f"Creating store in path: '{store_path_n}' for runner: '{self.runner.runner_id}'"
+        )
+        return self._normalize_store_path(f"{store_path}/{self.store_name}{suffix}")
 
     def _determine_checkpoint_path(
         self, checkpoint_path: Union[str, None], store_path: str
@@ -152,20 +419,49 @@ class TridentDataDaemon:
 
     def __init__(self, daemon_config: TridentDataDaemonConfig):
         self.daemon_config = daemon_config
+        self.store_backend = None
 
-        if self.daemon_config.store_path is not None:
-            self.store_data = self._initialize_store()
-            self.run_index = self._get_run_index()
-        else:
+        self._buffer, self._buffer_bytes = {}, 0
+        self._buffer_lock = Lock()
+        self._last_flush = monotonic()
+
+        if self.daemon_config.store_path is None:
             self.store_data, self.run_index = None, 0
+        else:
+            # Only the results of the current run are kept in memory, the existing results are left in the store.
+            self.store_backend = STORE_BACKENDS[self.daemon_config.store_backend](
+                self.daemon_config.store_path
+            )
+            self.store_data = {
+                "runners": {self.daemon_config.runner.runner_id: {"results": {}}}
+            }
+            self.run_index = self._get_run_index()
+
+        self._register_flush_interval()
 
         logger.debug(
             f"Trident data daemon initialized for runner: '{self.daemon_config.runner.runner_id}'"
         )
 
+    @property
+    def store_writer(self) -> TridentStoreWriter:
+        """Get the writer for the store of this daemon, shared with all runners using the same store.
+
+        :return: The running writer for the store.
+        :rtype: :class:`TridentStoreWriter`
+        """
+        return TridentStoreWriter.for_store(
+            self.daemon_config.store_writers,
+            self.daemon_config.store_path,
+            self.daemon_config.store_backend,
+        )
+
     def store_runner_result(self, result: Dict) -> NoReturn:
         """Store the results given in the initialized store. This updates the store in the program and does not
-        write the store to the disk.
+        write the store to the disk, unless an incremental store backend is used in which case each result is
+        handed to the store writer as it arrives.
+        If a flush policy is set then the results are instead buffered and flushed to the store in the background
+        when any limit of the policy is reached.
 
         :param result: The result to update the store with in the form of a dictionary.
         :type result: dict
@@ -181,6 +477,15 @@ class TridentDataDaemon:
                 else:
                     _result[key] = value
 
+            if self.daemon_config.flush_policy is not None:
+                self._buffer_results(_result)
+                return
+
+            if self.store_backend.incremental:
+                self.store_writer.submit(
+                    self.daemon_config.runner.runner_id, self.run_index, _result
+                )
+
             self._update_store_content(_result)
         except TypeError:
             logger.warning(
@@ -189,21 +494,73 @@ class TridentDataDaemon:
         except Exception as e:
             raise e
 
-    def write_to_store(self) -> NoReturn:
-        """Writes the current initialized store to the disk on the system for the given store path."""
+    def flush_store(self) -> NoReturn:
+        """Hand the buffered results to the store writer to be written to the store and release them from memory."""
+        with self._buffer_lock:
+            self._last_flush = monotonic()
+            if not self._buffer:
+                return
+
+            batch = self._release_buffer()
+
+        logger.debug(
+            f"Flushing ({len(batch)}) results to store: '{self.daemon_config.store_path}' for runner: '{self.daemon_config.runner.runner_id}'"
+        )
+        self.store_writer.submit(
+            self.daemon_config.runner.runner_id, self.run_index, batch
+        )
+
+    def write_to_store(self, store_results: bool = True) -> NoReturn:
+        """Hand the results of the current run that have not been written yet to the store writer and wait until
+        they are written to the store on the disk. The results are merged into the existing store by the writer
+        so runners sharing a store never overwrite the results of each other.
+
+        :param store_results: If the results of the run are written, otherwise the results not yet written are discarded
+            and the run is only finished in the store, like for a failed run with `dont_store_on_error`, defaults to True
+        :type store_results: bool, optional
+        """
         logger.debug(
             f"Writing to store at path: '{self.daemon_config.store_path}' for runner: '{self.daemon_config.runner.runner_id}'"
         )
-        try:
-            with open(self.daemon_config.store_path, "r+") as store_obj:
-                store_obj.seek(0)
-                store_obj.write(json.dumps(self.store_data))
-                store_obj.truncate()
-        except Exception as e:
-            logger.error(
-                f"Failed to write to store: '{self.daemon_config.store_path}' for runner: '{self.daemon_config.runner.runner_id}'",
-                exc_info=e,
-            )
+        store_writer = self.store_writer
+        store_writer.unregister(self)
+        with self._buffer_lock:
+            if not store_results:
+                # Results already flushed or handed to an incremental store can't be taken back.
+                self._buffer, self._buffer_bytes = {}, 0
+                self._get_runner_results().pop(self.run_index, None)
+                batch = {}
+            elif self.daemon_config.flush_policy is not None:
+                batch = self._release_buffer()
+            elif self.store_backend.incremental:
+                # Incremental stores have already been handed each result when it was stored.
+                batch = {}
+            else:
+                batch = dict(self._get_runner_results().get(self.run_index, {}))
+
+        store_writer.submit(
+            self.daemon_config.runner.runner_id, self.run_index, batch, finished=True
+        )
+        store_writer.drain()
+
+    def start_new_run(self) -> NoReturn:
+        """Start a new run for a runner that is run again by the scheduler of the :class:`TridentDaemon`.
+        The results of the previous run must have been written by :meth:`write_to_store`, the results of the new run
+        are stored under the next run index.
+        """
+        if self.store_data is None:
+            return
+
+        with self._buffer_lock:
+            self._buffer, self._buffer_bytes = {}, 0
+            self._last_flush = monotonic()
+            self._get_runner_content()["results"] = {}
+            self.run_index = str(int(self.run_index) + 1)
+
+        logger.debug(
+            f"Starting run: '{self.run_index}' for runner: '{self.daemon_config.runner.runner_id}'"
+        )
+        self._register_flush_interval()
 
     def create_state_checkpoint(self) -> NoReturn:
         """Creates the checkpoint representing the current state of the plugin and stores it in the path given by `checkpoint_path` in :class:`TridentDataDaemonConfig`"""
@@ -224,38 +581,23 @@ class TridentDataDaemon:
                     exc_info=e,
                 )
 
-    def merge_store_data(self) -> NoReturn:
-        """Merges the store data with the existing store data available in the written store.
-        This is used when the store has results written to it from previous iterations.
-
-        :raises JSONDecodeError: Raises JSONDecodeError if the JSON data is not parseable.
+    def load_run_results(
+        self, run_index: AnyStr, runner_id: Optional[AnyStr] = None
+    ) -> Dict[str, Any]:
+        """Load the results of a previous run from the store written to the disk.
+        Store backends with an index only read the part of the store belonging to the run.
+
+        :param run_index: The run to load the results for.
+        :type run_index: str
+        :param runner_id: The runner that the run belongs to, defaults to the runner connected to this daemon.
+        :type runner_id: Optional[str]
+        :return: The results of the run in the form of {"[INDEX]": ...}
+        :rtype: dict
         """
-        logger.debug(
-            f"Merging store data with existing store at: '{self.daemon_config.store_path}'"
+        runner_id = (
+            runner_id if runner_id is not None else self.daemon_config.runner.runner_id
         )
-        try:
-
-            def _merge(runner, store):
-                for k in store.keys():
-                    if k not in runner:
-                        runner[k] = store[k]
-
-                    if isinstance(store[k], dict):
-                        runner[k] = _merge(runner[k], store[k])
-
-                return runner
-
-            self.store_data = _merge(self.store_data, self._get_store_data())
-        except json.JSONDecodeError as e:
-            logger.warning(
-                f"Failed to parse the JSON data read from the store: '{self.daemon_config.store_path}'"
-            )
-            raise e
-        except Exception as e:
-            logger.fatal(
-                f"Failed to read state from store path: '{self.daemon_config.checkpoint_path}' for runner: '{self.daemon_config.runner.runner_id}'",
-                exc_info=e,
-            )
+        return self.store_backend.load_run(runner_id, run_index)
 
     def load_state_checkpoint(self) -> Dict[Union[str, int], Any]:
         """Load the checkpoint state for the current plugin from the path given by `checkpoint_path` in :class:`TridentDataDaemonConfig`"""
@@ -275,33 +617,61 @@ class TridentDataDaemon:
             )
         return {}
 
-    def _initialize_store(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
-        """Initialize the store structure if the store does not exist, otherwise read the existing store data and return.
+    def _buffer_results(self, result: Dict[int, Any]) -> NoReturn:
+        """Buffer the results until they are flushed to the store according to the flush policy.
 
-        :return: The store structure in the form of {"runners": {"[RUNNER]": {"results": {...}}}}
-        :rtype: dict
+        :param result: The results to buffer in the form of {[INDEX]: ...}
+        :type result: dict
+        :raises TypeError: If the size of the results is limited and the results are not JSON serializable.
         """
-        try:
-            if not path.exists(self.daemon_config.store_path):
-                logger.debug(
-                    f"Initializing store at: '{self.daemon_config.store_path}'"
-                )
-                return {
-                    "runners": {self.daemon_config.runner.runner_id: {"results": {}}}
-                }
-
-            return self._get_store_data()
-        except json.JSONDecodeError as e:
-            logger.error(
-                f"Failed to parse the JSON data from the store: '{self.daemon_config.store_path}'"
-            )
-            raise e
-        except Exception as e:
-            logger.error(
-                f"Failed to initialize store: '{self.daemon_config.store_path}' for runner: '{self.daemon_config.runner.runner_id}'",
-                exc_info=e,
+        flush_policy = self.daemon_config.flush_policy
+        _bytes = (
+            sum(len(json.dumps(value)) for value in result.values())
+            if flush_policy.bytes is not None
+            else 0
+        )
+        with self._buffer_lock:
+            self._update_store_content(result)
+            self._buffer.update(result)
+            self._buffer_bytes += _bytes
+            should_flush = (
+                flush_policy.results is not None
+                and len(self._buffer) >= flush_policy.results
+            ) or (
+                flush_policy.bytes is not None
+                and self._buffer_bytes >= flush_policy.bytes
             )
-            raise e
+
+        if should_flush:
+            self.flush_store()
+
+    def _release_buffer(self) -> Dict[int, Any]:
+        """Empty the buffer and release the buffered results from the store data in memory, the caller must hold the buffer lock.
+
+        :return: The buffered results in the form of {[INDEX]: ...}
+        :rtype: Dict[int, Any]
+        """
+        batch, self._buffer, self._buffer_bytes = self._buffer, {}, 0
+        results = self._get_runner_results().get(self.run_index, {})
+        for result_index in batch.keys():
+            results.pop(result_index, None)
+
+        return batch
+
+    def _register_flush_interval(self) -> NoReturn:
+        """Register this daemon with the store writer to be flushed in the background if the flush policy has an interval."""
+        if (
+            self.store_data is not None
+            and self.daemon_config.flush_policy is not None
+            and self.daemon_config.flush_policy.interval is not None
+        ):
+            self.store_writer.register(self)
+
+    def _flush_on_interval(self) -> NoReturn:
+        """Flush the buffered results if the interval of the flush policy has passed since the last flush."""
+        interval = self.daemon_config.flush_policy.interval
+        if interval is not None and monotonic() - self._last_flush >= interval:
+            self.flush_store()
 
     def _update_store_content(self, result: Dict) -> NoReturn:
         """Update the initialized store values with the given result values.
@@ -317,9 +687,6 @@ class TridentDataDaemon:
                 results[self.run_index] = {}
 
             results[self.run_index].update(result)
-            self.store_data["runners"][self.daemon_config.runner.runner_id][
-                "results"
-            ].update(results)
         except json.JSONDecodeError as e:
             logger.error(
                 f"Failed to parse the JSON data from the store: '{self.daemon_config.store_path}'"
@@ -381,31 +748,10 @@ class TridentDataDaemon:
         :rtype: str
         """
         try:
-            content = self._get_runner_results()
-            if not content.keys():
-                return str(0)
-
-            return str(max([int(index) for index in content.keys()]) + 1)
+            return self.store_backend.run_index(self.daemon_config.runner.runner_id)
         except Exception as e:
             logger.error(
                 f"Failed to get the run index for store: '{self.daemon_config.store_path}' for runner: '{self.daemon_config.runner.runner_id}'",
                 exc_info=e,
             )
             raise e
-
-    def _get_store_data(self) -> Dict[str, Dict[str, Dict[str, Dict[str, str]]]]:
-        """Read from the store written to the disk and parse using the JSON library.
-
-        :raises Exception: If unable to read from the store.
-        :return: Returns the dictionary representation of the results written to the store on the disk.
-        :rtype: dict
-        """
-        try:
-            with open(self.daemon_config.store_path, "r") as store_obj:
-                return json.load(store_obj)
-        except Exception as e:
-            logger.error(
-                f"Failed to get the store data at: '{self.daemon_config.store_path}' for runner: '{self.daemon_config.runner.runner_id}'",
-                exc_info=e,
-            )
-            raise e
@@ -24,6 +24,8 @@ from trident.lib.notification.handler import (
     TridentNotificationHTTPHandler,
     TridentNotificationEmailHandler,
 )
+from trident.lib.notification.dispatcher import TridentNotificationDispatcher
+from trident.lib.notification.limit import TridentNotificationLimiter
 
 
 @dataclass
@@ -89,24 +91,52 @@ class TridentNotificationDaemonConfig:
 class TridentNotificationDaemon:
     def __init__(self, daemon_config: TridentNotificationDaemonConfig):
         self.daemon_config = daemon_config
+        self.dispatchers = [
+            TridentNotificationDispatcher(handler) for handler in daemon_config.handlers
+        ]
+        self.limiters = [
+            TridentNotificationLimiter(handler.notification_config)
+            for handler in daemon_config.handlers
+        ]
 
     def send_notification(self, content):
-        """Loop through all notification handlers and send a notification using the content provided.
+        """Loop through all notification handlers and queue a notification using the content provided.
+        The notifications are sent in the background by the :class:`TridentNotificationDispatcher` of each handler,
+        the :class:`TridentNotificationLimiter` of the handler removes the duplicate results and discarded notifications are never queued.
 
         :param content: JSON parseable content to include in the notification
         :type content: Dict[AnyStr, Any]
         """
-        for handler in self.daemon_config.handlers:
+        for dispatcher, limiter in zip(self.dispatchers, self.limiters):
             try:
-                logger.debug(
-                    f"Sending notification for handler: '{handler.notification_config.name}'"
-                )
-                handler.send_notification(
-                    content=content
-                    if handler.notification_config.include_result
+                _content = limiter.limit(content)
+                if _content is None:
+                    continue
+
+                dispatcher.submit(
+                    _content
+                    if dispatcher.handler.notification_config.include_result
                     else None
                 )
             except Exception as e:
                 logger.error(
-                    f"Failed to send notification for handler: '{handler.notification_config.name}' due to: {e}"
+                    f"Failed to queue notification for handler: '{dispatcher.name}' due to: {e}"
+                )
+
+    def flush(self):
+        """Wait until the queued notifications of every handler have been sent."""
+        for dispatcher in self.dispatchers:
+            dispatcher.flush()
+
+    def close(self):
+        """Close the outboxes and the connections kept open by the notification handlers, both are reopened if needed again.
+        The amount of notifications discarded by the limiter of each handler is logged.
+        """
+        for dispatcher in self.dispatchers:
+            dispatcher.close()
+
+        for limiter in self.limiters:
+            if limiter.deduplicated or limiter.rate_limited:
+                logger.info(
+                    f"Notification handler: '{limiter.name}' discarded ({limiter.deduplicated}) duplicate notification(s) and ({limiter.rate_limited}) notification(s) exceeding the rate limit"
                 )
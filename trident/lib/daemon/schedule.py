@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Schedule
+
+Schedules used by the :class:`TridentDaemon` in scheduler mode to determine when each runner should run next.
+@author: Jacob Wahlman
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from typing import Any, AnyStr, Dict, FrozenSet, Optional
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+# The fields of a cron expression in order with the range of values allowed for each field.
+CRON_FIELDS = [
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+]
+
+# Cron expressions that never match within this many days are considered invalid, for example '0 0 30 2 *'.
+CRON_SEARCH_DAYS = 366 * 5
+
+
+@dataclass
+class TridentCronExpression:
+    """Cron expression in the standard five field format: `minute hour day month weekday`.
+    Each field is either `*`, a value, a range `a-b`, a step `*/n` or `a-b/n` or a comma separated list of those.
+    The weekday `0` and `7` are both Sunday, if both the day and the weekday are restricted then either has to match.
+
+    :param expression: The cron expression.
+    :type expression: str
+    :raises ValueError: If the expression is malformed.
+    """
+
+    expression: str
+
+    def __init__(self, expression: AnyStr):
+        self.expression = expression
+
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELDS):
+            raise ValueError(
+                f"Invalid cron expression: '{expression}', expected {len(CRON_FIELDS)} fields"
+            )
+
+        (
+            self.minutes,
+            self.hours,
+            self.days,
+            self.months,
+            weekdays,
+        ) = [
+            self._parse_field(field, name, minimum, maximum)
+            for field, (name, minimum, maximum) in zip(fields, CRON_FIELDS)
+        ]
+        self.weekdays = frozenset(weekday % 7 for weekday in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def next_run(self, after: datetime) -> datetime:
+        """Get the first time matching the expression after the given time.
+
+        :param after: The time to search from, the time itself is never returned.
+        :type after: :class:`datetime.datetime`
+        :raises ValueError: If the expression never matches.
+        :return: The next time matching the expression.
+        :rtype: :class:`datetime.datetime`
+        """
+        run = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = run + timedelta(days=CRON_SEARCH_DAYS)
+        while run < limit:
+            if run.month not in self.months:
+                run = (run.replace(day=1) + timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+            elif not self._matches_day(run):
+                run = run.replace(hour=0, minute=0) + timedelta(days=1)
+            elif run.hour not in self.hours:
+                run = run.replace(minute=0) + timedelta(hours=1)
+            elif run.minute not in self.minutes:
+                run += timedelta(minutes=1)
+            else:
+                return run
+
+        raise ValueError(f"Cron expression: '{self.expression}' never matches")
+
+    def _matches_day(self, run: datetime) -> bool:
+        """Check if the day of the time matches the day and weekday fields.
+
+        :param run: The time to check.
+        :type run: :class:`datetime.datetime`
+        :return: If the day matches.
+        :rtype: bool
+        """
+        day = run.day in self.days
+        # Python counts the weekdays from Monday while cron counts from Sunday.
+        weekday = (run.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+
+        return day or weekday
+
+    def _parse_field(
+        self, field: AnyStr, name: AnyStr, minimum: int, maximum: int
+    ) -> FrozenSet[int]:
+        """Parse a field of the expression into the set of values it matches.
+
+        :param field: The field to parse.
+        :type field: str
+        :param name: The name of the field.
+        :type name: str
+        :param minimum: The smallest value allowed for the field.
+        :type minimum: int
+        :param maximum: The largest value allowed for the field.
+        :type maximum: int
+        :raises ValueError: If the field is malformed or out of range.
+        :return: The values matched by the field.
+        :rtype: FrozenSet[int]
+        """
+        values = set()
+        for part in field.split(","):
+            try:
+                _range, _, step = part.partition("/")
+                step = int(step) if step else 1
+                if _range == "*":
+                    start, end = minimum, maximum
+                elif "-" in _range:
+                    start, end = [int(value) for value in _range.split("-", 1)]
+                else:
+                    start = end = int(_range)
+                    if step != 1:
+                        end = maximum
+            except ValueError:
+                raise ValueError(
+                    f"Invalid cron field: '{part}' for: '{name}' in expression: '{self.expression}'"
+                )
+
+            if step <= 0 or start < minimum or end > maximum or start > end:
+                raise ValueError(
+                    f"Invalid cron field: '{part}' for: '{name}' in expression: '{self.expression}', values must be within {minimum}-{maximum}"
+                )
+
+            values.update(range(start, end + 1, step))
+
+        return frozenset(values)
+
+
+@dataclass
+class TridentSchedule:
+    """The schedule of a plugin given by the `schedule` section of the plugin configuration.
+    The plugin either runs every `interval` seconds, starting when the scheduler starts, or whenever the `cron` expression matches.
+
+    :param interval: Run the plugin every this many seconds.
+    :type interval: Optional[float]
+    :param cron: Run the plugin when the cron expression matches.
+    :type cron: Optional[:class:`TridentCronExpression`]
+    :raises ValueError: If both or neither of `interval` and `cron` are given or either is invalid.
+    """
+
+    interval: Optional[float]
+    cron: Optional[TridentCronExpression]
+
+    def __init__(self, schedule: Dict[AnyStr, Any]):
+        interval, cron = schedule.get("interval"), schedule.get("cron")
+        if (interval is None) == (cron is None):
+            raise ValueError(
+                f"Invalid schedule: '{schedule}', expected either 'interval' or 'cron'"
+            )
+
+        if interval is not None and (
+            not isinstance(interval, (int, float)) or interval <= 0
+        ):
+            raise ValueError(
+                f"Invalid schedule interval: '{interval}', value must be greater than 0"
+            )
+
+        self.interval = interval
+        self.cron = TridentCronExpression(cron) if cron is not None else None
+
+    def next_run(
+        self, after: datetime, last_run: Optional[datetime] = None
+    ) -> datetime:
+        """Get the time of the next run of the plugin.
+
+        :param after: The current time.
+        :type after: :class:`datetime.datetime`
+        :param last_run: The time that the previous run was due, `None` if the plugin has not run yet.
+        :type last_run: Optional[:class:`datetime.datetime`]
+        :return: The time of the next run, the current time if the run is due immediately.
+        :rtype: :class:`datetime.datetime`
+        """
+        if self.cron is not None:
+            return self.cron.next_run(after)
+
+        if last_run is None:
+            return after
+
+        # Runs that were missed while the previous run was still running are skipped.
+        interval = timedelta(seconds=self.interval)
+        missed = max(0, (after - last_run) // interval)
+        return last_run + interval * (missed + 1)
@@ -9,10 +9,14 @@ The runners are run in a asynchronous environment controlled by the daemon to al
 """
 
 from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import get_context
 from pathlib import Path
+from threading import Event, Thread
+import asyncio
 import concurrent.futures
 
-from typing import List, Dict, NoReturn, NewType, AnyStr
+from typing import List, Dict, NoReturn, NewType, AnyStr, Optional
 
 TridentDataDaemonConfig = NewType("TridentDataDaemonConfig", None)
 
@@ -27,6 +31,11 @@ from trident.lib.runner.trident import (
     TridentStepsRunnerConfig,
     _TridentDefaultRunnerConfig,
 )
+from trident.lib.runner.registry import TridentPluginRegistry
+from trident.lib.daemon.schedule import TridentSchedule
+
+# The longest time in seconds that the scheduler waits before checking if it has been stopped.
+SCHEDULER_POLL_INTERVAL = 1.0
 
 
 @dataclass
@@ -41,10 +50,17 @@ class TridentDaemonConfig:
     :type data_config: dict
     :param dont_store_on_error: Store results if errors occur in runners.
     :type dont_store_on_error: bool
+    :param executor: Run the plugins in threads (`thread`) or in a pool of processes (`process`), can be overridden for each plugin by the runner `executor` argument.
+        Asynchronous plugins are always run on the event loop of the daemon.
+    :type executor: str
+    :param scheduler: Keep running the plugins according to the `schedule` of each plugin until stopped instead of running each plugin once.
+    :type scheduler: bool
     """
 
     workers: int
     plugins: Dict[AnyStr, AnyStr]
+    executor: str = "thread"
+    scheduler: bool = False
 
 
 class TridentDaemon:
@@ -57,8 +73,13 @@ class TridentDaemon:
 
     def __init__(self, daemon_config: TridentDaemonConfig):
         self.daemon_config = daemon_config
-        self._runner_resource_queues = {}
+        self._store_writers = {}
+        self._plugin_registry = TridentPluginRegistry()
         self._future_runners = None
+        self._process_executor, self._process_manager = None, None
+        self._event_loop, self._event_loop_thread = None, None
+        self._scheduler_event = Event()
+        self.schedules = {}
         self.runners = self._initialize_runners()
 
     def start_all_runners(self) -> NoReturn:
@@ -67,12 +88,92 @@ class TridentDaemon:
             max_workers=self.daemon_config.workers
         ) as executor:
             self._executor = executor
+            runner_executors = {
+                runner.runner_id: self._runner_executor(runner)
+                for runner in self.runners
+            }
+            self._start_process_executor(runner_executors)
+            self._start_event_loop(runner_executors)
             self._future_runners = {
-                executor.submit(runner.start_runner): runner for runner in self.runners
+                self._submit_runner(runner, runner_executors[runner.runner_id]): runner
+                for runner in self.runners
+            }
+
+            self.wait_for_runners()
+
+        self._stop_process_executor()
+        self._stop_event_loop()
+
+    def start_scheduler(self) -> NoReturn:
+        """Run each :class:`TridentRunner` according to the schedule of its plugin until :meth:`stop_scheduler` is called.
+        The runners are reused for every run, keeping the plugin, the data daemon and the executors of the daemon,
+        and each run is stored under a new run index in the store. Plugins without a schedule run once when the scheduler starts.
+        A run that is due while the previous run of the runner is still running is skipped.
+
+        :raises Exception: If any error occurs when scheduling the runners.
+        """
+        self._scheduler_event.clear()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.daemon_config.workers
+        ) as executor:
+            self._executor = executor
+            runner_executors = {
+                runner.runner_id: self._runner_executor(runner)
+                for runner in self.runners
+            }
+            self._start_process_executor(runner_executors)
+            self._start_event_loop(runner_executors)
+            self._future_runners = {}
+
+            now = datetime.now()
+            next_runs = {
+                runner: self._next_run(runner, now) for runner in self.runners
             }
+            started = set()
+            while not self._scheduler_event.is_set() and next_runs:
+                now = datetime.now()
+                for runner, next_run in list(next_runs.items()):
+                    if next_run > now:
+                        continue
+
+                    if runner in self._future_runners.values():
+                        logger.warning(
+                            f"Runner: '{runner.runner_id}' is still running, skipping the run due at: '{next_run}'"
+                        )
+                    else:
+                        if runner in started and runner.data_daemon is not None:
+                            runner.data_daemon.start_new_run()
+
+                        started.add(runner)
+                        future = self._submit_runner(
+                            runner, runner_executors[runner.runner_id]
+                        )
+                        self._future_runners[future] = runner
+
+                    if runner.runner_id in self.schedules:
+                        next_runs[runner] = self._next_run(runner, now, next_run)
+                    else:
+                        del next_runs[runner]
+
+                timeout = min(
+                    [SCHEDULER_POLL_INTERVAL]
+                    + [
+                        (next_run - now).total_seconds()
+                        for next_run in next_runs.values()
+                    ]
+                )
+                self._wait_for_scheduled_runners(max(timeout, 0))
 
             self.wait_for_runners()
 
+        self._stop_process_executor()
+        self._stop_event_loop()
+
+    def stop_scheduler(self) -> NoReturn:
+        """Stop scheduling new runs, :meth:`start_scheduler` returns once the runs in progress have finished."""
+        logger.info("Stopping the scheduler")
+        self._scheduler_event.set()
+
     def wait_for_runners(self) -> NoReturn:
         """Wait for each runner future to report as completed meaning that each :class:`TridentRunner` has finished.
         Raises exception for each future that encountered an exception while running.
@@ -80,47 +181,16 @@ class TridentDaemon:
         :raises Exception: The exception raised while the plugin ran in the :class:`TridentRunner`.
         """
         for future in concurrent.futures.as_completed(self._future_runners):
-            runner = self._future_runners[future]
-            try:
-                future.result()
-            except Exception as e:
-                raise e
-
-            logger.info(
-                f"Runner: '{runner.runner_id}' finished execution for plugin: '{runner.runner_config.plugin_name}'"
-            )
-
-            try:
-                if (
-                    runner.runner_id
-                    not in self._runner_resource_queues[
-                        runner.data_daemon.daemon_config.store_path
-                    ]
-                ):
-                    continue
-            except (AttributeError, KeyError):
-                # Data Daemon not initialized or no store specified
-                continue
-
-            if runner.data_daemon.daemon_config.store_path:
-                if not Path(runner.data_daemon.daemon_config.store_path).exists():
-                    Path(runner.data_daemon.daemon_config.store_path).touch()
-                else:
-                    runner.data_daemon.merge_store_data()
-
-                logger.info(
-                    f"Writing output from plugin '{runner.runner_config.plugin_name}' for runner: '{runner.runner_id}' at: '{runner.data_daemon.daemon_config.store_path}'"
-                )
-                runner.data_daemon.write_to_store()
+            self._finish_runner(future, self._future_runners[future])
 
-            self._runner_resource_queues[
-                runner.data_daemon.daemon_config.store_path
-            ].remove(runner.runner_id)
+        self.stop_store_writers()
+        self.close_notification_handlers()
 
     def stop_all_runners(self) -> NoReturn:
         """Stop execution for all :class:`TridentRunner`, if it has already started it's execution then it can't be halted
         so a :class:`threading.Event` will be set to signal for the plugin to halt when seen during execution.
         """
+        self._scheduler_event.set()
         for future, runner in self._future_runners.items():
             logger.debug(f"Sending stop signal to runner: '{runner.runner_id}'")
             runner.runner_config.thread_event.set()
@@ -133,11 +203,6 @@ class TridentDaemon:
                 logger.info(
                     f"Saving current data store to disk for runner: '{runner.runner_id}' at: '{runner.data_daemon.daemon_config.store_path}'"
                 )
-                if not Path(runner.data_daemon.daemon_config.store_path).exists():
-                    Path(runner.data_daemon.daemon_config.store_path).touch()
-                else:
-                    runner.data_daemon.merge_store_data()
-
                 runner.data_daemon.write_to_store()
 
             if isinstance(runner, TridentRunner) and hasattr(
@@ -151,7 +216,240 @@ class TridentDaemon:
                 )
                 runner.data_daemon.create_state_checkpoint()
 
+        self.stop_store_writers()
+        self.close_notification_handlers()
         self._executor.shutdown(wait=False)
+        self._stop_process_executor(wait=False)
+        self._stop_event_loop()
+
+    def stop_store_writers(self) -> NoReturn:
+        """Stop the :class:`TridentStoreWriter` of each store once every queued result has been written to the store."""
+        for store_path, store_writer in list(self._store_writers.items()):
+            logger.debug(f"Stopping the store writer for store: '{store_path}'")
+            store_writer.stop()
+
+    def close_notification_handlers(self) -> NoReturn:
+        """Close the connections kept open by the notification handlers of each :class:`TridentRunner`."""
+        for runner in self.runners:
+            runner.notification_daemon.close()
+
+    def _finish_runner(
+        self, future: concurrent.futures.Future, runner: TridentRunner
+    ) -> NoReturn:
+        """Check the result of a finished runner and write the results of the run to the store.
+        The results of a failed run are written as well before the error is raised, unless `dont_store_on_error` is set
+        in which case they are discarded, so the run is finished in the store before the scheduler starts the next run
+        under the next run index.
+
+        :param future: The future of the finished runner.
+        :type future: :class:`concurrent.futures.Future`
+        :param runner: The finished runner.
+        :type runner: :class:`TridentRunner`
+        :raises Exception: The exception raised while the plugin ran in the :class:`TridentRunner`.
+        """
+        failed = True
+        try:
+            future.result()
+            failed = False
+            logger.info(
+                f"Runner: '{runner.runner_id}' finished execution for plugin: '{runner.runner_config.plugin_name}'"
+            )
+            runner.notification_daemon.flush()
+        finally:
+            if (
+                runner.data_daemon is not None
+                and runner.data_daemon.store_data is not None
+            ):
+                store_results = not (
+                    failed and getattr(runner.runner_config, "dont_store_on_error")
+                )
+                if store_results:
+                    logger.info(
+                        f"Writing output from plugin '{runner.runner_config.plugin_name}' for runner: '{runner.runner_id}' at: '{runner.data_daemon.daemon_config.store_path}'"
+                    )
+                else:
+                    logger.info(
+                        f"Runner: '{runner.runner_id}' exited with error, discarding the results of the run"
+                    )
+
+                runner.data_daemon.write_to_store(store_results=store_results)
+
+    def _wait_for_scheduled_runners(self, timeout: float) -> NoReturn:
+        """Wait until any scheduled runner finishes, the timeout passes or the scheduler is stopped.
+        A runner that fails is logged and run again at its next scheduled run.
+
+        :param timeout: The longest time in seconds to wait.
+        :type timeout: float
+        """
+        if not self._future_runners:
+            self._scheduler_event.wait(timeout)
+            return
+
+        done, _ = concurrent.futures.wait(
+            self._future_runners,
+            timeout=timeout,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            runner = self._future_runners.pop(future)
+            try:
+                self._finish_runner(future, runner)
+            except Exception as e:
+                logger.error(
+                    f"Runner: '{runner.runner_id}' failed with error: {e}, running again at the next scheduled run"
+                )
+
+    def _next_run(
+        self,
+        runner: TridentRunner,
+        now: datetime,
+        last_run: Optional[datetime] = None,
+    ) -> datetime:
+        """Get the time of the next run of the runner according to the schedule of its plugin.
+
+        :param runner: The runner to get the next run for.
+        :type runner: :class:`TridentRunner`
+        :param now: The current time.
+        :type now: :class:`datetime.datetime`
+        :param last_run: The time that the previous run was due, `None` if the runner has not run yet.
+        :type last_run: Optional[:class:`datetime.datetime`]
+        :return: The time of the next run, runners without a schedule run immediately.
+        :rtype: :class:`datetime.datetime`
+        """
+        schedule = self.schedules.get(runner.runner_id)
+        if schedule is None:
+            return now
+
+        return schedule.next_run(now, last_run)
+
+    def _submit_runner(
+        self, runner: TridentRunner, executor: AnyStr
+    ) -> concurrent.futures.Future:
+        """Start the runner in a thread of the daemon or as a task on the event loop of the daemon.
+
+        :param runner: The runner to start.
+        :type runner: :class:`TridentRunner`
+        :param executor: The executor of the runner.
+        :type executor: str
+        :return: The future of the runner.
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        if executor == "async":
+            return asyncio.run_coroutine_threadsafe(
+                runner.start_runner_async(), self._event_loop
+            )
+
+        if isinstance(runner, TridentStepsRunner):
+            # Steps that can run in parallel are run on the workers of the daemon as well.
+            runner.step_executor = self._executor
+
+        return self._executor.submit(runner.start_runner)
+
+    def _start_event_loop(self, runner_executors: Dict[AnyStr, AnyStr]) -> NoReturn:
+        """Start the event loop shared by the :class:`TridentRunner` with asynchronous plugins in a thread of its own.
+        The loop is only started if any runner has an asynchronous plugin, those runners don't occupy any of the workers of the daemon.
+
+        :param runner_executors: The executor of each runner by the runner identifier.
+        :type runner_executors: Dict[str, str]
+        """
+        async_runners = [
+            runner_id
+            for runner_id, executor in runner_executors.items()
+            if executor == "async"
+        ]
+        if not async_runners:
+            return
+
+        logger.debug(f"Starting event loop for ({len(async_runners)}) runner(s)")
+        self._event_loop = asyncio.new_event_loop()
+        self._event_loop_thread = Thread(
+            target=self._event_loop.run_forever, name="TridentEventLoop", daemon=True
+        )
+        self._event_loop_thread.start()
+
+    def _stop_event_loop(self) -> NoReturn:
+        """Stop the event loop and the thread running it if they were started."""
+        if self._event_loop is None:
+            return
+
+        self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+        self._event_loop_thread.join()
+        self._event_loop.close()
+        self._event_loop, self._event_loop_thread = None, None
+
+    def _start_process_executor(
+        self, runner_executors: Dict[AnyStr, AnyStr]
+    ) -> NoReturn:
+        """Start the process pool used by the :class:`TridentRunner` that run their plugin in a process.
+        The pool and the manager used to share queues and events with the processes are only started if any runner uses the `process` executor.
+
+        :param runner_executors: The executor of each runner by the runner identifier.
+        :type runner_executors: Dict[str, str]
+        """
+        process_runners = [
+            runner
+            for runner in self.runners
+            if runner_executors[runner.runner_id] == "process"
+        ]
+        if not process_runners:
+            return
+
+        logger.debug(
+            f"Starting process pool for ({len(process_runners)}) runner(s) with: ({self.daemon_config.workers}) worker(s)"
+        )
+        context = get_context("spawn")
+        self._process_manager = context.Manager()
+        self._process_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(self.daemon_config.workers, len(process_runners)),
+            mp_context=context,
+        )
+        for runner in process_runners:
+            runner.process_executor = self._process_executor
+            runner.process_manager = self._process_manager
+
+    def _stop_process_executor(self, wait: bool = True) -> NoReturn:
+        """Stop the process pool and the manager if they were started.
+
+        :param wait: Wait for the running plugin processes to exit.
+        :type wait: bool
+        """
+        if self._process_executor is None:
+            return
+
+        self._process_executor.shutdown(wait=wait)
+        self._process_manager.shutdown()
+        self._process_executor, self._process_manager = None, None
+        for runner in self.runners:
+            runner.process_executor, runner.process_manager = None, None
+
+    def _runner_executor(self, runner: TridentRunner) -> AnyStr:
+        """Determine if the runner runs its plugin in a thread, in a process or on the event loop of the daemon.
+        The `executor` runner argument of the plugin takes precedence over the daemon `executor` argument,
+        asynchronous plugins are always run on the event loop.
+
+        :param runner: The runner to determine the executor for.
+        :type runner: :class:`TridentRunner`
+        :return: The executor of the runner, either `thread`, `process` or `async`.
+        :rtype: str
+        """
+        executor = (
+            getattr(runner.runner_config, "executor", None)
+            or self.daemon_config.executor
+        )
+        if isinstance(runner, TridentRunner) and runner.is_async:
+            if executor == "process":
+                logger.warning(
+                    f"Runner: '{runner.runner_id}' has an asynchronous plugin that can't be run in a process, running on the event loop"
+                )
+            return "async"
+
+        if executor == "process" and not isinstance(runner, TridentRunner):
+            logger.warning(
+                f"Steps runner: '{runner.runner_id}' can't be run in a process, running in a thread"
+            )
+            return "thread"
+
+        return executor
 
     def _initialize_runner(
         self, runner_config: _TridentDefaultRunnerConfig, runner_id: AnyStr
@@ -209,7 +507,8 @@ class TridentDaemon:
                             checkpoint_config=plugin_config["args"]["checkpoint"],
                             runner_config=plugin_config["args"]["runner"],
                             notification_config=plugin_config["args"]["notification"],
-                            resource_queues=self._runner_resource_queues,
+                            store_writers=self._store_writers,
+                            plugin_registry=self._plugin_registry,
                         ),
                         runner_id=plugin_id,
                     )
@@ -239,7 +538,8 @@ class TridentDaemon:
                             checkpoint_config=plugin_config["args"]["checkpoint"],
                             runner_config=plugin_config["args"]["runner"],
                             notification_config=plugin_config["args"]["notification"],
-                            resource_queues=self._runner_resource_queues,
+                            store_writers=self._store_writers,
+                            plugin_registry=self._plugin_registry,
                         ),
                         runner_id=plugin_id,
                     )
@@ -255,6 +555,17 @@ class TridentDaemon:
                     f"Failed to initialize plugin: '{plugin_id}' due to missing the 'path' or 'steps' keyword"
                 )
 
+            if plugin_config.get("schedule") is not None:
+                try:
+                    self.schedules[plugin_id] = TridentSchedule(
+                        plugin_config["schedule"]
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to initialize the schedule for plugin: '{plugin_id}' due to previous error: {e}"
+                    )
+                    raise e
+
             logger.info(
                 f"Initialized ({len(_initialized_runners)}) out of ({len(self.daemon_config.plugins)}) plugins"
             )
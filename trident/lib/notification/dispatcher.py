@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Notification Dispatcher
+
+Sends the notifications of a notification handler from a bounded queue in the background.
+@author: Jacob Wahlman
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import monotonic
+import json
+
+from typing import Any, AnyStr, Dict, List, NewType, NoReturn, Optional
+
+TridentNotificationTypeHandler = NewType("TridentNotificationTypeHandler", None)
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+from trident.lib.notification.outbox import (
+    TridentNotificationOutbox,
+    TridentNotificationOutboxConfig,
+)
+
+BACKPRESSURE_POLICIES = ["block", "drop_oldest", "spill"]
+
+# The interval in seconds that an idle dispatcher worker checks for spilled notifications.
+DISPATCHER_POLL_INTERVAL = 0.5
+
+# Queued once for every worker when the dispatcher is closed, the worker taking it exits.
+_DISPATCHER_STOP = object()
+
+
+@dataclass
+class TridentNotificationBatchWindow:
+    """Window that the notifications of a handler are coalesced in before they are sent as one notification.
+    The window is closed when any of the given limits is reached, limits that are not set are ignored.
+
+    :param max_items: Close the window when this many notifications are in it.
+    :type max_items: Optional[int]
+    :param max_bytes: Close the window when the notifications in it exceed this many bytes when serialized.
+    :type max_bytes: Optional[int]
+    :param max_delay: Close the window when this many seconds have passed since the first notification in it was taken from the queue,
+        without a delay the window only holds the notifications that are already queued.
+    :type max_delay: Optional[float]
+    :raises ValueError: If any limit is invalid or no limit is given.
+    """
+
+    max_items: Optional[int]
+    max_bytes: Optional[int]
+    max_delay: Optional[float]
+
+    def __init__(self, batch: Dict[AnyStr, Any]):
+        for limit in ["max_items", "max_bytes", "max_delay"]:
+            value = batch.get(limit)
+            if value is not None and (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or value <= 0
+            ):
+                raise ValueError(
+                    f"Invalid batch limit: '{limit}' with value: '{value}', value must be greater than 0"
+                )
+
+            setattr(self, limit, value)
+
+        if (
+            self.max_items is None
+            and self.max_bytes is None
+            and self.max_delay is None
+        ):
+            raise ValueError(
+                "No batch limit was defined, expected any of 'max_items', 'max_bytes' or 'max_delay'"
+            )
+
+    def is_full(self, items: int, size: int) -> bool:
+        """Check if the window has reached the item or size limit.
+
+        :param items: The amount of notifications in the window.
+        :type items: int
+        :param size: The size of the notifications in the window in bytes.
+        :type size: int
+        :return: If the window should be closed.
+        :rtype: bool
+        """
+        return (self.max_items is not None and items >= self.max_items) or (
+            self.max_bytes is not None and size >= self.max_bytes
+        )
+
+
+@dataclass
+class TridentNotificationDispatcherConfig:
+    """Config for the :class:`TridentNotificationDispatcher` of a notification handler, given by the handler configuration.
+
+    :param queue_size: The amount of notifications that can be queued before the backpressure policy applies.
+    :type queue_size: int
+    :param backpressure: What to do with a notification when the queue is full, wait for space in the queue (`block`),
+        discard the oldest queued notification (`drop_oldest`) or write the notification to the `spill_path` (`spill`).
+    :type backpressure: str
+    :param spill_path: The file that notifications are spilled to, required by the `spill` policy.
+    :type spill_path: Optional[Path]
+    :param workers: The amount of threads sending the notifications of the handler.
+    :type workers: int
+    :param batch: The window that the notifications are coalesced in, `None` to send each notification by itself.
+    :type batch: Optional[:class:`TridentNotificationBatchWindow`]
+    :param outbox: The outbox that failed notifications are retried from, `None` to only log failed notifications.
+    :type outbox: Optional[:class:`TridentNotificationOutboxConfig`]
+    :raises ValueError: If any value is invalid.
+    """
+
+    queue_size: int
+    backpressure: str
+    spill_path: Optional[Path]
+    workers: int
+    batch: Optional[TridentNotificationBatchWindow]
+    outbox: Optional[TridentNotificationOutboxConfig]
+
+    def __init__(self, notification_config: Any):
+        self.queue_size = getattr(notification_config, "queue_size", 1000)
+        self.backpressure = getattr(notification_config, "backpressure", "block")
+        self.workers = getattr(notification_config, "workers", 1)
+
+        spill_path = getattr(notification_config, "spill_path", None)
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+
+        batch = getattr(notification_config, "batch", None)
+        self.batch = TridentNotificationBatchWindow(batch) if batch else None
+
+        outbox = getattr(notification_config, "outbox", None)
+        self.outbox = TridentNotificationOutboxConfig(outbox) if outbox else None
+
+        for option in ["queue_size", "workers"]:
+            value = getattr(self, option)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ValueError(
+                    f"Invalid value: '{value}' for: '{option}' of notification: '{notification_config.name}', value must be an integer greater than 0"
+                )
+
+        if self.backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unsupported backpressure policy: '{self.backpressure}' for notification: '{notification_config.name}', expected any of: {BACKPRESSURE_POLICIES}"
+            )
+
+        if self.backpressure == "spill" and self.spill_path is None:
+            raise ValueError(
+                f"No 'spill_path' was defined for the 'spill' backpressure policy of notification: '{notification_config.name}'"
+            )
+
+
+class TridentNotificationDispatcher:
+    """Dispatcher sending the notifications of a notification handler from a bounded queue using a pool of worker threads,
+    the runner only waits for the notifications when the queue is full and the `block` policy is used.
+    The workers are started when the first notification is submitted.
+
+    :param handler: The notification handler used to send the notifications.
+    :type handler: TridentNotificationTypeHandler
+    """
+
+    def __init__(self, handler: TridentNotificationTypeHandler):
+        self.handler = handler
+        self.dispatcher_config = TridentNotificationDispatcherConfig(
+            handler.notification_config
+        )
+        self.notifications = Queue(maxsize=self.dispatcher_config.queue_size)
+        self.dropped = 0
+        self.outbox = (
+            TridentNotificationOutbox(handler, self.dispatcher_config.outbox)
+            if self.dispatcher_config.outbox is not None
+            else None
+        )
+
+        self._workers: List[Thread] = []
+        self._workers_lock = Lock()
+        self._spill_lock = Lock()
+        self._spilled = 0
+        self._spill_offset = 0
+
+        spill_path = self.dispatcher_config.spill_path
+        if spill_path is not None and spill_path.exists():
+            # Notifications spilled by a previous run that were never sent are sent first.
+            with open(spill_path, "r") as spill_file:
+                self._spilled = sum(1 for _ in spill_file)
+
+    @property
+    def name(self) -> AnyStr:
+        """Get the name of the notification handler of this dispatcher.
+
+        :return: The name of the notification.
+        :rtype: str
+        """
+        return self.handler.notification_config.name
+
+    def submit(self, content: Optional[Dict[AnyStr, Any]]) -> NoReturn:
+        """Queue a notification to be sent by the workers, applying the backpressure policy if the queue is full.
+
+        :param content: JSON parseable content to include in the notification
+        :type content: Optional[Dict[AnyStr, Any]]
+        """
+        self._start_workers()
+
+        backpressure = self.dispatcher_config.backpressure
+        if backpressure == "block":
+            self.notifications.put(content)
+        elif backpressure == "drop_oldest":
+            self._put_drop_oldest(content)
+        else:
+            self._put_spill(content)
+
+    def flush(self) -> NoReturn:
+        """Wait until every queued and spilled notification has been sent."""
+        while True:
+            self.notifications.join()
+            if not self._spilled:
+                return
+
+            self._start_workers()
+            self._unspill()
+
+    def close(self) -> NoReturn:
+        """Stop the workers once the notifications already queued have been sent, then close the outbox
+        and the connections kept open by the notification handler. The workers are started again if another notification is submitted.
+        """
+        with self._workers_lock:
+            workers, self._workers = self._workers, []
+
+        for _ in workers:
+            self.notifications.put(_DISPATCHER_STOP)
+
+        for worker in workers:
+            worker.join()
+
+        self._compact_spill()
+        if self.outbox is not None:
+            self.outbox.close()
+
+        if hasattr(self.handler, "close"):
+            self.handler.close()
+
+    def _start_workers(self) -> NoReturn:
+        """Start the worker threads if they have not been started yet."""
+        if self._workers:
+            return
+
+        with self._workers_lock:
+            if self._workers:
+                return
+
+            for index in range(0, self.dispatcher_config.workers):
+                worker = Thread(
+                    target=self._send_notifications,
+                    name=f"TridentNotification-{self.name}-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _put_drop_oldest(self, content: Optional[Dict[AnyStr, Any]]) -> NoReturn:
+        """Queue the notification, discarding the oldest queued notification if the queue is full.
+
+        :param content: JSON parseable content to include in the notification
+        :type content: Optional[Dict[AnyStr, Any]]
+        """
+        while True:
+            try:
+                self.notifications.put_nowait(content)
+                return
+            except Full:
+                pass
+
+            try:
+                self.notifications.get_nowait()
+            except Empty:
+                continue
+
+            self.notifications.task_done()
+            self.dropped += 1
+            logger.warning(
+                f"Notification queue of: '{self.name}' is full, dropped the oldest notification ({self.dropped} dropped in total)"
+            )
+
+    def _put_spill(self, content: Optional[Dict[AnyStr, Any]]) -> NoReturn:
+        """Queue the notification, writing it to the spill file instead if the queue is full.
+        Once anything has been spilled every notification is spilled until the spill file is empty to keep the order.
+
+        :param content: JSON parseable content to include in the notification
+        :type content: Optional[Dict[AnyStr, Any]]
+        """
+        with self._spill_lock:
+            if not self._spilled:
+                try:
+                    self.notifications.put_nowait(content)
+                    return
+                except Full:
+                    pass
+
+            try:
+                line = json.dumps(content)
+            except TypeError:
+                logger.warning(
+                    f"Notification for: '{self.name}' is not JSON serializable and can't be spilled, dropping the notification"
+                )
+                return
+
+            with open(self.dispatcher_config.spill_path, "a") as spill_file:
+                spill_file.write(line + "\n")
+
+            if not self._spilled:
+                logger.warning(
+                    f"Notification queue of: '{self.name}' is full, spilling notifications to: '{self.dispatcher_config.spill_path}'"
+                )
+            self._spilled += 1
+
+    def _unspill(self) -> NoReturn:
+        """Move as many spilled notifications back into the queue as there is space for.
+        The spill file is read from the offset of the first notification not yet moved and only truncated once every notification has been moved.
+        """
+        with self._spill_lock:
+            if not self._spilled:
+                return
+
+            space = self.notifications.maxsize - self.notifications.qsize()
+            if space <= 0:
+                return
+
+            with open(self.dispatcher_config.spill_path, "rb") as spill_file:
+                spill_file.seek(self._spill_offset)
+                for _ in range(0, min(space, self._spilled)):
+                    self.notifications.put_nowait(json.loads(spill_file.readline()))
+                    self._spilled -= 1
+
+                self._spill_offset = spill_file.tell()
+
+            if not self._spilled:
+                open(self.dispatcher_config.spill_path, "w").close()
+                self._spill_offset = 0
+
+    def _compact_spill(self) -> NoReturn:
+        """Remove the notifications already moved back into the queue from the spill file,
+        so that only the notifications that were never queued are sent by the next run.
+        """
+        with self._spill_lock:
+            if not self._spill_offset:
+                return
+
+            with open(self.dispatcher_config.spill_path, "rb") as spill_file:
+                spill_file.seek(self._spill_offset)
+                lines = spill_file.read()
+
+            with open(self.dispatcher_config.spill_path, "wb") as spill_file:
+                spill_file.write(lines)
+
+            self._spill_offset = 0
+
+    def _send_notifications(self) -> NoReturn:
+        """Send the queued notifications until the dispatcher is closed."""
+        while True:
+            try:
+                content = self.notifications.get(timeout=DISPATCHER_POLL_INTERVAL)
+            except Empty:
+                self._unspill()
+                continue
+
+            if content is _DISPATCHER_STOP:
+                self.notifications.task_done()
+                return
+
+            contents = [content]
+            try:
+                if self.dispatcher_config.batch is not None:
+                    contents = self._collect_batch(content)
+                    content = contents
+
+                logger.debug(
+                    f"Sending notification for handler: '{self.name}' with ({len(contents)}) notification(s)"
+                )
+                self.handler.send_notification(content=content)
+            except Exception as e:
+                if self.outbox is not None:
+                    self.outbox.add(content, e)
+                else:
+                    logger.error(
+                        f"Failed to send notification for handler: '{self.name}' due to: {e}"
+                    )
+            finally:
+                # Spilled notifications are queued before the task is done so that flushing waits for them as well.
+                self._unspill()
+                for _ in contents:
+                    self.notifications.task_done()
+
+    def _collect_batch(
+        self, content: Optional[Dict[AnyStr, Any]]
+    ) -> List[Optional[Dict[AnyStr, Any]]]:
+        """Collect queued notifications into a window, starting with the given notification, until the window is closed.
+
+        :param content: The first notification of the window.
+        :type content: Optional[Dict[AnyStr, Any]]
+        :return: The notifications in the window in the order they were queued.
+        :rtype: List[Optional[Dict[AnyStr, Any]]]
+        """
+        batch = self.dispatcher_config.batch
+        contents, size = [content], self._content_size(content)
+        deadline = monotonic() + batch.max_delay if batch.max_delay else None
+        while not batch.is_full(len(contents), size):
+            try:
+                if deadline is None:
+                    content = self.notifications.get_nowait()
+                else:
+                    timeout = deadline - monotonic()
+                    if timeout <= 0:
+                        break
+
+                    content = self.notifications.get(timeout=timeout)
+            except Empty:
+                break
+
+            if content is _DISPATCHER_STOP:
+                # The stop is queued again behind the window for a worker to take once the window is sent.
+                self.notifications.put(content)
+                self.notifications.task_done()
+                break
+
+            contents.append(content)
+            size += self._content_size(content)
+
+        return contents
+
+    def _content_size(self, content: Optional[Dict[AnyStr, Any]]) -> int:
+        """Get the size of the notification in bytes when serialized, only computed if the window has a size limit.
+
+        :param content: The notification.
+        :type content: Optional[Dict[AnyStr, Any]]
+        :return: The size in bytes.
+        :rtype: int
+        """
+        if self.dispatcher_config.batch.max_bytes is None:
+            return 0
+
+        return len(json.dumps(content, default=str))
@@ -8,16 +8,20 @@ Implements each type of notification handler.
 """
 
 from dataclasses import dataclass
-from urllib import request
-import smtplib
+from urllib.parse import urlsplit
 import json
 
-from typing import Union, AnyStr, Dict, Any, Iterable
+from typing import Union, AnyStr, Dict, Any, Iterable, List, Optional
 
 import logging
 
 logger = logging.getLogger("__main__")
 
+from trident.lib.notification.pool import (
+    TridentHTTPConnectionPool,
+    TridentSMTPConnectionPool,
+)
+
 
 @dataclass
 class TridentNotificationHTTPHandlerConfig:
@@ -26,6 +30,9 @@ class TridentNotificationHTTPHandlerConfig:
     headers: Dict[AnyStr, AnyStr]
     payload: Dict[AnyStr, Any]
     include_result: bool
+    pool_size: int
+    idle_timeout: float
+    timeout: Optional[float]
 
     def __init__(self, name: AnyStr, configuration: Dict[AnyStr, AnyStr]):
         self.name = name
@@ -52,6 +59,15 @@ class TridentNotificationHTTPHandlerConfig:
                 "X-Source-Application": "Trident",
             }
 
+        if "pool_size" not in notification_config:
+            notification_config["pool_size"] = 4
+
+        if "idle_timeout" not in notification_config:
+            notification_config["idle_timeout"] = 60.0
+
+        if "timeout" not in notification_config:
+            notification_config["timeout"] = None
+
         for arg, value in notification_config.items():
             setattr(self, arg, value)
 
@@ -65,6 +81,11 @@ class TridentNotificationHTTPHandlerConfig:
                 f"No destination for HTTP notification: '{self.name}' was defined"
             )
 
+        if urlsplit(self.destination).scheme not in ["http", "https"]:
+            raise ValueError(
+                f"Unsupported destination: '{self.destination}' used for notification: '{self.name}', expected a 'http' or 'https' URL"
+            )
+
         if not hasattr(self, "method") or not self.method:
             raise ValueError(
                 f"No HTTP method was defined for notification: '{self.name}'"
@@ -75,6 +96,26 @@ class TridentNotificationHTTPHandlerConfig:
                 f"Unsupported HTTP method: '{self.method}' used for notitication: '{self.name}'"
             )
 
+        if (
+            not isinstance(self.pool_size, int)
+            or isinstance(self.pool_size, bool)
+            or self.pool_size < 1
+        ):
+            raise ValueError(
+                f"Invalid value: '{self.pool_size}' for: 'pool_size' of notification: '{self.name}', value must be an integer greater than 0"
+            )
+
+        for option in ["idle_timeout", "timeout"]:
+            value = getattr(self, option)
+            if value is not None and (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or value <= 0
+            ):
+                raise ValueError(
+                    f"Invalid value: '{value}' for: '{option}' of notification: '{self.name}', value must be greater than 0"
+                )
+
         if self.method.upper() == "GET" and (self.payload or self.include_result):
             logger.warning(
                 "Payload/Include result can not be used with GET requests, will not include payload"
@@ -104,6 +145,8 @@ class TridentNotificationEmailHandlerConfig:
     subject: AnyStr
     message: AnyStr
     include_result: bool
+    idle_timeout: float
+    timeout: Optional[float]
 
     def __init__(self, name: AnyStr, configuration: Dict[AnyStr, AnyStr]):
         self.name = name
@@ -126,6 +169,12 @@ class TridentNotificationEmailHandlerConfig:
         if "include_result" not in notification_config:
             notification_config["include_result"] = False
 
+        if "idle_timeout" not in notification_config:
+            notification_config["idle_timeout"] = 60.0
+
+        if "timeout" not in notification_config:
+            notification_config["timeout"] = None
+
         for arg, value in notification_config.items():
             setattr(self, arg, value)
 
@@ -147,6 +196,17 @@ class TridentNotificationEmailHandlerConfig:
         if not hasattr(self, "sender") or not self.sender:
             raise ValueError(f"No sender was defined for notification: '{self.name}'")
 
+        for option in ["idle_timeout", "timeout"]:
+            value = getattr(self, option)
+            if value is not None and (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or value <= 0
+            ):
+                raise ValueError(
+                    f"Invalid value: '{value}' for: '{option}' of notification: '{self.name}', value must be greater than 0"
+                )
+
         if (not hasattr(self, "message") or not self.message) and (
             not hasattr(self, "include_result") or not self.include_result
         ):
@@ -158,20 +218,31 @@ class TridentNotificationEmailHandlerConfig:
 class TridentNotificationHTTPHandler:
     def __init__(self, notification_config: TridentNotificationHTTPHandlerConfig):
         self.notification_config = notification_config
+        self.http_pool = TridentHTTPConnectionPool(
+            pool_size=notification_config.pool_size,
+            idle_timeout=notification_config.idle_timeout,
+            timeout=notification_config.timeout,
+        )
 
-    def send_notification(self, content: Dict[AnyStr, Any]):
-        """Send the notification using urllib to send the actual request to the destination.
+    def send_notification(
+        self, content: Union[Dict[AnyStr, Any], List[Dict[AnyStr, Any]]]
+    ):
+        """Send the notification to the destination over a keep-alive connection kept open by the pool of the handler.
         Uses the configuration provided by :class:`TridentNotificationHTTPHandlerConfig` to fill the request.
         If both content is used and payload/include result is used then we combine the two.
         The combine operation only supports content that is JSON parseable so if any other Content-Type header is set
         then we just send the payload that is defined in the configuration.
+        Notifications coalesced in a batch window are sent as a JSON array of the content of each notification.
 
-        :param content: JSON parseable content to include in the notification
-        :type content: Dict[AnyStr, Any]
+        :param content: JSON parseable content to include in the notification, or a list of the content of each notification in the batch.
+        :type content: Union[Dict[AnyStr, Any], List[Dict[AnyStr, Any]]]
         """
+        if isinstance(content, list):
+            content = [_content for _content in content if _content is not None]
+
+        # The payload is shared by the dispatcher workers sending notifications concurrently so it is not modified.
         if self.notification_config.payload and content:
-            self.notification_config.payload["content"] = content
-            data = self.notification_config.payload
+            data = {**self.notification_config.payload, "content": content}
         else:
             data = (
                 self.notification_config.payload
@@ -179,48 +250,68 @@ class TridentNotificationHTTPHandler:
                 else content
             )
 
-        request.urlopen(
-            request.Request(
-                url=self.notification_config.destination,
-                method=self.notification_config.method,
-                headers=self.notification_config.headers,
-                data=json.dumps(self.notification_config.payload).encode("utf-8")
-                if self.notification_config.payload
-                else b"",
-            )
+        self.http_pool.request(
+            self.notification_config.method.upper(),
+            self.notification_config.destination,
+            headers=self.notification_config.headers,
+            body=json.dumps(data).encode("utf-8") if data else None,
         )
 
+    def close(self):
+        """Close the idle HTTP connections of the handler."""
+        self.http_pool.close()
+
 
 class TridentNotificationEmailHandler:
     def __init__(self, notification_config: TridentNotificationEmailHandlerConfig):
         self.notification_config = notification_config
+        self.smtp_pool = TridentSMTPConnectionPool(
+            notification_config.smtp_server,
+            idle_timeout=notification_config.idle_timeout,
+            timeout=notification_config.timeout,
+        )
 
-    def send_notification(self, content: Dict[AnyStr, Any]):
+    def send_notification(
+        self, content: Union[Dict[AnyStr, Any], List[Dict[AnyStr, Any]]]
+    ):
         """Send the notification using smtplib to send the e-mail.
         Uses the configuration provided by :class:`TridentNotificationEmailHandlerConfig` to fill the e-mail.
+        The e-mail is sent to every receiver at once over a SMTP session kept open by the pool of the handler.
         If both content is used and payload/include result is used then these are separated and sent in the same e-mail.
+        Notifications coalesced in a batch window are sent as one digest e-mail listing the content of each notification.
 
-        :param content: Content to include in the e-mail
-        :type content: Dict[AnyStr, Any]
+        :param content: Content to include in the e-mail, or a list of the content of each notification in the batch.
+        :type content: Union[Dict[AnyStr, Any], List[Dict[AnyStr, Any]]]
         """
         if self.notification_config.receivers and isinstance(
             self.notification_config.receivers, str
         ):
             self.notification_config.receivers = [self.notification_config.receivers]
 
-        message_body = self.notification_config.message
-        if content is not None:
+        contents = content if isinstance(content, list) else [content]
+        message_body = getattr(self.notification_config, "message", None) or ""
+        for _content in contents:
+            if _content is None:
+                continue
+
             message_body += "\r\n"
-            for key, value in content.items():
+            for key, value in _content.items():
                 message_body += "{key}: {value}\r\n".format(key=key, value=value)
 
-        for receiver in self.notification_config.receivers:
-            message = """From: <{sender}>\r\nTo: <{receiver}>\r\nSubject: {subject}\r\n\r\n{content}""".format(
-                sender=self.notification_config.sender,
-                receiver=receiver,
-                subject=self.notification_config.subject,
-                content=message_body,
-            )
+        message = """From: <{sender}>\r\nTo: {receivers}\r\nSubject: {subject}\r\n\r\n{content}""".format(
+            sender=self.notification_config.sender,
+            receivers=", ".join(
+                f"<{receiver}>" for receiver in self.notification_config.receivers
+            ),
+            subject=self.notification_config.subject,
+            content=message_body,
+        )
+        self.smtp_pool.sendmail(
+            self.notification_config.sender,
+            list(self.notification_config.receivers),
+            message,
+        )
 
-            smtp_obj = smtplib.SMTP(self.notification_config.smtp_server)
-            smtp_obj.sendmail(self.notification_config.sender, [receiver], message)
+    def close(self):
+        """Close the idle SMTP sessions of the handler."""
+        self.smtp_pool.close()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Notification Limits
+
+Rate limiting and deduplication of the notifications of a handler, applied before the notifications are queued.
+@author: Jacob Wahlman
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+import json
+import math
+
+from typing import Any, AnyStr, Dict, Optional
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+
+@dataclass
+class TridentNotificationRateLimit:
+    """Token bucket limiting the rate of the notifications of a handler, given by the `rate_limit` section of the handler configuration.
+    The bucket holds at most `burst` tokens and is refilled with `rate` tokens every second, each notification takes one token.
+
+    :param rate: The amount of notifications allowed every second on average.
+    :type rate: float
+    :param burst: The amount of notifications allowed at once, defaults to the rate rounded up.
+    :type burst: int
+    :raises ValueError: If any value is invalid.
+    """
+
+    rate: float
+    burst: int
+
+    def __init__(self, rate_limit: Dict[AnyStr, Any]):
+        self.rate = rate_limit.get("rate")
+        if (
+            not isinstance(self.rate, (int, float))
+            or isinstance(self.rate, bool)
+            or self.rate <= 0
+        ):
+            raise ValueError(
+                f"Invalid rate limit value: '{self.rate}' for: 'rate', value must be greater than 0"
+            )
+
+        self.burst = rate_limit.get("burst", math.ceil(self.rate))
+        if (
+            not isinstance(self.burst, int)
+            or isinstance(self.burst, bool)
+            or self.burst < 1
+        ):
+            raise ValueError(
+                f"Invalid rate limit value: '{self.burst}' for: 'burst', value must be an integer greater than 0"
+            )
+
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+
+    def acquire(self) -> bool:
+        """Take a token from the bucket if there is one.
+
+        :return: If the notification is allowed.
+        :rtype: bool
+        """
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+
+class TridentNotificationLimiter:
+    """Limiter deciding if a notification of a handler is sent, given by the handler configuration.
+    Each result in the content of a notification is compared independently of its result index, results equal to a result
+    sent within the last `dedup_window` seconds are removed from the notification and a notification with no results left is discarded,
+    as is a notification exceeding the `rate_limit` of the handler.
+
+    :param notification_config: The configuration of the notification handler.
+    :type notification_config: Any
+    :raises ValueError: If the `rate_limit` or `dedup_window` is invalid.
+    """
+
+    def __init__(self, notification_config: Any):
+        self.name = notification_config.name
+        self.deduplicated = 0
+        self.rate_limited = 0
+
+        rate_limit = getattr(notification_config, "rate_limit", None)
+        self.rate_limit: Optional[TridentNotificationRateLimit] = (
+            TridentNotificationRateLimit(rate_limit) if rate_limit else None
+        )
+
+        self.dedup_window: Optional[float] = getattr(
+            notification_config, "dedup_window", None
+        )
+        if self.dedup_window is not None and (
+            not isinstance(self.dedup_window, (int, float))
+            or isinstance(self.dedup_window, bool)
+            or self.dedup_window <= 0
+        ):
+            raise ValueError(
+                f"Invalid value: '{self.dedup_window}' for: 'dedup_window' of notification: '{self.name}', value must be greater than 0"
+            )
+
+        self._sent: "OrderedDict[AnyStr, float]" = OrderedDict()
+        self._lock = Lock()
+
+    def limit(
+        self, content: Optional[Dict[AnyStr, Any]]
+    ) -> Optional[Dict[AnyStr, Any]]:
+        """Remove the duplicate results from the content of the notification and check if it should be sent,
+        duplicates are removed before the notification takes from the rate limit.
+
+        :param content: JSON parseable content to include in the notification, the results keyed by their result index
+        :type content: Optional[Dict[AnyStr, Any]]
+        :return: The content without the duplicate results, or `None` if the notification should not be sent.
+        :rtype: Optional[Dict[AnyStr, Any]]
+        """
+        if self.rate_limit is None and self.dedup_window is None:
+            return content
+
+        with self._lock:
+            content_hashes = {}
+            if self.dedup_window is not None and isinstance(content, dict):
+                _content = {}
+                for result_index, result in content.items():
+                    content_hash = self._content_hash(result)
+                    if content_hash in content_hashes or self._is_duplicate(
+                        content_hash
+                    ):
+                        self.deduplicated += 1
+                        continue
+
+                    content_hashes[content_hash] = result_index
+                    _content[result_index] = result
+
+                if not _content:
+                    logger.debug(
+                        f"Discarding duplicate notification for handler: '{self.name}'"
+                    )
+                    return None
+
+                content = _content
+
+            if self.rate_limit is not None and not self.rate_limit.acquire():
+                self.rate_limited += 1
+                logger.debug(
+                    f"Discarding notification for handler: '{self.name}' exceeding the rate limit"
+                )
+                return None
+
+            expires = monotonic() + self.dedup_window if content_hashes else None
+            for content_hash in content_hashes:
+                self._sent[content_hash] = expires
+
+            return content
+
+    def _is_duplicate(self, content_hash: AnyStr) -> bool:
+        """Check if an equal result was sent within the window, forgetting the expired results.
+
+        :param content_hash: The hash of the result.
+        :type content_hash: str
+        :return: If the result is a duplicate.
+        :rtype: bool
+        """
+        now = monotonic()
+        while self._sent:
+            _content_hash, expires = next(iter(self._sent.items()))
+            if expires > now:
+                break
+
+            del self._sent[_content_hash]
+
+        return content_hash in self._sent
+
+    def _content_hash(self, result: Any) -> AnyStr:
+        """Hash a result of the notification independently of the order of the keys.
+
+        :param result: The result in the content of the notification.
+        :type result: Any
+        :return: The hash of the result.
+        :rtype: str
+        """
+        return sha256(
+            json.dumps(result, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Notification Outbox
+
+Durable outbox of the notifications that failed to send, retried in the background with exponential backoff.
+@author: Jacob Wahlman
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import time
+import json
+import sqlite3
+
+from typing import Any, AnyStr, Dict, NewType, NoReturn, Optional
+
+TridentNotificationTypeHandler = NewType("TridentNotificationTypeHandler", None)
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+# The longest time in seconds that the retry worker sleeps between checking for due notifications.
+OUTBOX_POLL_INTERVAL = 0.5
+
+# The amount of due notifications that are read from the outbox at a time.
+OUTBOX_READ_SIZE = 100
+
+
+@dataclass
+class TridentNotificationOutboxConfig:
+    """Config for the :class:`TridentNotificationOutbox` of a notification handler, given by the `outbox` section of the handler configuration.
+
+    :param path: The SQLite database file that the failed notifications are stored in.
+    :type path: Path
+    :param max_attempts: The amount of times a notification is attempted in total before it is discarded.
+    :type max_attempts: int
+    :param backoff: The seconds to wait before the first retry, doubled for every retry after that.
+    :type backoff: float
+    :param max_backoff: The longest time in seconds to wait between two retries.
+    :type max_backoff: float
+    :raises ValueError: If any value is invalid.
+    """
+
+    path: Path
+    max_attempts: int
+    backoff: float
+    max_backoff: float
+
+    def __init__(self, outbox: Dict[AnyStr, Any]):
+        if not outbox.get("path"):
+            raise ValueError(f"No 'path' was defined for the outbox: '{outbox}'")
+
+        self.path = Path(outbox["path"])
+        self.max_attempts = outbox.get("max_attempts", 5)
+        self.backoff = outbox.get("backoff", 1.0)
+        self.max_backoff = outbox.get("max_backoff", 300.0)
+
+        if (
+            not isinstance(self.max_attempts, int)
+            or isinstance(self.max_attempts, bool)
+            or self.max_attempts < 2
+        ):
+            raise ValueError(
+                f"Invalid outbox value: '{self.max_attempts}' for: 'max_attempts', value must be an integer greater than 1"
+            )
+
+        for option in ["backoff", "max_backoff"]:
+            value = getattr(self, option)
+            if (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or value <= 0
+            ):
+                raise ValueError(
+                    f"Invalid outbox value: '{value}' for: '{option}', value must be greater than 0"
+                )
+
+    def delay(self, attempts: int) -> float:
+        """Get the seconds to wait before the next attempt of a notification.
+
+        :param attempts: The amount of failed attempts so far.
+        :type attempts: int
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        return min(self.backoff * 2 ** (attempts - 1), self.max_backoff)
+
+
+class TridentNotificationOutbox:
+    """Outbox storing the notifications of a handler that failed to send in a SQLite database until they are sent.
+    A worker thread retries the notifications when they are due, notifications left in the outbox by a previous run
+    are retried as soon as the outbox is opened. Counts the notifications that were drained from the outbox and that failed
+    every attempt. The database can be shared by several handlers, each notification is stored with the key of the
+    handler that added it and is only retried by that handler.
+
+    :param handler: The notification handler used to send the notifications.
+    :type handler: TridentNotificationTypeHandler
+    :param outbox_config: The config of the outbox.
+    :type outbox_config: :class:`TridentNotificationOutboxConfig`
+    """
+
+    def __init__(
+        self,
+        handler: TridentNotificationTypeHandler,
+        outbox_config: TridentNotificationOutboxConfig,
+    ):
+        self.handler = handler
+        self.outbox_config = outbox_config
+        self.drained = 0
+        self.failed = 0
+
+        self._database: Optional[sqlite3.Connection] = None
+        self._database_lock = Lock()
+        self._worker: Optional[Thread] = None
+        self._worker_lock = Lock()
+        self._wakeup = Event()
+        self._stop_event = Event()
+
+        pending = self.pending
+        if pending:
+            logger.info(
+                f"Replaying ({pending}) notification(s) from the outbox of: '{self.name}'"
+            )
+            self._execute(
+                "UPDATE outbox SET next_attempt = ? WHERE handler = ?",
+                (time(), self.key),
+            )
+            self._start_worker()
+
+    @property
+    def name(self) -> AnyStr:
+        """Get the name of the notification handler of this outbox.
+
+        :return: The name of the notification.
+        :rtype: str
+        """
+        return self.handler.notification_config.name
+
+    @property
+    def key(self) -> AnyStr:
+        """Get the key that the notifications of this outbox are stored with, the notification name
+        is shared by the handlers of every type configured for the notification so the type is included.
+
+        :return: The key of the notification handler.
+        :rtype: str
+        """
+        return f"{type(self.handler).__name__}:{self.name}"
+
+    @property
+    def pending(self) -> int:
+        """Get the amount of notifications of the handler in the outbox that have not been sent yet.
+
+        :return: The amount of pending notifications.
+        :rtype: int
+        """
+        return self._execute(
+            "SELECT COUNT(*) FROM outbox WHERE handler = ?", (self.key,)
+        )[0][0]
+
+    def add(self, content: Any, error: Exception) -> NoReturn:
+        """Store a notification that failed to send in the outbox to be retried later.
+
+        :param content: The content of the notification.
+        :type content: Any
+        :param error: The error raised when the notification was sent.
+        :type error: Exception
+        """
+        try:
+            _content = json.dumps(content)
+        except TypeError:
+            self.failed += 1
+            logger.error(
+                f"Notification for: '{self.name}' failed with: {error} and is not JSON serializable so it can't be retried"
+            )
+            return
+
+        self._execute(
+            "INSERT INTO outbox (handler, content, attempts, next_attempt, error) VALUES (?, ?, 1, ?, ?)",
+            (self.key, _content, time() + self.outbox_config.delay(1), str(error)),
+        )
+        logger.warning(
+            f"Notification for: '{self.name}' failed with: {error}, retrying from the outbox"
+        )
+        self._start_worker()
+        self._wakeup.set()
+
+    def close(self) -> NoReturn:
+        """Stop retrying notifications and log the counts of the outbox, pending notifications are kept for the next run."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is not None:
+                self._stop_event.set()
+                self._wakeup.set()
+                worker.join()
+                self._stop_event.clear()
+
+        logger.info(
+            f"Notification outbox of: '{self.name}' drained: ({self.drained}), failed: ({self.failed}), pending: ({self.pending})"
+        )
+        with self._database_lock:
+            if self._database is not None:
+                self._database.close()
+                self._database = None
+
+    def _start_worker(self) -> NoReturn:
+        """Start the retry worker thread if it is not running."""
+        with self._worker_lock:
+            if self._worker is not None:
+                return
+
+            self._worker = Thread(
+                target=self._retry_notifications,
+                name=f"TridentNotificationOutbox-{self.name}",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _retry_notifications(self) -> NoReturn:
+        """Retry the due notifications of the handler until the outbox is closed."""
+        while not self._stop_event.is_set():
+            notifications = self._execute(
+                "SELECT id, content, attempts FROM outbox WHERE handler = ? AND next_attempt <= ? ORDER BY id LIMIT ?",
+                (self.key, time(), OUTBOX_READ_SIZE),
+            )
+            for notification_id, content, attempts in notifications:
+                if self._stop_event.is_set():
+                    return
+
+                self._retry_notification(notification_id, json.loads(content), attempts)
+
+            if notifications:
+                continue
+
+            next_attempt = self._execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE handler = ?", (self.key,)
+            )[0][0]
+            timeout = OUTBOX_POLL_INTERVAL
+            if next_attempt is not None:
+                timeout = max(0, min(next_attempt - time(), OUTBOX_POLL_INTERVAL))
+
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    def _retry_notification(
+        self, notification_id: int, content: Any, attempts: int
+    ) -> NoReturn:
+        """Send a notification from the outbox, removing it if it was sent or failed its last attempt.
+
+        :param notification_id: The id of the notification in the outbox.
+        :type notification_id: int
+        :param content: The content of the notification.
+        :type content: Any
+        :param attempts: The amount of failed attempts so far.
+        :type attempts: int
+        """
+        try:
+            self.handler.send_notification(content=content)
+        except Exception as e:
+            attempts += 1
+            if attempts >= self.outbox_config.max_attempts:
+                self._execute("DELETE FROM outbox WHERE id = ?", (notification_id,))
+                self.failed += 1
+                logger.error(
+                    f"Failed to send notification for handler: '{self.name}' after ({attempts}) attempts due to: {e}"
+                )
+                return
+
+            self._execute(
+                "UPDATE outbox SET attempts = ?, next_attempt = ?, error = ? WHERE id = ?",
+                (
+                    attempts,
+                    time() + self.outbox_config.delay(attempts),
+                    str(e),
+                    notification_id,
+                ),
+            )
+            return
+
+        self._execute("DELETE FROM outbox WHERE id = ?", (notification_id,))
+        self.drained += 1
+
+    def _execute(self, statement: AnyStr, parameters: tuple = ()) -> list:
+        """Execute a statement against the outbox database, opening the database if it is not open.
+
+        :param statement: The SQL statement.
+        :type statement: str
+        :param parameters: The parameters of the statement.
+        :type parameters: tuple
+        :return: The rows returned by the statement.
+        :rtype: list
+        """
+        with self._database_lock:
+            if self._database is None:
+                self.outbox_config.path.parent.mkdir(parents=True, exist_ok=True)
+                self._database = sqlite3.connect(
+                    str(self.outbox_config.path), check_same_thread=False
+                )
+                self._database.execute(
+                    "CREATE TABLE IF NOT EXISTS outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, handler TEXT NOT NULL, "
+                    "content TEXT NOT NULL, attempts INTEGER NOT NULL, next_attempt REAL NOT NULL, error TEXT)"
+                )
+                self._database.execute(
+                    "CREATE INDEX IF NOT EXISTS outbox_handler ON outbox (handler, next_attempt)"
+                )
+
+            with self._database:
+                return self._database.execute(statement, parameters).fetchall()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Notification Connection Pools
+
+Pools of persistent connections reused by the notification handlers for every notification they send.
+@author: Jacob Wahlman
+"""
+
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+import http.client
+import smtplib
+import ssl
+
+from typing import AnyStr, Dict, Iterator, List, NoReturn, Optional, Tuple
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+# Errors raised when a kept-alive HTTP connection was closed by the server while it was idle in the pool.
+HTTP_STALE_CONNECTION_ERRORS = (http.client.BadStatusLine, ConnectionError)
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """Check if the error means that the SMTP session can't be used anymore and has to be reopened.
+    The errors of :mod:`smtplib` are subclasses of :class:`OSError` so only the socket errors and disconnects count.
+
+    :param error: The error raised while using the session.
+    :type error: Exception
+    :return: If the connection of the session failed.
+    :rtype: bool
+    """
+    return isinstance(error, smtplib.SMTPServerDisconnected) or (
+        isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+    )
+
+
+class TridentSMTPConnectionPool:
+    """Pool of SMTP sessions to a single server that are kept open between the notifications.
+    Each session is only used by one thread at a time, sessions that have been idle for longer than `idle_timeout` are closed
+    instead of being reused since most servers drop idle sessions.
+
+    :param smtp_server: The SMTP server address on the form of `host:port`.
+    :type smtp_server: str
+    :param idle_timeout: The seconds that a session may be idle before it is closed.
+    :type idle_timeout: float
+    :param timeout: The timeout in seconds for connecting to and communicating with the server, `None` to use the socket default.
+    :type timeout: Optional[float]
+    """
+
+    def __init__(
+        self,
+        smtp_server: AnyStr,
+        idle_timeout: float = 60.0,
+        timeout: Optional[float] = None,
+    ):
+        self.smtp_server = smtp_server
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        self._sessions: List[Tuple[smtplib.SMTP, float]] = []
+        self._sessions_lock = Lock()
+
+    @contextmanager
+    def session(self) -> Iterator[smtplib.SMTP]:
+        """Borrow an open session from the pool, opening a new session if none is idle.
+        The session is returned to the pool afterwards unless the connection failed.
+
+        :raises Exception: Any error raised while using the session.
+        :yield: The SMTP session.
+        :rtype: Iterator[:class:`smtplib.SMTP`]
+        """
+        session = self._acquire()
+        try:
+            yield session
+        except Exception as e:
+            if _is_connection_error(e):
+                self._close(session)
+                raise e
+
+            # The server rejected the message, reset the transaction so that the session can be reused.
+            try:
+                session.rset()
+            except (smtplib.SMTPException, OSError):
+                self._close(session)
+                raise e
+
+            self._release(session)
+            raise e
+
+        self._release(session)
+
+    def sendmail(
+        self, sender: AnyStr, receivers: List[AnyStr], message: AnyStr
+    ) -> NoReturn:
+        """Send a message using a pooled session, a session that was closed by the server is reopened once.
+
+        :param sender: The sender address.
+        :type sender: str
+        :param receivers: The receiver addresses.
+        :type receivers: List[str]
+        :param message: The message including the headers.
+        :type message: str
+        :raises Exception: If the message could not be sent.
+        """
+        try:
+            with self.session() as session:
+                session.sendmail(sender, receivers, message)
+        except Exception as e:
+            if not _is_connection_error(e):
+                raise e
+
+            logger.debug(
+                f"SMTP session to: '{self.smtp_server}' failed with: {e}, reconnecting"
+            )
+            with self.session() as session:
+                session.sendmail(sender, receivers, message)
+
+    def close(self) -> NoReturn:
+        """Close every idle session in the pool."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+
+        for session, _ in sessions:
+            self._close(session)
+
+    def _acquire(self) -> smtplib.SMTP:
+        """Take the most recently used idle session from the pool or open a new session.
+
+        :return: An open SMTP session.
+        :rtype: :class:`smtplib.SMTP`
+        """
+        expired = []
+        session = None
+        with self._sessions_lock:
+            while self._sessions:
+                _session, last_used = self._sessions.pop()
+                if monotonic() - last_used > self.idle_timeout:
+                    expired.append(_session)
+                    continue
+
+                session = _session
+                break
+
+        for _session in expired:
+            self._close(_session)
+
+        if session is not None:
+            return session
+
+        logger.debug(f"Opening SMTP session to: '{self.smtp_server}'")
+        if self.timeout is None:
+            return smtplib.SMTP(self.smtp_server)
+
+        return smtplib.SMTP(self.smtp_server, timeout=self.timeout)
+
+    def _release(self, session: smtplib.SMTP) -> NoReturn:
+        """Return a session to the pool.
+
+        :param session: The session to return.
+        :type session: :class:`smtplib.SMTP`
+        """
+        with self._sessions_lock:
+            self._sessions.append((session, monotonic()))
+
+    def _close(self, session: smtplib.SMTP) -> NoReturn:
+        """Close a session, ignoring errors since the connection might already be closed.
+
+        :param session: The session to close.
+        :type session: :class:`smtplib.SMTP`
+        """
+        try:
+            session.quit()
+        except (smtplib.SMTPException, OSError):
+            session.close()
+
+
+class TridentHTTPConnectionPool:
+    """Pool of keep-alive HTTP connections that are kept open between the notifications, grouped by destination host.
+    Each connection is only used by one thread at a time, at most `pool_size` idle connections are kept for each host and
+    connections that have been idle for longer than `idle_timeout` are closed instead of being reused.
+
+    :param pool_size: The amount of idle connections kept open for each destination host.
+    :type pool_size: int
+    :param idle_timeout: The seconds that a connection may be idle before it is closed.
+    :type idle_timeout: float
+    :param timeout: The timeout in seconds for connecting to and communicating with the destination, `None` to use the socket default.
+    :type timeout: Optional[float]
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        idle_timeout: float = 60.0,
+        timeout: Optional[float] = None,
+    ):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        self._connections: Dict[
+            Tuple[AnyStr, AnyStr, int], List[Tuple[http.client.HTTPConnection, float]]
+        ] = {}
+        self._connections_lock = Lock()
+        self._ssl_context = None
+
+    def request(
+        self,
+        method: AnyStr,
+        url: AnyStr,
+        headers: Dict[AnyStr, AnyStr],
+        body: Optional[bytes] = None,
+    ) -> bytes:
+        """Send a request using a pooled connection to the host of the URL, the response is always read in full so that
+        the connection can be reused. A reused connection that was closed by the server is reopened once.
+
+        :param method: The HTTP method of the request.
+        :type method: str
+        :param url: The URL to send the request to.
+        :type url: str
+        :param headers: The headers of the request.
+        :type headers: Dict[AnyStr, AnyStr]
+        :param body: The body of the request.
+        :type body: Optional[bytes]
+        :raises HTTPError: If the destination responded with an error status.
+        :raises Exception: If the request could not be sent.
+        :return: The body of the response.
+        :rtype: bytes
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        connection, reused = self._acquire(key)
+        try:
+            response = self._send(connection, method, target, headers, body)
+        except HTTP_STALE_CONNECTION_ERRORS as e:
+            connection.close()
+            if not reused:
+                raise e
+
+            logger.debug(
+                f"HTTP connection to: '{parts.netloc}' was closed with: {e}, reconnecting"
+            )
+            connection = self._connect(key)
+            try:
+                response = self._send(connection, method, target, headers, body)
+            except Exception as e:
+                connection.close()
+                raise e
+        except Exception as e:
+            connection.close()
+            raise e
+
+        data = response.read()
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+
+        return data
+
+    def close(self) -> NoReturn:
+        """Close every idle connection in the pool."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+
+        for _connections in connections.values():
+            for connection, _ in _connections:
+                connection.close()
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        method: AnyStr,
+        target: AnyStr,
+        headers: Dict[AnyStr, AnyStr],
+        body: Optional[bytes],
+    ) -> http.client.HTTPResponse:
+        """Send the request over the connection and wait for the response.
+
+        :param connection: The connection to send the request over.
+        :type connection: :class:`http.client.HTTPConnection`
+        :param method: The HTTP method of the request.
+        :type method: str
+        :param target: The path and query of the request.
+        :type target: str
+        :param headers: The headers of the request.
+        :type headers: Dict[AnyStr, AnyStr]
+        :param body: The body of the request.
+        :type body: Optional[bytes]
+        :return: The response, the body is not read yet.
+        :rtype: :class:`http.client.HTTPResponse`
+        """
+        connection.request(method, target, body=body, headers=headers)
+        return connection.getresponse()
+
+    def _acquire(
+        self, key: Tuple[AnyStr, AnyStr, int]
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take the most recently used idle connection to the host from the pool or open a new connection.
+
+        :param key: The scheme, host and port of the destination.
+        :type key: Tuple[AnyStr, AnyStr, int]
+        :return: The connection and if it was reused from the pool.
+        :rtype: Tuple[:class:`http.client.HTTPConnection`, bool]
+        """
+        expired = []
+        connection = None
+        with self._connections_lock:
+            connections = self._connections.get(key, [])
+            while connections:
+                _connection, last_used = connections.pop()
+                if monotonic() - last_used > self.idle_timeout:
+                    expired.append(_connection)
+                    continue
+
+                connection = _connection
+                break
+
+        for _connection in expired:
+            _connection.close()
+
+        if connection is not None:
+            return connection, True
+
+        return self._connect(key), False
+
+    def _connect(
+        self, key: Tuple[AnyStr, AnyStr, int]
+    ) -> http.client.HTTPConnection:
+        """Create a new connection to the host, the connection is opened when the first request is sent.
+
+        :param key: The scheme, host and port of the destination.
+        :type key: Tuple[AnyStr, AnyStr, int]
+        :return: The new connection.
+        :rtype: :class:`http.client.HTTPConnection`
+        """
+        scheme, host, port = key
+        logger.debug(f"Opening HTTP connection to: '{scheme}://{host}'")
+        kwargs = {} if self.timeout is None else {"timeout": self.timeout}
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+
+            return http.client.HTTPSConnection(
+                host, port, context=self._ssl_context, **kwargs
+            )
+
+        return http.client.HTTPConnection(host, port, **kwargs)
+
+    def _release(
+        self,
+        key: Tuple[AnyStr, AnyStr, int],
+        connection: http.client.HTTPConnection,
+    ) -> NoReturn:
+        """Return a connection to the pool, the connection is closed instead if the pool of the host is full.
+
+        :param key: The scheme, host and port of the destination.
+        :type key: Tuple[AnyStr, AnyStr, int]
+        :param connection: The connection to return.
+        :type connection: :class:`http.client.HTTPConnection`
+        """
+        with self._connections_lock:
+            connections = self._connections.setdefault(key, [])
+            if len(connections) < self.pool_size:
+                connections.append((connection, monotonic()))
+                return
+
+        connection.close()
@@ -72,6 +72,21 @@ class TridentArgumentParser:
             help="Specify the maximum number of workers to run concurrently in Trident."
             " Defaults to '1' which means Trident will run all plugins sequentially. Must be a positive integer.",
         )
+        group.add_argument(
+            "-e",
+            "--executor",
+            type=str,
+            choices=["thread", "process"],
+            help="Run the plugins in threads or in a pool of processes, use 'process' for CPU-bound plugins.",
+            default=None,
+        )
+        group.add_argument(
+            "-S",
+            "--scheduler",
+            action="store_true",
+            help="Keep running the plugins according to the 'schedule' of each plugin until interrupted.",
+            default=None,
+        )
 
     def _collect_plugin_arguments(self) -> NoReturn:
         """Define the arguments applied on all the plugins in Trident."""
@@ -82,6 +97,21 @@ class TridentArgumentParser:
         group.add_argument(
             "-p:f", "--filter-results", type=str, nargs="+", help="Filter "
         )
+        group.add_argument(
+            "-p:m",
+            "--filter-mode",
+            type=str,
+            choices=["match", "search", "fullmatch"],
+            help="How the filter patterns are matched against the results.",
+            default=None,
+        )
+        group.add_argument(
+            "-p:b",
+            "--batch-size",
+            type=int,
+            help="The amount of results pulled from the plugin and evaluated at a time.",
+            default=None,
+        )
 
     def _collect_storage_arguments(self) -> NoReturn:
         """Define the arguments used to define the storage behaviour."""
@@ -94,6 +124,23 @@ class TridentArgumentParser:
             help="Path to where on the filesystem to store the Trident store.",
             default=None,
         )
+        arg_group.add_argument(
+            "-s:b",
+            "--store-backend",
+            dest="backend",
+            type=str,
+            choices=["json", "jsonl", "sqlite"],
+            help="The format of the Trident store, 'jsonl' appends each result to the store as it arrives and 'sqlite' inserts each result into an SQLite database.",
+            default=None,
+        )
+        arg_group.add_argument(
+            "-s:c",
+            "--compact-store",
+            type=str,
+            metavar="PATH",
+            help="Compact the 'jsonl' or 'sqlite' store at the path into a 'json' store next to it and exit.",
+            default=None,
+        )
 
         group = arg_group.add_mutually_exclusive_group()
         group.add_argument(
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Result Filter
+
+Matches the results of a runner against the `filter_results` patterns of the runner.
+@author: Jacob Wahlman
+"""
+
+from dataclasses import dataclass
+import re
+
+from typing import Any, AnyStr, FrozenSet, List, Optional, Pattern, Tuple
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+FILTER_MODES = ["match", "search", "fullmatch"]
+
+# Patterns without any of these characters only match themselves and are matched without the `re` module.
+_REGEX_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Patterns referring to their own groups can't be combined since the group numbers change in the alternation.
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+@dataclass
+class TridentResultFilter:
+    """Filter compiled once from the `filter_results` patterns of a runner.
+    The regular expressions are combined into a single alternation and the plain string patterns are matched as literals,
+    so each result is only matched once regardless of the amount of patterns.
+
+    :param patterns: The patterns in the form of regular expressions (`re` in `Python`).
+    :type patterns: List[str]
+    :param mode: How the patterns are matched against a result, either `match` (default) from the start of the result,
+        `search` anywhere in the result or `fullmatch` against the whole result.
+    :type mode: str
+    :raises ValueError: If the mode is not supported.
+    :raises re.error: If any pattern is not a valid regular expression.
+    """
+
+    patterns: List[AnyStr]
+    mode: str
+
+    def __init__(self, patterns: List[AnyStr], mode: str = "match"):
+        if mode not in FILTER_MODES:
+            raise ValueError(
+                f"Unsupported filter mode: '{mode}', expected any of: {FILTER_MODES}"
+            )
+
+        self.patterns = patterns
+        self.mode = mode
+
+        # Empty patterns only produce empty matches which never count as a match.
+        patterns = [pattern for pattern in patterns if pattern]
+        if mode == "search":
+            literals, expressions = [], patterns
+        else:
+            literals = [
+                pattern
+                for pattern in patterns
+                if _REGEX_CHARACTERS.isdisjoint(pattern)
+            ]
+            expressions = [pattern for pattern in patterns if pattern not in literals]
+
+        self._literals: Tuple[str, ...] = tuple(literals)
+        self._literals_set: FrozenSet[str] = frozenset(literals)
+        self._expressions: List[Pattern] = [
+            re.compile(expression) for expression in expressions
+        ]
+        self._expression: Optional[Pattern] = self._combine_expressions(expressions)
+
+    def match(self, result: Any) -> bool:
+        """Match the result against the patterns, results that are not strings are matched by their string representation.
+
+        :param result: The result to match.
+        :type result: Any
+        :return: If the result matched any of the patterns.
+        :rtype: bool
+        """
+        _result = result if isinstance(result, (str, bytes)) else str(result)
+
+        if self._literals:
+            if self.mode == "match" and _result.startswith(self._literals):
+                return True
+
+            if self.mode == "fullmatch" and _result in self._literals_set:
+                return True
+
+        if self._expression is not None:
+            match = getattr(self._expression, self.mode)(_result)
+            if match is None:
+                return False
+
+            if match.group(0):
+                return True
+
+            # The first alternative that matched was empty, another alternative might still match.
+
+        for expression in self._expressions:
+            match = getattr(expression, self.mode)(_result)
+            if match is not None and match.group(0):
+                return True
+
+        return False
+
+    def _combine_expressions(self, expressions: List[AnyStr]) -> Optional[Pattern]:
+        """Combine the regular expressions into a single alternation.
+
+        :param expressions: The regular expressions to combine.
+        :type expressions: List[str]
+        :return: The compiled alternation, `None` if there are no expressions or they can't be combined.
+        :rtype: Optional[Pattern]
+        """
+        if not expressions or any(
+            _GROUP_REFERENCE.search(expression) for expression in expressions
+        ):
+            return None
+
+        try:
+            return re.compile(
+                "|".join(f"(?:{expression})" for expression in expressions)
+            )
+        except re.error as e:
+            # For example inline flags or group names used by several patterns.
+            logger.debug(
+                f"Failed to combine the filter patterns, matching each pattern separately due to: {e}"
+            )
+            return None
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Plugin Registry
+
+Resolves the plugin modules, plugin classes and step methods used by the runners once and caches them.
+@author: Jacob Wahlman
+"""
+
+from dataclasses import dataclass
+from importlib import import_module
+from inspect import Parameter, signature
+from threading import Lock
+
+from typing import Any, AnyStr, Callable, Dict, FrozenSet, NewType, Tuple
+
+Module = NewType("Module", object)
+PluginClass = NewType("PluginClass", object)
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+
+@dataclass
+class TridentCallPlan:
+    """The parameters of a plugin method or step method, computed once from the signature and reused for every call.
+
+    :param method_reference: The method or function to compute the call plan for.
+    :type method_reference: Callable
+    :param parameters: The names of the parameters that can be passed as keyword arguments.
+    :type parameters: FrozenSet[str]
+    :param thread_event: If the method defines the `thread_event` parameter.
+    :type thread_event: bool
+    """
+
+    parameters: FrozenSet[str]
+    thread_event: bool
+
+    def __init__(self, method_reference: Callable):
+        method_parameters = signature(method_reference).parameters.values()
+        self.parameters = frozenset(
+            parameter.name
+            for parameter in method_parameters
+            if parameter.kind
+            in [Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY]
+        )
+        self.thread_event = "thread_event" in self.parameters
+
+    def accepts(self, name: AnyStr) -> bool:
+        """Check if an argument with the name is passed to the method.
+
+        :param name: The name of the argument.
+        :type name: str
+        :return: If the argument is passed.
+        :rtype: bool
+        """
+        return name in self.parameters
+
+    def arguments(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Filter out any parameters that can't be passed to the method, only the named parameters are passed even if it accepts `**kwargs`.
+
+        :param parameters: The parameters to be filtered before being passed.
+        :type parameters: Dict[str, Any]
+        :return: The parameters to pass to the method.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            key: value for key, value in parameters.items() if key in self.parameters
+        }
+
+
+class TridentPluginRegistry:
+    """Registry of the modules, plugin classes and methods used by the runners of a :class:`TridentDaemon`.
+    Each module path and attribute is only resolved once and the call plans of the methods are cached,
+    so configurations with many plugins using the same modules don't import and inspect them for every runner.
+    """
+
+    def __init__(self):
+        self._modules: Dict[AnyStr, Module] = {}
+        self._attributes: Dict[Tuple[AnyStr, AnyStr], Any] = {}
+        self._call_plans: Dict[Tuple[Any, bool], TridentCallPlan] = {}
+        self._lock = Lock()
+
+    def resolve_module(self, module_path: AnyStr) -> Module:
+        """Import the module given the path, relative paths are resolved from the runner package.
+
+        :param module_path: The path to the module.
+        :type module_path: str
+        :return: The imported module.
+        :rtype: Module
+        """
+        module = self._modules.get(module_path)
+        if module is None:
+            module = import_module(module_path, package=__package__)
+            with self._lock:
+                self._modules[module_path] = module
+
+        return module
+
+    def resolve(self, module_path: AnyStr, name: AnyStr) -> Any:
+        """Resolve an attribute, like a plugin class or a method, of the module given the path.
+
+        :param module_path: The path to the module.
+        :type module_path: str
+        :param name: The name of the attribute in the module.
+        :type name: str
+        :raises ValueError: If the module has no attribute with the name.
+        :return: The attribute.
+        :rtype: Any
+        """
+        key = (module_path, name)
+        if key in self._attributes:
+            return self._attributes[key]
+
+        module = self.resolve_module(module_path)
+        if not hasattr(module, name):
+            raise ValueError(
+                f"Failed to find a class or method named: '{name}' in module: '{module_path}'"
+            )
+
+        attribute = getattr(module, name)
+        with self._lock:
+            self._attributes[key] = attribute
+
+        return attribute
+
+    def resolve_method(self, method_path: AnyStr) -> Callable:
+        """Resolve a method given the path to the module followed by the name of the method, like `module.method`.
+
+        :param method_path: The path to the method.
+        :type method_path: str
+        :raises ValueError: If the module has no method with the name.
+        :return: The method.
+        :rtype: Callable
+        """
+        module_path, _, method_name = method_path.rpartition(".")
+        return self.resolve(module_path, method_name)
+
+    def create_plugin(self, plugin_path: AnyStr, plugin_name: AnyStr) -> PluginClass:
+        """Create a new instance of the plugin class, every runner gets an instance of its own.
+
+        :param plugin_path: The path to the plugin module.
+        :type plugin_path: str
+        :param plugin_name: The name of the plugin class in the module.
+        :type plugin_name: str
+        :raises ValueError: If the module has no class with the name.
+        :return: The plugin instance.
+        :rtype: PluginClass
+        """
+        return self.resolve(plugin_path, plugin_name)()
+
+    def call_plan(self, method_reference: Callable) -> TridentCallPlan:
+        """Get the call plan of the method, cached by the underlying function so that the bound methods of
+        every instance of a plugin class share the same call plan.
+
+        :param method_reference: The method or function.
+        :type method_reference: Callable
+        :return: The call plan of the method.
+        :rtype: :class:`TridentCallPlan`
+        """
+        key = (
+            getattr(method_reference, "__func__", method_reference),
+            hasattr(method_reference, "__func__"),
+        )
+        call_plan = self._call_plans.get(key)
+        if call_plan is None:
+            call_plan = TridentCallPlan(method_reference)
+            with self._lock:
+                self._call_plans[key] = call_plan
+
+        return call_plan
@@ -7,11 +7,17 @@ Runs and controls the execution of a valid plugin.
 @author: Jacob Wahlman
 """
 
-from threading import Event
-from inspect import signature
+from threading import Event, Thread
+from inspect import (
+    isasyncgen,
+    isasyncgenfunction,
+    iscoroutine,
+    iscoroutinefunction,
+    signature,
+)
 from dataclasses import dataclass
 from importlib import import_module
-import re
+from pathlib import Path
 
 from typing import (
     NewType,
@@ -24,21 +30,107 @@ from typing import (
     Generator,
     Tuple,
     AnyStr,
+    AsyncGenerator,
+    Set,
 )
 
 Module = NewType("Module", object)
 PluginClass = NewType("PluginClass", object)
 
+from collections.abc import Iterator
+import asyncio
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from multiprocessing.managers import SyncManager
+from queue import Empty, Full, Queue
 from types import GeneratorType, MethodType
 import logging
 
 logger = logging.getLogger("__main__")
 
-from trident.lib.daemon.data_storage import TridentDataDaemonConfig, TridentDataDaemon
+from trident.lib.daemon.data_storage import (
+    TridentDataDaemonConfig,
+    TridentDataDaemon,
+    TridentStoreWriter,
+)
 from trident.lib.daemon.notification import (
     TridentNotificationDaemonConfig,
     TridentNotificationDaemon,
 )
+from trident.lib.runner.filter import TridentResultFilter
+from trident.lib.runner.registry import TridentCallPlan, TridentPluginRegistry
+
+
+RUNNER_EXECUTORS = ["thread", "process"]
+
+# The interval in seconds that a runner checks the thread event while waiting for results from a plugin process.
+PROCESS_POLL_INTERVAL = 0.1
+
+# The amount of results a streaming step can be ahead of the step reading the stream.
+STEP_STREAM_BUFFER_SIZE = 100
+
+# The interval in seconds that a streaming step checks if the stream was cancelled while the stream is full.
+STEP_STREAM_POLL_INTERVAL = 0.1
+
+# Marks the end of the results in a :class:`TridentStepStream`.
+_STREAM_END = object()
+
+
+def _execute_plugin_process(
+    plugin_path: str,
+    plugin_name: str,
+    plugin_args: Dict[str, Any],
+    plugin_state: Optional[Dict[Union[str, int], Any]],
+    batch_size: int,
+    results_queue: Queue,
+    process_event: Event,
+) -> Optional[Dict[Union[str, int], Any]]:
+    """Execute a plugin in a process of the process pool, the results are put on the queue in chunks of `batch_size`.
+    The plugin is initialized from the module in the process, so the plugin and the results must be picklable.
+
+    :param plugin_path: The path to the plugin used.
+    :type plugin_path: str
+    :param plugin_name: The name of the plugin used.
+    :type plugin_name: str
+    :param plugin_args: The sanitized arguments to pass to the plugin.
+    :type plugin_args: Dict[str, Any]
+    :param plugin_state: The state to load in the plugin before executing, `None` to not load any state.
+    :type plugin_state: Optional[Dict[Union[str, int], Any]]
+    :param batch_size: The amount of results to put on the queue at a time.
+    :type batch_size: int
+    :param results_queue: The queue shared with the runner to put the results on.
+    :type results_queue: :class:`queue.Queue`
+    :param process_event: The event shared with the runner used to signal to the plugin that it should exit.
+    :type process_event: :class:`threading.Event`
+    :return: The state of the plugin after executing, `None` if the plugin has no state.
+    :rtype: Optional[Dict[Union[str, int], Any]]
+    """
+    plugin_module = import_module(plugin_path, package=__package__)
+    plugin_instance = getattr(plugin_module, plugin_name)()
+    if plugin_state is not None:
+        plugin_instance.plugin_state = plugin_state
+
+    if "thread_event" in signature(plugin_instance.execute_plugin).parameters:
+        plugin_args = {**plugin_args, "thread_event": process_event}
+
+    results = plugin_instance.execute_plugin(**plugin_args)
+    if isinstance(results, Iterator):
+        while True:
+            chunk = list(islice(results, batch_size))
+            if not chunk:
+                break
+
+            results_queue.put(chunk)
+    elif results is not None:
+        results_queue.put([results])
+
+    return getattr(plugin_instance, "plugin_state", None)
 
 
 class _TridentDefaultRunnerConfig:
@@ -56,9 +148,39 @@ class _TridentDefaultRunnerConfig:
         if "filter_results" not in runner_config:
             runner_config["filter_results"] = []
 
+        if "filter_mode" not in runner_config:
+            runner_config["filter_mode"] = "match"
+
+        if "batch_size" not in runner_config:
+            runner_config["batch_size"] = 1
+
+        if "executor" not in runner_config:
+            runner_config["executor"] = None
+
+        if "parallel_steps" not in runner_config:
+            runner_config["parallel_steps"] = False
+
+        if runner_config["executor"] not in [None, *RUNNER_EXECUTORS]:
+            raise ValueError(
+                f"Unsupported executor: '{runner_config['executor']}', expected any of: {RUNNER_EXECUTORS}"
+            )
+
+        if not isinstance(runner_config["batch_size"], int) or runner_config[
+            "batch_size"
+        ] < 1:
+            raise ValueError(
+                f"Invalid batch size: '{runner_config['batch_size']}', value must be an integer greater than 0"
+            )
+
         for arg, value in runner_config.items():
             setattr(self, arg, value)
 
+        self.result_filter = (
+            TridentResultFilter(self.filter_results, self.filter_mode)
+            if self.filter_results
+            else None
+        )
+
     def _resolve_plugin_name(self) -> AnyStr:
         """Construct the name of the plugin from the plugin path.
         Converts the path to the plugin to the expected name of the class in the plugin module.
@@ -87,13 +209,10 @@ class _TridentDefaultRunnerConfig:
         :rtype: (PluginClass, Module)
         """
         try:
-            plugin_module, plugin_instance = None, None
-            plugin_module = import_module(plugin_path, package=__package__)
-            if plugin_name not in dir(plugin_module):
-                raise ValueError(
-                    f"Failed to find a class named: '{plugin_name}' in module: '{plugin_path}'"
-                )
-            plugin_instance = getattr(plugin_module, plugin_name)()
+            plugin_module = self.plugin_registry.resolve_module(plugin_path)
+            plugin_instance = self.plugin_registry.create_plugin(
+                plugin_path, plugin_name
+            )
 
             return plugin_instance, plugin_module
         except Exception as e:
@@ -103,20 +222,16 @@ class _TridentDefaultRunnerConfig:
             raise e
 
     def _sanitize_parameters(
-        self, parameters: Dict[str, Any], method_reference: MethodType
+        self, parameters: Dict[str, Any], call_plan: TridentCallPlan
     ) -> Dict[str, Any]:
         """Sanitize and filter out any parameters that can't be passed to the given plugin.
 
         :param parameters: The parameters to be filtered before being passed
         :type parameters: Dict[str, Any]
-        :param method_reference: The reference of the method to filter parameters for
-        :type method_reference: MethodType
+        :param call_plan: The call plan of the method to filter parameters for
+        :type call_plan: :class:`TridentCallPlan`
         """
-        return {
-            key: value
-            for key, value in parameters.items()
-            if key in signature(method_reference).parameters.keys()
-        }
+        return call_plan.arguments(parameters)
 
 
 @dataclass
@@ -134,12 +249,18 @@ class TridentRunnerConfig(_TridentDefaultRunnerConfig):
     :type plugin_module: object
     :param plugin_instance: An instance of the plugin class found in the module.
     :type plugin_instance: object
-    :param resource_queues: Queue used to register access to a resource shared between runners to avoid conflicts.
-    :type resource_queues: dict
+    :param call_plan: The call plan of the plugin method `execute_plugin`, computed once for every run of the plugin.
+    :type call_plan: :class:`TridentCallPlan`
+    :param store_writers: The store writers shared between runners by store path, runners using the same store share the same writer.
+    :type store_writers: dict
+    :param plugin_registry: The registry resolving the plugins shared between runners, a registry of its own is created if `None`.
+    :type plugin_registry: Optional[:class:`TridentPluginRegistry`]
     :param dont_store_on_error: If the runner should store the results accumulated before exiting if an error occured.
     :type dont_store_on_error: bool
     :param thread_event: The event flag used to signal to the plugin that it should exit.
     :type thread_event: :class:`threading.Event`
+    :param state_loaded: If the checkpoint state has been loaded into the plugin, the state is only loaded for the first run of the plugin.
+    :type state_loaded: bool
     """
 
     plugin_path: str
@@ -147,8 +268,11 @@ class TridentRunnerConfig(_TridentDefaultRunnerConfig):
     plugin_args: Dict[str, Any]
     plugin_module: object
     plugin_instance: object
-    resource_queues: Dict[str, List[str]]
+    call_plan: TridentCallPlan
+    store_writers: Dict[Path, TridentStoreWriter]
+    plugin_registry: TridentPluginRegistry
     thread_event: Event
+    state_loaded: bool
 
     def __init__(
         self,
@@ -159,16 +283,21 @@ class TridentRunnerConfig(_TridentDefaultRunnerConfig):
         checkpoint_config: Dict[str, Any],
         runner_config: Union[Dict[str, Any], None],
         notification_config: Dict[str, Any],
-        resource_queues: Dict[str, List[str]],
+        store_writers: Dict[Path, TridentStoreWriter],
+        plugin_registry: Optional[TridentPluginRegistry] = None,
     ):
         self.plugin_path = plugin_path
         self.plugin_args = plugin_args
         self.store_config = store_config
         self.checkpoint_config = checkpoint_config
         self.notification_config = notification_config
-        self.resource_queues = resource_queues
+        self.store_writers = store_writers
+        self.plugin_registry = (
+            plugin_registry if plugin_registry is not None else TridentPluginRegistry()
+        )
 
         self.thread_event = Event()
+        self.state_loaded = False
 
         if runner_config is not None:
             self._apply_runner_config(runner_config)
@@ -177,12 +306,19 @@ class TridentRunnerConfig(_TridentDefaultRunnerConfig):
         self.plugin_instance, self.plugin_module = self._initialize_runner_plugin(
             self.plugin_path, self.plugin_name
         )
+        self.call_plan = (
+            self.plugin_registry.call_plan(self.plugin_instance.execute_plugin)
+            if hasattr(self.plugin_instance, "execute_plugin")
+            else None
+        )
 
 
 class _TridentDefaultRunner:
     """Trident runner class containing common functionality."""
 
     is_running: bool = False
+    process_executor: Optional[ProcessPoolExecutor] = None
+    process_manager: Optional[SyncManager] = None
 
     def _initialize_data_daemon(self) -> TridentDataDaemon:
         """Initialize the :class:`TridentDataDaemon` connected to this runner from the :class:`TridentDataDaemonConfig`.
@@ -222,6 +358,9 @@ class _TridentDefaultRunner:
                 store_path=store_path,
                 store_name=self.runner_id,
                 checkpoint_path=checkpoint_path,
+                store_backend=self.runner_config.store_config.get("backend", "json"),
+                flush_policy=self.runner_config.store_config.get("flush"),
+                store_writers=self.runner_config.store_writers,
             )
             return TridentDataDaemon(daemon_config=trident_data_config)
         except Exception as e:
@@ -254,6 +393,7 @@ class _TridentDefaultRunner:
         runner_config: TridentRunnerConfig,
         variables: Optional[Dict[str, Any]] = None,
         variable_key: Optional[str] = None,
+        plugin_args: Optional[Dict[str, Any]] = None,
     ) -> NoReturn:
         """Start an initialized plugin by calling the method `execute_plugin` with the provided arguments.
         This method is called when the plugin is a normal runner.
@@ -264,49 +404,29 @@ class _TridentDefaultRunner:
         :type variables: Optional[Dict[str, Any]], optional
         :param variable_key: If a specific variable key is needed to store the results for, if `None` it defaults to the index, defaults to None
         :type variable_key: Optional[str], optional
+        :param plugin_args: The arguments to pass to the plugin for this run, like the arguments and variables of a step, defaults to the `plugin_args` of the configuration
+        :type plugin_args: Optional[Dict[str, Any]], optional
         :raises Exception: Re-raised exceptions that occurs in the plugin.
         """
         if not hasattr(runner_config.plugin_instance, "execute_plugin"):
             raise RuntimeError("Entry method 'execute_plugin' not defined.")
 
         self.is_running = True
-        if hasattr(runner_config.plugin_instance, "plugin_state"):
-            if runner_config.plugin_instance.__class__.plugin_state.fset is None:
-                logger.warning(
-                    f"Checkpoint data: '{self.data_daemon.daemon_config.checkpoint_path}' was found for runner: '{self.runner_id}' but no load state method was defined"
-                )
-            else:
-                _state = self.data_daemon.load_state_checkpoint()
-                if _state is None:
-                    logger.warning(
-                        f"Checkpoint data: '{self.data_daemon.daemon_config.checkpoint_path}' was empty for runner: '{self.runner_id}'"
-                    )
-                else:
-                    self.runner_state = _state
+        self._load_plugin_state(runner_config)
 
         try:
             _plugins_args = runner_config._sanitize_parameters(
-                parameters=runner_config.plugin_args,
-                method_reference=runner_config.plugin_instance.execute_plugin,
+                parameters=runner_config.plugin_args
+                if plugin_args is None
+                else plugin_args,
+                call_plan=runner_config.call_plan,
             )
-            # The thread event is used to allow the daemon to stop already started plugins.
-            if (
-                "thread_event"
-                not in signature(
-                    runner_config.plugin_instance.execute_plugin
-                ).parameters
-            ):
-                logger.warning(
-                    f"Thread event parameter not specified in 'execute_plugin' method for plugin: '{runner_config.plugin_name}' at '{runner_config.plugin_path}'"
-                )
-                runner_generator = runner_config.plugin_instance.execute_plugin(
-                    **_plugins_args
+            if self.process_executor is not None:
+                runner_generator = self._start_plugin_process(
+                    runner_config, _plugins_args
                 )
             else:
-                runner_generator = runner_config.plugin_instance.execute_plugin(
-                    thread_event=runner_config.thread_event,
-                    **_plugins_args,
-                )
+                runner_generator = self._execute_plugin(runner_config, _plugins_args)
 
             if runner_generator is not None:
                 try:
@@ -315,6 +435,10 @@ class _TridentDefaultRunner:
                     )
                 except Exception as e:
                     raise e
+                finally:
+                    if self.process_executor is not None:
+                        # Signals the plugin process to stop if the results were not consumed until the end.
+                        runner_generator.close()
             else:
                 logger.warning(
                     f"No results were returned from the plugin: '{self.runner_id}'"
@@ -326,50 +450,205 @@ class _TridentDefaultRunner:
 
         self.is_running = False
 
-    def _evaluate_result(self, result: Any, result_index: int) -> NoReturn:
-        """Evaluate the result yielded/returned from the plugin for each iteration.
+    def _load_plugin_state(self, runner_config: TridentRunnerConfig) -> NoReturn:
+        """Load the state from the checkpoint of the runner into the plugin if the plugin defines a state.
+        The state is only loaded for the first run, later runs of the same plugin keep the state of the previous run.
 
-        :param result: The result returned from the plugin.
-        :type result: Any
-        :param result_index: The iteration index that the result was returned.
-        :type result_index: int
-        :raises Exception: If any error occur when storing the result.
+        :param runner_config: The trident plugin runner configuration detailing the plugin to use and more
+        :type runner_config: :class:`TridentRunnerConfig`
         """
-        if self.data_daemon is None or self.runner_config.thread_event.is_set():
+        if runner_config.state_loaded or not hasattr(
+            runner_config.plugin_instance, "plugin_state"
+        ):
             return
 
-        if self.runner_config.filter_results:
-            for pattern in self.runner_config.filter_results:
-                if not isinstance(result, (str, bytes)):
-                    _result = str(result)
+        runner_config.state_loaded = True
 
-                    if not isinstance(_result, (str, bytes)):
-                        logger.warning(
-                            f"Result was not of type string so couldn't match any patterns for runner: '{self.runner_id}'"
-                        )
-                        break
-                else:
-                    _result = result
+        if runner_config.plugin_instance.__class__.plugin_state.fset is None:
+            logger.warning(
+                f"Checkpoint data: '{self.data_daemon.daemon_config.checkpoint_path}' was found for runner: '{self.runner_id}' but no load state method was defined"
+            )
+            return
 
-                match = re.match(pattern, _result)
-                if match is not None and match.group(0):
-                    logger.debug(
-                        f"Result: '{_result}' matched pattern: '{pattern}' for runner: '{self.runner_id}'"
-                    )
+        _state = self.data_daemon.load_state_checkpoint()
+        if _state is None:
+            logger.warning(
+                f"Checkpoint data: '{self.data_daemon.daemon_config.checkpoint_path}' was empty for runner: '{self.runner_id}'"
+            )
+        else:
+            self.runner_state = _state
+
+    def _execute_plugin(
+        self, runner_config: TridentRunnerConfig, plugin_args: Dict[str, Any]
+    ) -> Any:
+        """Call the plugin method `execute_plugin` with the arguments and the thread event of the runner.
+        The thread event is used to allow the daemon to stop already started plugins and is only passed if the plugin accepts it.
+
+        :param runner_config: The trident plugin runner configuration detailing the plugin to use and more
+        :type runner_config: :class:`TridentRunnerConfig`
+        :param plugin_args: The sanitized arguments to pass to the plugin.
+        :type plugin_args: Dict[str, Any]
+        :return: The generator, asynchronous generator, coroutine or value returned from the plugin.
+        :rtype: Any
+        """
+        if not self._accepts_thread_event(runner_config):
+            return runner_config.plugin_instance.execute_plugin(**plugin_args)
+
+        return runner_config.plugin_instance.execute_plugin(
+            thread_event=runner_config.thread_event, **plugin_args
+        )
+
+    def _accepts_thread_event(self, runner_config: TridentRunnerConfig) -> bool:
+        """Check if the plugin method `execute_plugin` accepts the thread event, warns if it does not.
+
+        :param runner_config: The trident plugin runner configuration detailing the plugin to use and more
+        :type runner_config: :class:`TridentRunnerConfig`
+        :return: If the `thread_event` parameter is defined for `execute_plugin`.
+        :rtype: bool
+        """
+        if runner_config.call_plan.thread_event:
+            return True
+
+        logger.warning(
+            f"Thread event parameter not specified in 'execute_plugin' method for plugin: '{runner_config.plugin_name}' at '{runner_config.plugin_path}'"
+        )
+        return False
+
+    def _start_plugin_process(
+        self, runner_config: TridentRunnerConfig, plugin_args: Dict[str, Any]
+    ) -> Generator[Any, None, None]:
+        """Start the plugin in a process of the process pool of the :class:`TridentDaemon` and return a generator
+        of the results streamed back from the process, so the results are evaluated in this process as usual.
+
+        :param runner_config: The trident plugin runner configuration detailing the plugin to use and more
+        :type runner_config: :class:`TridentRunnerConfig`
+        :param plugin_args: The sanitized arguments to pass to the plugin.
+        :type plugin_args: Dict[str, Any]
+        :return: Generator of the results returned from the plugin.
+        :rtype: Generator[Any, None, None]
+        """
+        self._accepts_thread_event(runner_config)
+        results_queue = self.process_manager.Queue()
+        process_event = self.process_manager.Event()
+        future = self.process_executor.submit(
+            _execute_plugin_process,
+            runner_config.plugin_path,
+            runner_config.plugin_name,
+            plugin_args,
+            self.runner_state,
+            getattr(self.runner_config, "batch_size", 1),
+            results_queue,
+            process_event,
+        )
+        logger.debug(
+            f"Started plugin: '{runner_config.plugin_name}' in a process for runner: '{self.runner_id}'"
+        )
+        return self._receive_plugin_results(
+            runner_config, future, results_queue, process_event
+        )
+
+    def _receive_plugin_results(
+        self,
+        runner_config: TridentRunnerConfig,
+        future: Future,
+        results_queue: Queue,
+        process_event: Event,
+    ) -> Generator[Any, None, None]:
+        """Yield the results streamed back from a plugin running in a process until the process has finished.
+        The thread event of the runner is forwarded to the event shared with the process.
+
+        :param runner_config: The trident plugin runner configuration detailing the plugin to use and more
+        :type runner_config: :class:`TridentRunnerConfig`
+        :param future: The future of the plugin process.
+        :type future: :class:`concurrent.futures.Future`
+        :param results_queue: The queue that the process puts the chunks of results on.
+        :type results_queue: :class:`queue.Queue`
+        :param process_event: The event used to signal to the plugin in the process that it should exit.
+        :type process_event: :class:`threading.Event`
+        :raises Exception: The exception raised by the plugin in the process.
+        :yield: The results returned from the plugin.
+        :rtype: Generator[Any, None, None]
+        """
+        try:
+            while True:
+                if runner_config.thread_event.is_set():
                     break
-            else:
-                logger.warning(
-                    f"Result: '{result}' did not match any pattern(s) for runner: '{self.runner_id}'"
-                )
-                return
+
+                try:
+                    results = results_queue.get(timeout=PROCESS_POLL_INTERVAL)
+                except Empty:
+                    if not future.done():
+                        continue
+
+                    # Every result has been put on the queue by the time the process has finished.
+                    while not results_queue.empty():
+                        yield from results_queue.get()
+
+                    _state = future.result()
+                    if _state is not None and hasattr(
+                        runner_config.plugin_instance, "plugin_state"
+                    ):
+                        if runner_config.plugin_instance.__class__.plugin_state.fset:
+                            runner_config.plugin_instance.plugin_state = _state
+
+                    return
+
+                yield from results
+        finally:
+            process_event.set()
+
+    def _evaluate_results(self, results: List[Any], results_index: int) -> NoReturn:
+        """Evaluate a chunk of results yielded/returned from the plugin.
+        The chunk is filtered, stored and notified as one operation to amortize the overhead of each result.
+
+        :param results: The results returned from the plugin.
+        :type results: List[Any]
+        :param results_index: The iteration index that the first result in the chunk was returned.
+        :type results_index: int
+        :raises Exception: If any error occur when storing the results.
+        """
+        if (
+            not results
+            or self.data_daemon is None
+            or self.runner_config.thread_event.is_set()
+        ):
+            return
+
+        _results = {}
+        for result_index, result in enumerate(results, start=results_index):
+            if self.runner_config.result_filter is not None and not self._filter_result(
+                result
+            ):
+                continue
+
+            _results[result_index] = result
+
+        if not _results:
+            return
 
         try:
             if self.data_daemon.store_data is not None:
-                self.data_daemon.store_runner_result({result_index: result})
-            self.notification_daemon.send_notification(content={result_index: result})
+                self.data_daemon.store_runner_result(_results)
+            self.notification_daemon.send_notification(content=_results)
         except Exception as e:
             raise e
 
+    def _filter_result(self, result: Any) -> bool:
+        """Match the result against the filter compiled from the filter patterns of the runner.
+
+        :param result: The result returned from the plugin.
+        :type result: Any
+        :return: If the result matched any of the patterns.
+        :rtype: bool
+        """
+        if self.runner_config.result_filter.match(result):
+            return True
+
+        logger.warning(
+            f"Result: '{result}' did not match any pattern(s) for runner: '{self.runner_id}'"
+        )
+        return False
+
     def _evaluate_plugin(
         self,
         generator: Generator[Any, Any, Any],
@@ -378,6 +657,7 @@ class _TridentDefaultRunner:
         all_results: bool = False,
     ) -> NoReturn:
         """Evaluate the initialized plugin generator for each returned value.
+        The results are pulled from the generator in chunks of `batch_size` and each chunk is evaluated as one operation.
 
         :param generator: The generator yielded from `start_runner`.
         :type generator: Generator
@@ -387,67 +667,155 @@ class _TridentDefaultRunner:
         :type variable_key: Optional[str], optional
         :param all_results: Wait for all results before returning, used by steps runners to wait for results in yield operations and plugins
         :type all_results: bool
-        :raises StopIteration: If generator did not return any more values from the plugin.
         :raises Exception: If any errors occured when trying to access the next value.
         """
+        # Asynchronous plugins not run on the event loop of the daemon, for example in steps, are run on a loop of their own.
+        if iscoroutine(generator):
+            generator = asyncio.run(generator)
+            if generator is None:
+                return
+        elif isasyncgen(generator):
+            generator = self._iterate_async_plugin(generator)
+
+        if not isinstance(generator, Iterator):
+            # The plugin returned a single value instead of yielding the results.
+            if variables is not None:
+                _key = variable_key if variable_key is not None else 0
+                if isinstance(variables.get(_key), TridentStepStream):
+                    variables[_key].append(generator)
+                else:
+                    variables[_key] = generator
+
+            self._evaluate_results([generator], 0)
+            return
+
+        batch_size = getattr(self.runner_config, "batch_size", 1)
         results_index = 0
         while not self.runner_config.thread_event.is_set():
+            results, error = [], None
             try:
-                _key = variable_key if variable_key is not None else results_index
-                try:
-                    result = next(generator)
-                    if variables is not None:
-                        if _key not in variables:
-                            variables[_key] = []
-
-                        if all_results and isinstance(generator, GeneratorType):
-                            variables[_key].extend([result] + list(generator))
-                        else:
-                            variables[_key].append(next(generator))
-                except TypeError as e:
-                    result = generator
-                    if variables is not None:
-                        variables[_key] = result
-
-                    self._evaluate_result(result, results_index)
-                    raise StopIteration
-                except Exception as e:
-                    if not isinstance(e, StopIteration):
-                        logger.error(
-                            f"Runner: '{self.runner_id}' encountered a '{type(e).__name__}' with message: '{e}' at run index: '{results_index}'"
-                        )
+                results.extend(islice(generator, batch_size))
+                if all_results and isinstance(generator, GeneratorType):
+                    results.extend(generator)
+            except Exception as e:
+                logger.error(
+                    f"Runner: '{self.runner_id}' encountered a '{type(e).__name__}' with message: '{e}' at run index: '{results_index + len(results)}'"
+                )
+                error = e
 
-                    raise e
+            self._evaluate_chunk(
+                results, results_index, error, variables, variable_key
+            )
+            results_index += len(results)
 
-                self._evaluate_result(result, results_index)
-                results_index += 1
-            except Exception as e:
-                if not isinstance(e, StopIteration):
-                    if getattr(self.runner_config, "dont_store_on_error"):
-                        raise e
+            if not results:
+                break
+
+    def _evaluate_chunk(
+        self,
+        results: List[Any],
+        results_index: int,
+        error: Optional[Exception] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        variable_key: Optional[str] = None,
+    ) -> NoReturn:
+        """Evaluate a chunk of results pulled from the plugin and raise the error that interrupted the chunk, if any.
+
+        :param results: The results pulled from the plugin.
+        :type results: List[Any]
+        :param results_index: The iteration index that the first result in the chunk was returned.
+        :type results_index: int
+        :param error: The error raised by the plugin while the chunk was pulled, defaults to None
+        :type error: Optional[Exception], optional
+        :param variables: Stores results in an additional variable map for step runners to use in multiple steps, skips store if `None`, defaults to None
+        :type variables: Optional[Dict[str, Any]], optional
+        :param variable_key: If a specific variable key is needed to store the results for, if `None` it defaults to the index, defaults to None
+        :type variable_key: Optional[str], optional
+        :raises Exception: The error raised by the plugin.
+        """
+        if variables is not None:
+            for result_index, result in enumerate(results, start=results_index):
+                _key = variable_key if variable_key is not None else result_index
+                if _key not in variables:
+                    variables[_key] = []
 
-                    if self.data_daemon is not None:
-                        logger.info(
-                            f"Runner: '{self.runner_id}' exited with error, storing results up until error"
-                        )
+                variables[_key].append(result)
 
-                if self.data_daemon is not None:
-                    if (
-                        not self.data_daemon.daemon_config.store_path
-                        in self.runner_config.resource_queues
-                    ):
-                        self.runner_config.resource_queues[
-                            self.data_daemon.daemon_config.store_path
-                        ] = [self.runner_id]
-                    else:
-                        self.runner_config.resource_queues[
-                            self.data_daemon.daemon_config.store_path
-                        ].append(self.runner_id)
+        if error is not None:
+            if getattr(self.runner_config, "dont_store_on_error"):
+                raise error
 
-                if isinstance(e, StopIteration):
-                    break
+            if self.data_daemon is not None:
+                logger.info(
+                    f"Runner: '{self.runner_id}' exited with error, storing results up until error"
+                )
+
+        self._evaluate_results(results, results_index)
+
+        if error is not None:
+            raise error
+
+    def _iterate_async_plugin(
+        self, generator: AsyncGenerator[Any, None]
+    ) -> Generator[Any, None, None]:
+        """Iterate an asynchronous generator returned from the plugin on an event loop owned by the calling thread.
+
+        :param generator: The asynchronous generator returned from the plugin.
+        :type generator: AsyncGenerator
+        :yield: The results yielded from the plugin.
+        :rtype: Generator[Any, None, None]
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(generator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(generator.aclose())
+            loop.close()
+
+    async def _evaluate_async_plugin(
+        self, generator: AsyncGenerator[Any, None]
+    ) -> NoReturn:
+        """Evaluate the asynchronous generator of the plugin on the event loop of the :class:`TridentDaemon`.
+        The results are pulled in chunks of `batch_size` like :meth:`_evaluate_plugin`, each chunk is evaluated in the
+        default executor of the loop if the runner sends notifications so that a full notification queue doesn't stall the other plugins.
+
+        :param generator: The asynchronous generator returned from the plugin.
+        :type generator: AsyncGenerator
+        :raises Exception: If any errors occured when trying to access the next value.
+        """
+        loop = asyncio.get_running_loop()
+        batch_size = getattr(self.runner_config, "batch_size", 1)
+        results_index = 0
+        try:
+            while not self.runner_config.thread_event.is_set():
+                results, error, exhausted = [], None, False
+                try:
+                    while len(results) < batch_size:
+                        results.append(await generator.__anext__())
+                except StopAsyncIteration:
+                    exhausted = True
+                except Exception as e:
+                    logger.error(
+                        f"Runner: '{self.runner_id}' encountered a '{type(e).__name__}' with message: '{e}' at run index: '{results_index + len(results)}'"
+                    )
+                    error = e
+
+                if results and self.notification_daemon.daemon_config.handlers:
+                    await loop.run_in_executor(
+                        None, self._evaluate_chunk, results, results_index, error
+                    )
+                else:
+                    self._evaluate_chunk(results, results_index, error)
+                results_index += len(results)
 
-                raise e
+                if exhausted:
+                    break
+        finally:
+            await generator.aclose()
 
 
 class TridentRunner(_TridentDefaultRunner):
@@ -498,6 +866,113 @@ class TridentRunner(_TridentDefaultRunner):
         logger.info(f"Starting runner: '{self.runner_id}' ...")
         self._start_plugin_runner(self.runner_config)
 
+    @property
+    def is_async(self) -> bool:
+        """Check if the plugin method `execute_plugin` is an asynchronous generator or coroutine function.
+
+        :return: If the plugin should be run on an event loop.
+        :rtype: bool
+        """
+        execute_plugin = getattr(
+            self.runner_config.plugin_instance, "execute_plugin", None
+        )
+        return isasyncgenfunction(execute_plugin) or iscoroutinefunction(execute_plugin)
+
+    async def start_runner_async(self) -> NoReturn:
+        """Start the initialized :class:`TridentRunner` on the event loop of the :class:`TridentDaemon` by awaiting the asynchronous plugin method `execute_plugin`.
+        This method is called when the plugin is an asynchronous generator or coroutine function.
+
+        :raises Exception: Re-raised exceptions that occurs in the plugin.
+        """
+        logger.info(f"Starting asynchronous runner: '{self.runner_id}' ...")
+        runner_config = self.runner_config
+        if not hasattr(runner_config.plugin_instance, "execute_plugin"):
+            raise RuntimeError("Entry method 'execute_plugin' not defined.")
+
+        self.is_running = True
+        self._load_plugin_state(runner_config)
+
+        try:
+            _plugins_args = runner_config._sanitize_parameters(
+                parameters=runner_config.plugin_args,
+                call_plan=runner_config.call_plan,
+            )
+            runner_generator = self._execute_plugin(runner_config, _plugins_args)
+            if isasyncgen(runner_generator):
+                await self._evaluate_async_plugin(runner_generator)
+            else:
+                result = await runner_generator
+                if result is not None:
+                    self._evaluate_chunk([result], 0)
+                else:
+                    logger.warning(
+                        f"No results were returned from the plugin: '{self.runner_id}'"
+                    )
+        except Exception as e:
+            logger.error(f"Runner: '{self.runner_id}' encountered error: {e}")
+            self.is_running = False
+            raise e
+
+        self.is_running = False
+
+
+class TridentStepStream:
+    """Bounded stream of the results of a step with a streaming `out` variable, read by the step using the variable.
+    The step producing the results waits while the stream is full so that the results are never materialized in memory.
+    The stream can only be iterated once, results added after the stream was cancelled are discarded.
+
+    :param buffer_size: The amount of results that can be in the stream before the producing step waits.
+    :type buffer_size: int
+    """
+
+    def __init__(self, buffer_size: int = STEP_STREAM_BUFFER_SIZE):
+        self._results = Queue(maxsize=buffer_size)
+        self._cancelled = Event()
+        self._finished = False
+
+    def append(self, result: Any) -> NoReturn:
+        """Add a result to the stream, waiting for space in the stream unless the stream is cancelled.
+
+        :param result: The result produced by the step.
+        :type result: Any
+        """
+        self._put(result)
+
+    def close(self) -> NoReturn:
+        """Mark the end of the results, the step reading the stream stops once it has read the remaining results."""
+        self._put(_STREAM_END)
+
+    def cancel(self) -> NoReturn:
+        """Stop waiting for the step reading the stream, any result added after this is discarded."""
+        self._cancelled.set()
+
+    def __iter__(self) -> "TridentStepStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+
+        result = self._results.get()
+        if result is _STREAM_END:
+            self._finished = True
+            raise StopIteration
+
+        return result
+
+    def _put(self, result: Any) -> NoReturn:
+        """Put a result into the stream, checking if the stream is cancelled while the stream is full.
+
+        :param result: The result or the end marker.
+        :type result: Any
+        """
+        while not self._cancelled.is_set():
+            try:
+                self._results.put(result, timeout=STEP_STREAM_POLL_INTERVAL)
+                return
+            except Full:
+                continue
+
 
 @dataclass
 class TridentStepInstructionConfig(_TridentDefaultRunnerConfig):
@@ -532,27 +1007,96 @@ class TridentStepConfig:
     :type step_instruction: :class:`TridentStepInstructionConfig`
     :param method_reference: The reference to the method to call when using a 'method' step
     :type method_reference: MethodType
+    :param call_plan: The call plan of the method or the `execute_plugin` method of the plugin of the step.
+    :type call_plan: :class:`TridentCallPlan`
+    :param depends_on: The names of the steps that has to finish before the step starts, inferred from the variables if `None`.
+    :type depends_on: Optional[List[str]]
+    :param plugin_registry: The registry resolving the methods and plugins of the step, a registry of its own is created if `None`.
+    :type plugin_registry: Optional[:class:`TridentPluginRegistry`]
+    :param runner_config: The configuration of the plugin of a 'plugin' step, created once by the :class:`TridentStepsRunnerConfig` and reused for every run.
+    :type runner_config: Optional[:class:`TridentRunnerConfig`]
     """
 
     plugin_name: str
     step_name: str
     step_instruction: TridentStepInstructionConfig
     method_reference: MethodType = None
+    call_plan: TridentCallPlan = None
+    depends_on: Optional[List[str]] = None
+    plugin_registry: TridentPluginRegistry = None
+    runner_config: Optional[TridentRunnerConfig] = None
 
     def __init__(
         self,
         plugin_name: str,
         step_name: str,
         step_instruction: Dict[str, Any],
+        depends_on: Optional[List[str]] = None,
+        plugin_registry: Optional[TridentPluginRegistry] = None,
     ):
         self.plugin_name = plugin_name
         self.step_name = step_name
+        self.depends_on = depends_on
+        self.plugin_registry = (
+            plugin_registry if plugin_registry is not None else TridentPluginRegistry()
+        )
+        self.runner_config = None
 
         self.step_instruction = self._initialize_step_instruction(step_instruction)
         if self.step_instruction.type == "method":
             self.method_reference = self._initialize_step_method(
                 method_path=self.step_instruction.ref
             )
+            self.call_plan = self.plugin_registry.call_plan(self.method_reference)
+        else:
+            self.call_plan = self.plugin_registry.call_plan(
+                self.plugin_registry.resolve(
+                    self.step_instruction.ref, self.step_instruction.name
+                ).execute_plugin
+            )
+
+    @property
+    def variable_key(self) -> Optional[str]:
+        """Get the name of the variable that the results of the step are stored in.
+
+        :return: The name of the `out` variable, `None` if the step has no output.
+        :rtype: Optional[str]
+        """
+        if self.step_instruction.out is None:
+            return None
+
+        return self.step_instruction.out["name"]
+
+    @property
+    def streams(self) -> bool:
+        """Check if the results of the step are streamed to the step reading the `out` variable.
+
+        :return: If the step has a streaming `out` variable.
+        :rtype: bool
+        """
+        return self.step_instruction.out is not None and bool(
+            self.step_instruction.out.get("stream")
+        )
+
+    def create_stream(self) -> TridentStepStream:
+        """Create the stream that the results of the step are added to.
+
+        :return: The empty stream.
+        :rtype: :class:`TridentStepStream`
+        """
+        return TridentStepStream(
+            self.step_instruction.out.get("buffer_size", STEP_STREAM_BUFFER_SIZE)
+        )
+
+    def reads(self, variable_key: Optional[str]) -> bool:
+        """Check if the variable is passed to the step, only the variables accepted by the call plan of the step are passed.
+
+        :param variable_key: The name of the variable.
+        :type variable_key: Optional[str]
+        :return: If the step reads the variable.
+        :rtype: bool
+        """
+        return variable_key is not None and self.call_plan.accepts(variable_key)
 
     def _initialize_step_instruction(
         self, step_instruction: Dict[str, Any]
@@ -589,6 +1133,24 @@ class TridentStepConfig:
                 f"Step instruction: '{self.step_name}' for plugin: '{self.plugin_name}' did not contain necessary 'out' or was otherwise malformed, 'name' was malformed"
             )
 
+        if "out" in step_instruction and step_instruction["out"].get("stream"):
+            buffer_size = step_instruction["out"].get(
+                "buffer_size", STEP_STREAM_BUFFER_SIZE
+            )
+            if step_instruction["out"].get("all"):
+                raise ValueError(
+                    f"Step instruction: '{self.step_name}' for plugin: '{self.plugin_name}' can't use both 'all' and 'stream' for 'out'"
+                )
+
+            if (
+                not isinstance(buffer_size, int)
+                or isinstance(buffer_size, bool)
+                or buffer_size < 1
+            ):
+                raise ValueError(
+                    f"Step instruction: '{self.step_name}' for plugin: '{self.plugin_name}' has an invalid 'buffer_size': '{buffer_size}' for 'out', value must be an integer greater than 0"
+                )
+
         if step_instruction["type"] not in ["plugin", "method"]:
             raise ValueError(
                 f"Step instruction: '{self.step_name}' for plugin: '{self.plugin_name}' was not of type 'plugin' or 'method'"
@@ -614,11 +1176,7 @@ class TridentStepConfig:
         :rtype: (PluginClass, Module)
         """
         try:
-            _result = method_path.split(".")
-            method_module, method_name = ".".join(_result[:-1]), _result[-1]
-            method_module = import_module(method_module, package=__package__)
-            method_reference = getattr(method_module, method_name)
-            return method_reference
+            return self.plugin_registry.resolve_method(method_path)
         except Exception as e:
             logger.error(
                 f"Failed to initialize plugin: '{method_path}' with error: {e}"
@@ -637,19 +1195,25 @@ class TridentStepsRunnerConfig(_TridentDefaultRunnerConfig):
     :type plugin_steps: List[:class:`TridentStepConfig`]
     :param plugin_args: The arguments that should be passed to the plugin when executing.
     :type plugin_args: dict
-    :param resource_queues: Queue used to register access to a resource shared between runners to avoid conflicts.
-    :type resource_queues: dict
+    :param store_writers: The store writers shared between runners by store path, runners using the same store share the same writer.
+    :type store_writers: dict
+    :param plugin_registry: The registry resolving the plugins shared between runners, a registry of its own is created if `None`.
+    :type plugin_registry: Optional[:class:`TridentPluginRegistry`]
     :param dont_store_on_error: If the runner should store the results accumulated before exiting if an error occured.
     :type dont_store_on_error: bool
     :param thread_event: The event flag used to signal to the plugin that it should exit.
     :type thread_event: :class:`threading.Event`
+    :param step_dependencies: The indexes of the steps that each step depends on, `None` if the steps are run in order.
+    :type step_dependencies: Optional[List[Set[int]]]
     """
 
     plugin_name: str
     plugin_args: Dict[str, Any]
     plugin_steps: List[Dict[str, Any]]
-    resource_queues: Dict[str, List[str]]
+    store_writers: Dict[Path, TridentStoreWriter]
+    plugin_registry: TridentPluginRegistry
     thread_event: Event
+    step_dependencies: Optional[List[Set[int]]]
 
     def __init__(
         self,
@@ -660,18 +1224,27 @@ class TridentStepsRunnerConfig(_TridentDefaultRunnerConfig):
         checkpoint_config: Dict[str, Any],
         runner_config: Dict[str, Any],
         notification_config: Dict[str, Any],
-        resource_queues: Dict[str, List[str]],
+        store_writers: Dict[Path, TridentStoreWriter],
+        plugin_registry: Optional[TridentPluginRegistry] = None,
     ):
         self.plugin_name = plugin_name
         self.plugin_args = plugin_args
         self.store_config = store_config
         self.checkpoint_config = checkpoint_config
         self.notification_config = notification_config
-        self.resource_queues = resource_queues
+        self.store_writers = store_writers
+        self.plugin_registry = (
+            plugin_registry if plugin_registry is not None else TridentPluginRegistry()
+        )
 
         self.thread_event = Event()
         self._apply_runner_config(runner_config)
         self.plugin_steps = self._initialize_plugin_steps(plugin_steps)
+        self._initialize_step_runners()
+        self._validate_step_streams()
+        self.step_dependencies = (
+            self._resolve_step_dependencies() if self.parallel_steps else None
+        )
 
     def _initialize_plugin_steps(
         self, plugin_steps: List[Dict[str, Any]]
@@ -695,6 +1268,14 @@ class TridentStepsRunnerConfig(_TridentDefaultRunnerConfig):
                     f"Failed to initialize plugin step configuration for plugin: {self.plugin_name}, missing 'instruction' keyword"
                 )
 
+            if "depends_on" in step and (
+                not isinstance(step["depends_on"], list)
+                or not all(isinstance(name, str) for name in step["depends_on"])
+            ):
+                raise ValueError(
+                    f"Failed to initialize plugin step configuration for plugin: {self.plugin_name}, 'depends_on' must be a list of step names"
+                )
+
             _initialized_steps.append(
                 TridentStepConfig(
                     plugin_name=self.plugin_name,
@@ -702,6 +1283,8 @@ class TridentStepsRunnerConfig(_TridentDefaultRunnerConfig):
                     if "name" not in step["instruction"]
                     else step["instruction"]["name"],
                     step_instruction=step["instruction"],
+                    depends_on=step.get("depends_on"),
+                    plugin_registry=self.plugin_registry,
                 )
             )
 
@@ -710,6 +1293,105 @@ class TridentStepsRunnerConfig(_TridentDefaultRunnerConfig):
         )
         return _initialized_steps
 
+    def _initialize_step_runners(self) -> NoReturn:
+        """Initialize the runner configuration of each 'plugin' step, the plugin instance is created once and reused for every run of the step.
+        The thread event of the steps runner is shared so that stopping the runner also signals the plugins of the steps to exit.
+        """
+        for step in self.plugin_steps:
+            if step.step_instruction.type != "plugin":
+                continue
+
+            step.runner_config = TridentRunnerConfig(
+                plugin_path=step.step_instruction.ref,
+                plugin_name=getattr(step.step_instruction, "name", None),
+                plugin_args=step.step_instruction.args,
+                store_config=self.store_config,
+                checkpoint_config=self.checkpoint_config,
+                notification_config=self.notification_config,
+                store_writers=self.store_writers,
+                plugin_registry=self.plugin_registry,
+                runner_config=None,
+            )
+            step.runner_config.thread_event = self.thread_event
+
+    def _validate_step_streams(self) -> NoReturn:
+        """Validate that the streaming `out` variable of each step is read by at most one later step, since a stream can only be read once.
+
+        :raises ValueError: If a streaming variable is read by more than one step.
+        """
+        for index, step in enumerate(self.plugin_steps):
+            if not step.streams:
+                continue
+
+            readers = [
+                _step.step_name
+                for _step in self.plugin_steps[index + 1 :]
+                if _step.reads(step.variable_key)
+            ]
+            if len(readers) > 1:
+                raise ValueError(
+                    f"Streaming variable: '{step.variable_key}' of step: '{step.step_name}' for plugin: {self.plugin_name} can only be read by one step, read by: {readers}"
+                )
+
+    def _resolve_step_dependencies(self) -> List[Set[int]]:
+        """Resolve the steps that each step depends on, either declared by `depends_on` or inferred from the variables.
+        An inferred step depends on the earlier steps with an output variable that the step reads or writes itself
+        and on the earlier steps reading the output variable of the step, so that the variables are the same as when the steps run in order.
+
+        :raises ValueError: If the step names are not unique, a declared step does not exist or the dependencies form a cycle.
+        :return: The indexes of the steps that each step depends on.
+        :rtype: List[Set[int]]
+        """
+        step_names = [step.step_name for step in self.plugin_steps]
+        if len(set(step_names)) != len(step_names):
+            raise ValueError(
+                f"Step names must be unique to run the steps of plugin: {self.plugin_name} in parallel"
+            )
+
+        step_dependencies = []
+        for index, step in enumerate(self.plugin_steps):
+            if step.depends_on is not None:
+                unknown = set(step.depends_on) - set(step_names)
+                if unknown:
+                    raise ValueError(
+                        f"Step: '{step.step_name}' for plugin: {self.plugin_name} depends on unknown step(s): {sorted(unknown)}"
+                    )
+
+                step_dependencies.append(
+                    {step_names.index(name) for name in step.depends_on}
+                )
+                continue
+
+            step_dependencies.append(
+                {
+                    _index
+                    for _index, _step in enumerate(self.plugin_steps[:index])
+                    if (
+                        _step.variable_key is not None
+                        and _step.variable_key == step.variable_key
+                    )
+                    or step.reads(_step.variable_key)
+                    or (_step.depends_on is None and _step.reads(step.variable_key))
+                }
+            )
+
+        # The steps can only be run if the dependencies can be ordered, that is if they don't form a cycle.
+        finished = set()
+        while len(finished) < len(step_dependencies):
+            ready = {
+                index
+                for index, dependencies in enumerate(step_dependencies)
+                if index not in finished and dependencies <= finished
+            }
+            if not ready:
+                raise ValueError(
+                    f"The dependencies of the steps for plugin: {self.plugin_name} form a cycle"
+                )
+
+            finished |= ready
+
+        return step_dependencies
+
 
 class TridentStepsRunner(_TridentDefaultRunner):
     """The :class:`TridentStepsRunner` used to control the execution of each steps plugin.
@@ -721,10 +1403,14 @@ class TridentStepsRunner(_TridentDefaultRunner):
     :type runner_id: str
     """
 
+    step_executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(self, runner_config: TridentStepsRunnerConfig, runner_id: str):
         self.runner_config = runner_config
         self.runner_id = runner_id
         self.variables = {}
+        self._streams: List[Tuple[Thread, TridentStepStream]] = []
+        self._stream_errors: List[Exception] = []
 
         self.data_daemon = self._initialize_data_daemon()
         self.notification_daemon = self._initialize_notification_daemon()
@@ -733,6 +1419,7 @@ class TridentStepsRunner(_TridentDefaultRunner):
     def _start_method_runner(
         self,
         step: TridentStepConfig,
+        variables: Optional[Dict[str, Any]] = None,
         variable_key: Optional[str] = None,
     ) -> NoReturn:
         """Start a method by calling the method directly with the provided arguments.
@@ -740,7 +1427,7 @@ class TridentStepsRunner(_TridentDefaultRunner):
 
         :param step: The step configuration to execute
         :type: :class:`TridentStepConfig`
-        :param variables: Additional variable map for step runners to use in multiple steps, skips store if `None`, defaults to None
+        :param variables: The variables passed to the method, defaults to the variables of the runner
         :type variables: Optional[Dict[str, Any]], optional
         :param variable_key: If a specific variable key is needed to store the results for, if `None` it defaults to the index, defaults to None
         :type variable_key: Optional[str], optional
@@ -760,9 +1447,9 @@ class TridentStepsRunner(_TridentDefaultRunner):
                 parameters={
                     **self.runner_config.plugin_args,
                     **step.step_instruction.args,
-                    **self.variables,
+                    **(variables if variables is not None else self.variables),
                 },
-                method_reference=step.method_reference,
+                call_plan=step.call_plan,
             )
 
             # TODO: Investigate how we can use the thread event parameter for functions
@@ -774,9 +1461,9 @@ class TridentStepsRunner(_TridentDefaultRunner):
                         runner_generator,
                         variables=self.variables,
                         variable_key=variable_key,
-                        all_results=step.step_instruction.out["all"]
-                        if "all" in step.step_instruction.out
-                        else None,
+                        all_results=step.step_instruction.out.get("all", False)
+                        if step.step_instruction.out is not None
+                        else False,
                     )
                 except Exception as e:
                     raise e
@@ -793,43 +1480,195 @@ class TridentStepsRunner(_TridentDefaultRunner):
         self.is_running = False
 
     def start_runner(self) -> NoReturn:
+        """Execute each step and evaluate the results for each step instruction.
+        The steps are run in order unless `parallel_steps` is set, in which case each step is started as soon as the steps
+        it depends on have finished and independent steps run concurrently on the workers of the :class:`TridentDaemon`.
+        Steps with a streaming `out` variable run in a thread of their own and count as finished as soon as they start.
+
+        :raises Exception: The first exception raised by any step.
+        """
+        logger.info(f"Starting steps runner: '{self.runner_id}' ...")
+        self.variables, self._streams, self._stream_errors = {}, [], []
+        error = None
+        try:
+            if self.runner_config.step_dependencies is None:
+                for step in self.runner_config.plugin_steps:
+                    if step.streams:
+                        self._start_stream_step(step)
+                    else:
+                        self._start_step(step)
+            else:
+                self._start_parallel_steps()
+        except Exception as e:
+            error = e
+
+        self._stop_streams()
+        if error is None and self._stream_errors:
+            error = self._stream_errors[0]
+
+        if error is not None:
+            raise error
+
+    def _start_step(self, step: TridentStepConfig) -> NoReturn:
         """Execute a step and evaluate the results for that step instruction.
 
         :param step: The step to execute and evaluate the results for
-        :type step: :class:`TridentStepInstructionConfig`
+        :type step: :class:`TridentStepConfig`
+        :raises Exception: Re-raised exceptions that occurs in the step.
         """
-        logger.info(f"Starting steps runner: '{self.runner_id}' ...")
-        for step in self.runner_config.plugin_steps:
-            logger.info(
-                f"Executing step: '{step.step_name}' for plugin: '{step.plugin_name}' and runner: '{self.runner_id}'"
+        # The variables are copied since steps running concurrently might add variables while the step starts.
+        variables = dict(self.variables)
+        logger.info(
+            f"Executing step: '{step.step_name}' for plugin: '{step.plugin_name}' and runner: '{self.runner_id}'"
+        )
+        logger.debug(
+            f"Passing variables: '{str(variables)}' for step: '{step.step_name}' ('{step.step_instruction.type}') for plugin: '{step.plugin_name}' and runner: '{self.runner_id}'"
+        )
+
+        if step.step_instruction.type == "plugin":
+            self._start_plugin_runner(
+                runner_config=step.runner_config,
+                plugin_args={**step.step_instruction.args, **variables},
+                variables=self.variables,
+                variable_key=step.variable_key,
             )
-            logger.debug(
-                f"Passing variables: '{str(self.variables)}' for step: '{step.step_name}' ('{step.step_instruction.type}') for plugin: '{step.plugin_name}' and runner: '{self.runner_id}'"
+        elif step.step_instruction.type == "method":
+            self._start_method_runner(
+                step=step, variables=variables, variable_key=step.variable_key
             )
 
-            if step.step_instruction.type == "plugin":
-                self._start_plugin_runner(
-                    runner_config=TridentRunnerConfig(
-                        plugin_path=step.step_instruction.ref,
-                        plugin_name=step.step_instruction.name
-                        if hasattr(step.step_instruction, "name")
-                        else self.runner_config._resolve_plugin_name(),
-                        plugin_args={**step.step_instruction.args, **self.variables},
-                        store_config=self.runner_config.store_config,
-                        checkpoint_config=self.runner_config.checkpoint_config,
-                        notification_config=self.notification_daemon.daemon_config,
-                        resource_queues=self.runner_config.resource_queues,
-                        runner_config=None,
-                    ),
-                    variables=self.variables,
-                    variable_key=step.step_instruction.out["name"]
-                    if hasattr(step.step_instruction, "out")
-                    else None,
-                )
-            elif step.step_instruction.type == "method":
-                self._start_method_runner(
-                    step=step,
-                    variable_key=step.step_instruction.out["name"]
-                    if hasattr(step.step_instruction, "out")
-                    else None,
+    def _start_parallel_steps(self) -> NoReturn:
+        """Run the steps in the order given by their dependencies, the steps that are ready at the same time are run concurrently.
+        The first ready step is run in the thread of the runner and the others are submitted to the step executor.
+        Once any step fails no more steps are started, the steps already running are waited for before the error is raised.
+
+        :raises Exception: The first exception raised by any step.
+        """
+        steps = self.runner_config.plugin_steps
+        pending = {
+            index: set(dependencies)
+            for index, dependencies in enumerate(self.runner_config.step_dependencies)
+        }
+        running: Dict[Future, int] = {}
+        error = None
+        while pending or running:
+            ready = []
+            if error is None and not self.runner_config.thread_event.is_set():
+                ready = sorted(
+                    index for index, dependencies in pending.items() if not dependencies
                 )
+                if self.step_executor is None:
+                    ready = ready[:1]
+
+            for index in ready:
+                del pending[index]
+
+            streaming = [index for index in ready if steps[index].streams]
+            ready = [index for index in ready if not steps[index].streams]
+            for index in streaming:
+                self._start_stream_step(steps[index])
+
+            for index in ready[1:]:
+                future = self.step_executor.submit(self._start_step, steps[index])
+                running[future] = index
+
+            if ready:
+                finished = {ready[0]: self._run_step(steps[ready[0]])}
+            elif streaming:
+                finished = {}
+            elif running:
+                finished = self._wait_for_steps(running)
+            else:
+                break
+
+            finished.update({index: None for index in streaming})
+
+            for index, _error in finished.items():
+                if _error is not None and error is None:
+                    error = _error
+
+                for dependencies in pending.values():
+                    dependencies.discard(index)
+
+        if error is not None:
+            raise error
+
+    def _start_stream_step(self, step: TridentStepConfig) -> NoReturn:
+        """Start a step with a streaming `out` variable in a thread of its own, the variable is the stream of the results of the step.
+        The step reading the variable can start right away and reads the results as they are produced.
+
+        :param step: The streaming step to start.
+        :type step: :class:`TridentStepConfig`
+        """
+        stream = step.create_stream()
+        self.variables[step.variable_key] = stream
+        thread = Thread(
+            target=self._run_stream_step,
+            args=(step, stream),
+            name=f"TridentStep-{self.runner_id}-{step.step_name}",
+            daemon=True,
+        )
+        self._streams.append((thread, stream))
+        thread.start()
+
+    def _run_stream_step(
+        self, step: TridentStepConfig, stream: TridentStepStream
+    ) -> NoReturn:
+        """Run a streaming step and close the stream once the step has finished.
+
+        :param step: The streaming step to run.
+        :type step: :class:`TridentStepConfig`
+        :param stream: The stream that the results of the step are added to.
+        :type stream: :class:`TridentStepStream`
+        """
+        try:
+            self._start_step(step)
+        except Exception as e:
+            self._stream_errors.append(e)
+        finally:
+            stream.close()
+
+    def _stop_streams(self) -> NoReturn:
+        """Cancel the streams once the other steps have finished and wait for the streaming steps to finish.
+        The streams are cancelled in the reverse order they were started since the step reading a stream is started after
+        the step producing it, so each stream is only cancelled once the step reading it has finished. The results of a
+        streaming step that were not read by any step are discarded instead of waiting forever for a reader.
+        """
+        for thread, stream in reversed(self._streams):
+            stream.cancel()
+            thread.join()
+
+    def _run_step(self, step: TridentStepConfig) -> Optional[Exception]:
+        """Run a step in the thread of the runner.
+
+        :param step: The step to run.
+        :type step: :class:`TridentStepConfig`
+        :return: The exception raised by the step, `None` if the step succeeded.
+        :rtype: Optional[Exception]
+        """
+        try:
+            self._start_step(step)
+        except Exception as e:
+            return e
+
+        return None
+
+    def _wait_for_steps(
+        self, running: Dict[Future, int]
+    ) -> Dict[int, Optional[Exception]]:
+        """Wait for any of the running steps to finish.
+        A step that no worker has started yet is run in the thread of the runner instead of waiting,
+        since the runner might occupy the last worker of the daemon.
+
+        :param running: The futures of the submitted steps with the index of each step, finished steps are removed.
+        :type running: Dict[:class:`concurrent.futures.Future`, int]
+        :return: The exception raised by each finished step by the index of the step, `None` if the step succeeded.
+        :rtype: Dict[int, Optional[Exception]]
+        """
+        for future, index in list(running.items()):
+            if future.cancel():
+                del running[future]
+                return {index: self._run_step(self.runner_config.plugin_steps[index])}
+
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        return {running.pop(future): future.exception() for future in finished}
@@ -0,0 +1,780 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" Trident: Store Backends
+
+Implements the on-disk formats used by the data daemon to persist the results of each runner.
+@author: Jacob Wahlman
+"""
+
+import json
+import sqlite3
+from os import replace
+from pathlib import Path
+from threading import Lock
+
+from typing import Dict, Any, AnyStr, Generator, List, NoReturn, Optional, Tuple, Union
+
+import logging
+
+logger = logging.getLogger("__main__")
+
+
+class TridentStoreIndex:
+    """Sidecar index kept next to a store as `[STORE].index`, recording the runners in the store,
+    the last run index of each runner and the byte offsets of each run in the store.
+    The index allows a store to be opened and the next run index to be found without parsing the store.
+
+    The index is of the form `{"size": [SIZE], "runners": {"[RUNNER]": {"run_index": "[RUN]", "runs": {"[RUN]": [START, END]}}}}`
+    where the offsets are `null` for stores that are rewritten as a whole and the end offset is `null` for runs in progress.
+
+    :param store_path: The path to the store that the index belongs to.
+    :type store_path: :class:`pathlib.Path`
+    """
+
+    def __init__(self, store_path: Path):
+        self.store_path = Path(store_path)
+        self.index_path = self.store_path.with_name(f"{self.store_path.name}.index")
+        self.index_data = None
+
+    def load(self, exact: bool = False) -> bool:
+        """Read the index from the disk and verify that it is up to date with the store.
+        The index is outdated if the store is smaller than when the index was written, or if `exact` is set, of any other size.
+
+        :param exact: If the store size must match the size recorded in the index, used for stores that are rewritten as a whole.
+        :type exact: bool
+        :return: If an up to date index was loaded.
+        :rtype: bool
+        """
+        try:
+            with open(self.index_path, "r") as index_obj:
+                index_data = json.load(index_obj)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(
+                f"Failed to read the index: '{self.index_path}' for store: '{self.store_path}' due to: {e}"
+            )
+            return False
+
+        store_size = self.store_path.stat().st_size if self.store_path.exists() else 0
+        if (
+            not isinstance(index_data.get("size"), int)
+            or index_data["size"] > store_size
+            or (exact and index_data["size"] != store_size)
+        ):
+            logger.debug(
+                f"Index: '{self.index_path}' is outdated for store: '{self.store_path}'"
+            )
+            return False
+
+        self.index_data = index_data
+        return True
+
+    def run_index(self, runner_id: AnyStr) -> AnyStr:
+        """Determine the run index for the next run of the given runner from the loaded index.
+
+        :param runner_id: The runner to determine the next run index for.
+        :type runner_id: str
+        :return: The index of the next run.
+        :rtype: str
+        """
+        runner = self.index_data["runners"].get(runner_id)
+        if runner is None or runner["run_index"] is None:
+            return str(0)
+
+        return str(int(runner["run_index"]) + 1)
+
+    def run_offsets(
+        self, runner_id: AnyStr, run_index: AnyStr
+    ) -> Optional[List[Optional[int]]]:
+        """Get the byte offsets of the run for the given runner from the loaded index.
+
+        :param runner_id: The runner that the run belongs to.
+        :type runner_id: str
+        :param run_index: The run to get the offsets for.
+        :type run_index: str
+        :return: The start and end offset of the run, `None` if the run is not in the index.
+        :rtype: Optional[List[Optional[int]]]
+        """
+        runner = self.index_data["runners"].get(runner_id)
+        if runner is None:
+            return None
+
+        return runner["runs"].get(str(run_index))
+
+    def update_run(
+        self,
+        runner_id: AnyStr,
+        run_index: AnyStr,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> NoReturn:
+        """Record a run in the index and write the index to the disk.
+        The index on the disk is re-read first since the store might be shared by several runners,
+        the caller is responsible for serializing updates for the same store.
+
+        :param runner_id: The runner that the run belongs to.
+        :type runner_id: str
+        :param run_index: The run to record.
+        :type run_index: str
+        :param start: The byte offset in the store of the first result in the run.
+        :type start: Optional[int]
+        :param end: The byte offset in the store after the last result in the run, `None` if the run is in progress.
+        :type end: Optional[int]
+        """
+        if not self.load():
+            self.index_data = self.index_data or {"size": 0, "runners": {}}
+
+        runner = self.index_data["runners"].setdefault(
+            runner_id, {"run_index": None, "runs": {}}
+        )
+        runner["runs"][str(run_index)] = [start, end]
+        runner["run_index"] = str(max(int(run) for run in runner["runs"].keys()))
+        self.write()
+
+    def rebuild(
+        self, runners: Dict[AnyStr, Dict[AnyStr, List[Optional[int]]]]
+    ) -> NoReturn:
+        """Replace the index with the given runs and write the index to the disk.
+
+        :param runners: The runs of each runner in the form of {"[RUNNER]": {"[RUN]": [START, END]}}
+        :type runners: dict
+        """
+        self.index_data = {
+            "size": 0,
+            "runners": {
+                runner_id: {
+                    "run_index": str(max(int(run) for run in runs.keys()))
+                    if runs
+                    else None,
+                    "runs": {str(run): offsets for run, offsets in runs.items()},
+                }
+                for runner_id, runs in runners.items()
+            },
+        }
+        self.write()
+
+    def write(self) -> NoReturn:
+        """Write the loaded index to the disk together with the current size of the store.
+        The index is written to a temporary file first and then moved in place to never leave a partial index.
+        """
+        self.index_data["size"] = (
+            self.store_path.stat().st_size if self.store_path.exists() else 0
+        )
+        _index_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            with open(_index_path, "w") as index_obj:
+                index_obj.write(json.dumps(self.index_data))
+
+            replace(_index_path, self.index_path)
+        except Exception as e:
+            logger.error(
+                f"Failed to write the index: '{self.index_path}' for store: '{self.store_path}'",
+                exc_info=e,
+            )
+
+
+class TridentStoreBackend:
+    """Interface implemented by the store backends used by :class:`TridentDataDaemon` to persist the results of each runner.
+    Results are only written to the store by the single :class:`TridentStoreWriter` of the store, while the
+    other methods can be used from any thread.
+
+    :param store_path: The path to the store on the disk.
+    :type store_path: :class:`pathlib.Path`
+    """
+
+    suffix: str = None
+    incremental: bool = False
+
+    def __init__(self, store_path: Path):
+        self.store_path = Path(store_path)
+
+    def run_index(self, runner_id: AnyStr) -> AnyStr:
+        """Determine the run index for the next run of the given runner.
+        If the runner has no runs in the store then return 0 as first index.
+
+        :param runner_id: The runner to determine the next run index for.
+        :type runner_id: str
+        :return: The index of the next run.
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def load_run(self, runner_id: AnyStr, run_index: AnyStr) -> Dict[str, Any]:
+        """Load the results of a single run from the store.
+
+        :param runner_id: The runner that the run belongs to.
+        :type runner_id: str
+        :param run_index: The run to load the results for.
+        :type run_index: str
+        :return: The results of the run in the form of {"[INDEX]": ...}
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def load_store(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        """Load the nested store view of every result in the store.
+
+        :return: The store structure in the form of {"runners": {"[RUNNER]": {"results": {...}}}}
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def write_results(
+        self, runs: Dict[Tuple[AnyStr, AnyStr], Dict[int, Any]]
+    ) -> NoReturn:
+        """Write the results of one or more runs to the store in a single write.
+
+        :param runs: The results of each run in the form of {("[RUNNER]", "[RUN]"): {[INDEX]: ...}}
+        :type runs: Dict[Tuple[str, str], Dict[int, Any]]
+        """
+        raise NotImplementedError
+
+    def finish_run(self, runner_id: AnyStr, run_index: AnyStr) -> NoReturn:
+        """Record that a run has finished and no more results will be written for it.
+
+        :param runner_id: The runner that the run belongs to.
+        :type runner_id: str
+        :param run_index: The run that finished.
+        :type run_index: str
+        """
+        pass
+
+    def close(self) -> NoReturn:
+        """Release any resources held open by the backend."""
+        pass
+
+    def _encode_result(
+        self, runner_id: AnyStr, result_index: int, result: Any
+    ) -> Optional[str]:
+        """Serialize a single result, results that are not JSON serializable are skipped.
+
+        :param runner_id: The runner that produced the result.
+        :type runner_id: str
+        :param result_index: The index of the result in the run.
+        :type result_index: int
+        :param result: The result to serialize.
+        :type result: Any
+        :return: The serialized result, `None` if the result is not JSON serializable.
+        :rtype: Optional[str]
+        """
+        try:
+            return json.dumps(result)
+        except TypeError:
+            logger.warning(
+                f"Result: '{result}' at index: '{result_index}' is not JSON serializable for runner: '{runner_id}'"
+            )
+            return None
+
+
+class TridentStoreJSONBackend(TridentStoreBackend):
+    """Store backend keeping the whole store as a single JSON document that is rewritten on each write.
+    A sidecar :class:`TridentStoreIndex` allows the store to be opened without parsing the store.
+
+    The store is of the form `{"runners": {"[RUNNER]": {"results": {"[RUN]": {"[INDEX]": ...}}}}}`.
+
+    :param store_path: The path to the store on the disk.
+    :type store_path: :class:`pathlib.Path`
+    """
+
+    suffix: str = ".json"
+    incremental: bool = False
+
+    def __init__(self, store_path: Path):
+        super().__init__(store_path)
+        self.store_index = TridentStoreIndex(self.store_path)
+
+    def run_index(self, runner_id: AnyStr) -> AnyStr:
+        if self.store_index.load(exact=True):
+            return self.store_index.run_index(runner_id)
+
+        results = (
+            self.load_store()["runners"].get(runner_id, {"results": {}})["results"]
+        )
+        if not results.keys():
+            return str(0)
+
+        return str(max([int(index) for index in results.keys()]) + 1)
+
+    def load_run(self, runner_id: AnyStr, run_index: AnyStr) -> Dict[str, Any]:
+        return (
+            self.load_store()["runners"]
+            .get(runner_id, {"results": {}})["results"]
+            .get(str(run_index), {})
+        )
+
+    def load_store(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        """Read the store from the disk and parse using the JSON library.
+
+        :raises JSONDecodeError: If the JSON data is not parseable.
+        :return: The store structure in the form of {"runners": {"[RUNNER]": {"results": {...}}}}
+        :rtype: dict
+        """
+        if not self.store_path.exists() or self.store_path.stat().st_size == 0:
+            return {"runners": {}}
+
+        try:
+            return self._read_store_data()
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse the JSON data from the store: '{self.store_path}'")
+            raise e
+
+    def write_results(
+        self, runs: Dict[Tuple[AnyStr, AnyStr], Dict[int, Any]]
+    ) -> NoReturn:
+        """Merge the results into the existing store and rewrite the store, the store is only read and written once for all runs.
+        Results that are not JSON serializable are skipped like for the other backends, so they never prevent the other results from being written.
+
+        :param runs: The results of each run in the form of {("[RUNNER]", "[RUN]"): {[INDEX]: ...}}
+        :type runs: Dict[Tuple[str, str], Dict[int, Any]]
+        """
+        store_data = self.load_store()
+        for (runner_id, run_index), results in runs.items():
+            runner = store_data["runners"].setdefault(runner_id, {"results": {}})
+            _results = {
+                str(result_index): result
+                for result_index, result in results.items()
+                if self._encode_result(runner_id, result_index, result) is not None
+            }
+            if _results:
+                runner["results"].setdefault(str(run_index), {}).update(_results)
+
+        self._write_store_data(store_data)
+
+    def _read_store_data(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        """Read and parse the store written to the disk.
+
+        :return: The store structure in the form of {"runners": {"[RUNNER]": {"results": {...}}}}
+        :rtype: dict
+        """
+        with open(self.store_path, "r") as store_obj:
+            return json.load(store_obj)
+
+    def _write_store_data(
+        self, store_data: Dict[str, Dict[str, Dict[str, Dict]]]
+    ) -> NoReturn:
+        """Rewrite the store on the disk with the given store data and rebuild the index of the store.
+        The store is written to a temporary file first and then moved in place so that readers never see a partial store.
+
+        :param store_data: The store structure in the form of {"runners": {"[RUNNER]": {"results": {...}}}}
+        :type store_data: dict
+        """
+        content = json.dumps(store_data)
+        _store_path = self.store_path.with_name(f"{self.store_path.name}.tmp")
+        with open(_store_path, "w") as store_obj:
+            store_obj.write(content)
+
+        replace(_store_path, self.store_path)
+        self.store_index.rebuild(
+            {
+                runner_id: {run: None for run in content["results"].keys()}
+                for runner_id, content in store_data["runners"].items()
+            }
+        )
+
+
+class TridentStoreJSONLinesBackend(TridentStoreBackend):
+    """Append-only store backend writing each result as a single JSON record on its own line.
+    Records are never rewritten once written, the nested store view used by the JSON stores
+    can be rebuilt from the records using :func:`compact_store`.
+
+    Each record is of the form `{"runner": "[RUNNER]", "run": "[RUN]", "index": [INDEX], "result": ...}`.
+
+    :param store_path: The path to the store on the disk.
+    :type store_path: :class:`pathlib.Path`
+    """
+
+    suffix: str = ".jsonl"
+    incremental: bool = True
+
+    _locks: Dict[Path, Lock] = {}
+    _locks_lock: Lock = Lock()
+
+    def __init__(self, store_path: Path):
+        super().__init__(store_path)
+        self.store_index = TridentStoreIndex(self.store_path)
+        self._store_obj = None
+        self._runs = {}
+
+        # The store and its index are read from other threads while the writer appends, so access is serialized per path.
+        with self._locks_lock:
+            self._lock = self._locks.setdefault(self.store_path.resolve(), Lock())
+
+    def run_index(self, runner_id: AnyStr) -> AnyStr:
+        """Determine the run index for the next run of the given runner from the index of the store.
+        The index is rebuilt from the records in the store if it is missing or outdated.
+        If the runner has no runs in the store then return 0 as first index.
+
+        :param runner_id: The runner to determine the next run index for.
+        :type runner_id: str
+        :return: The index of the next run.
+        :rtype: str
+        """
+        if not self.store_path.exists():
+            return str(0)
+
+        with self._lock:
+            if not self.store_index.load():
+                self._rebuild_index()
+
+            return self.store_index.run_index(runner_id)
+
+    def load_run(self, runner_id: AnyStr, run_index: AnyStr) -> Dict[str, Any]:
+        """Load the results of a single run by only reading the part of the store given by the offsets in the index.
+
+        :param runner_id: The runner that the run belongs to.
+        :type runner_id: str
+        :param run_index: The run to load the results for.
+        :type run_index: str
+        :return: The results of the run in the form of {"[INDEX]": ...}
+        :rtype: dict
+        """
+        if not self.store_path.exists():
+            return {}
+
+        with self._lock:
+            if not self.store_index.load():
+                self._rebuild_index()
+
+            offsets = self.store_index.run_offsets(runner_id, run_index)
+
+        results = {}
+        if offsets is None:
+            return results
+
+        start, end = offsets
+        for record in self.read_records(start=start, end=end):
+            if record["runner"] == runner_id and str(record["run"]) == str(run_index):
+                results[str(record["index"])] = record["result"]
+
+        return results
+
+    def write_results(
+        self, runs: Dict[Tuple[AnyStr, AnyStr], Dict[int, Any]]
+    ) -> NoReturn:
+        """Append the results of the runs to the end of the store in a single write, the results are flushed to the disk immediately.
+
+        :param runs: The results of each run in the form of {("[RUNNER]", "[RUN]"): {[INDEX]: ...}}
+        :type runs: Dict[Tuple[str, str], Dict[int, Any]]
+        """
+        records, offsets, size = [], {}, 0
+        for (runner_id, run_index), results in runs.items():
+            start = size
+            for result_index, result in results.items():
+                _result = self._encode_result(runner_id, result_index, result)
+                if _result is None:
+                    continue
+
+                record = (
+                    f'{{"runner": {json.dumps(runner_id)}, "run": {json.dumps(run_index)}, "index": {json.dumps(result_index)}, "result": {_result}}}\n'
+                ).encode("utf-8")
+                records.append(record)
+                size += len(record)
+
+            if size > start:
+                offsets[(runner_id, str(run_index))] = (start, size)
+
+        if not records:
+            return
+
+        with self._lock:
+            if self._store_obj is None:
+                self._store_obj = open(self.store_path, "ab")
+
+            self._store_obj.write(b"".join(records))
+            self._store_obj.flush()
+
+            # The file position is at the end of these records, other processes might have appended before them.
+            position = self._store_obj.tell() - size
+            for run, (start, end) in offsets.items():
+                if run not in self._runs:
+                    self._runs[run] = [position + start, position + end]
+                    # Runs are registered when started so that the run index is never reused even if the runner crashes.
+                    self.store_index.update_run(*run, position + start)
+                else:
+                    self._runs[run][1] = position + end
+
+    def finish_run(self, runner_id: AnyStr, run_index: AnyStr) -> NoReturn:
+        """Record the end offset of a finished run in the index of the store.
+
+        :param runner_id: The runner that the run belongs to.
+        :type runner_id: str
+        :param run_index: The run that finished.
+        :type run_index: str
+        """
+        with self._lock:
+            offsets = self._runs.pop((runner_id, str(run_index)), None)
+            if offsets is not None:
+                self.store_index.update_run(runner_id, run_index, *offsets)
+
+    def read_records(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Generator[Dict[AnyStr, Any], None, None]:
+        """Read each record written to the store in the order that they were appended.
+        Lines that can't be parsed, for example a partially written last line, are skipped.
+
+        :param start: The byte offset to start reading from, defaults to the start of the store.
+        :type start: Optional[int]
+        :param end: The byte offset to stop reading at, defaults to the end of the store.
+        :type end: Optional[int]
+        :yield: The parsed record.
+        :rtype: Generator[Dict[str, Any], None, None]
+        """
+        for _, _, record in self._read_lines(start=start, end=end):
+            if record is not None:
+                yield record
+
+    def _read_lines(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Generator[Tuple[int, int, Optional[Dict[AnyStr, Any]]], None, None]:
+        """Read each line in the store together with the byte offsets of the line.
+
+        :param start: The byte offset to start reading from, defaults to the start of the store.
+        :type start: Optional[int]
+        :param end: The byte offset to stop reading at, defaults to the end of the store.
+        :type end: Optional[int]
+        :yield: The start offset, end offset and parsed record of the line, the record is `None` if it could not be parsed.
+        :rtype: Generator[Tuple[int, int, Optional[Dict[str, Any]]], None, None]
+        """
+        if not self.store_path.exists():
+            return
+
+        with open(self.store_path, "rb") as store_obj:
+            position = start if start is not None else 0
+            store_obj.seek(position)
+            for line in store_obj:
+                line_start, position = position, position + len(line)
+                if end is not None and line_start >= end:
+                    break
+
+                if not line.strip():
+                    continue
+
+                try:
+                    yield line_start, position, json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning(
+                        f"Skipping malformed record at offset: '{line_start}' in store: '{self.store_path}'"
+                    )
+                    yield line_start, position, None
+
+    def _rebuild_index(self) -> NoReturn:
+        """Rebuild the index of the store by reading the offsets of each run from the records in the store."""
+        logger.debug(f"Rebuilding the index for store: '{self.store_path}'")
+        runners = {}
+        for start, end, record in self._read_lines():
+            if record is None:
+                continue
+
+            runs = runners.setdefault(record["runner"], {})
+            offsets = runs.setdefault(str(record["run"]), [start, end])
+            offsets[1] = end
+
+        self.store_index.rebuild(runners)
+
+    def load_store(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        """Rebuild the nested store view from the records in the store.
+
+        :return: The store structure in the form of {"runners": {"[RUNNER]": {"results": {...}}}}
+        :rtype: dict
+        """
+        store_data = {"runners": {}}
+        for record in self.read_records():
+            runner = store_data["runners"].setdefault(record["runner"], {"results": {}})
+            runner["results"].setdefault(str(record["run"]), {})[
+                str(record["index"])
+            ] = record["result"]
+
+        return store_data
+
+    def close(self) -> NoReturn:
+        """Close the file handler used to append to the store if it is open and record the finished runs in the index."""
+        with self._lock:
+            if self._store_obj is not None:
+                self._store_obj.close()
+                self._store_obj = None
+
+            for (runner_id, run_index), (start, end) in self._runs.items():
+                self.store_index.update_run(runner_id, run_index, start, end)
+
+            self._runs = {}
+
+
+class TridentStoreSQLiteBackend(TridentStoreBackend):
+    """Store backend keeping the results in an SQLite database using the `sqlite3` library.
+    Each result is a row in the `results` table keyed by the runner, run index and result index, the key doubles as the
+    index used to find the runs of a runner. The database uses write-ahead logging so that the store can be read while results are written.
+
+    :param store_path: The path to the store on the disk.
+    :type store_path: :class:`pathlib.Path`
+    """
+
+    suffix: str = ".sqlite"
+    incremental: bool = True
+
+    def __init__(self, store_path: Path):
+        super().__init__(store_path)
+        self._connection = None
+        self._lock = Lock()
+
+    def run_index(self, runner_id: AnyStr) -> AnyStr:
+        if not self.store_path.exists():
+            return str(0)
+
+        with self._lock:
+            (run,) = (
+                self._connect()
+                .execute("SELECT MAX(run) FROM results WHERE runner = ?", (runner_id,))
+                .fetchone()
+            )
+
+        if run is None:
+            return str(0)
+
+        return str(run + 1)
+
+    def load_run(self, runner_id: AnyStr, run_index: AnyStr) -> Dict[str, Any]:
+        if not self.store_path.exists():
+            return {}
+
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT result_index, result FROM results WHERE runner = ? AND run = ? ORDER BY result_index",
+                    (runner_id, int(run_index)),
+                )
+                .fetchall()
+            )
+
+        return {str(result_index): json.loads(result) for result_index, result in rows}
+
+    def load_store(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        store_data = {"runners": {}}
+        if not self.store_path.exists():
+            return store_data
+
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT runner, run, result_index, result FROM results ORDER BY runner, run, result_index"
+                )
+                .fetchall()
+            )
+
+        for runner_id, run, result_index, result in rows:
+            runner = store_data["runners"].setdefault(runner_id, {"results": {}})
+            runner["results"].setdefault(str(run), {})[str(result_index)] = json.loads(
+                result
+            )
+
+        return store_data
+
+    def write_results(
+        self, runs: Dict[Tuple[AnyStr, AnyStr], Dict[int, Any]]
+    ) -> NoReturn:
+        """Insert the results of the runs into the store in a single transaction.
+
+        :param runs: The results of each run in the form of {("[RUNNER]", "[RUN]"): {[INDEX]: ...}}
+        :type runs: Dict[Tuple[str, str], Dict[int, Any]]
+        """
+        rows = []
+        for (runner_id, run_index), results in runs.items():
+            for result_index, result in results.items():
+                _result = self._encode_result(runner_id, result_index, result)
+                if _result is not None:
+                    rows.append((runner_id, int(run_index), int(result_index), _result))
+
+        if not rows:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (runner, run, result_index, result) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+    def close(self) -> NoReturn:
+        """Close the connection to the database if it is open."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection to the database if it is not open and create the `results` table if it does not exist,
+        the caller must hold the lock of the backend.
+
+        :return: The connection to the database.
+        :rtype: :class:`sqlite3.Connection`
+        """
+        if self._connection is None:
+            # The connection is shared by the threads using this backend and serialized by the lock.
+            self._connection = sqlite3.connect(
+                str(self.store_path), check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (runner TEXT NOT NULL, run INTEGER NOT NULL, result_index INTEGER NOT NULL, result TEXT NOT NULL, PRIMARY KEY (runner, run, result_index))"
+            )
+
+        return self._connection
+
+
+STORE_BACKENDS = {
+    "json": TridentStoreJSONBackend,
+    "jsonl": TridentStoreJSONLinesBackend,
+    "sqlite": TridentStoreSQLiteBackend,
+}
+
+
+def compact_store(
+    store_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None
+) -> Path:
+    """Compact a store written incrementally, by the `jsonl` or `sqlite` backend, into the nested `{"runners": {...}}` JSON view used by the JSON stores.
+    The backend is determined from the suffix of the store, stores without a known suffix are read as `jsonl` stores.
+    The store itself is left untouched.
+
+    :param store_path: The path to the store to compact.
+    :type store_path: Union[str, :class:`pathlib.Path`]
+    :param output_path: The path to write the compacted store to, defaults to the store path with the `.json` suffix.
+    :type output_path: Optional[Union[str, :class:`pathlib.Path`]]
+    :raises FileNotFoundError: If the store does not exist.
+    :raises ValueError: If the compacted store would overwrite the store.
+    :return: The path to the compacted store.
+    :rtype: :class:`pathlib.Path`
+    """
+    store_path = Path(store_path)
+    if not store_path.is_file():
+        raise FileNotFoundError(f"Store: '{store_path}' does not exist")
+
+    output_path = (
+        Path(output_path)
+        if output_path is not None
+        else store_path.with_suffix(".json")
+    )
+    if output_path.resolve() == store_path.resolve():
+        raise ValueError(
+            f"Compacted store: '{output_path}' would overwrite the store: '{store_path}'"
+        )
+
+    store_backend = {
+        backend.suffix: backend for backend in STORE_BACKENDS.values()
+    }.get(store_path.suffix, TridentStoreJSONLinesBackend)(store_path)
+    try:
+        store_data = store_backend.load_store()
+    finally:
+        store_backend.close()
+
+    with open(output_path, "w") as output_obj:
+        output_obj.write(json.dumps(store_data))
+
+    logger.info(
+        f"Compacted ({len(store_data['runners'])}) runner(s) from store: '{store_path}' into: '{output_path}'"
+    )
+    return output_path
@@ -15,6 +15,7 @@ import logging
 logger = logging.getLogger("__main__")
 
 from trident.lib.daemon.trident import TridentDaemonConfig, TridentDaemon
+from trident.lib.runner.trident import RUNNER_EXECUTORS
 
 
 @dataclass
@@ -38,6 +39,8 @@ class TridentConfig:
         self.trident_daemon_config = {
             "plugins": kwargs.get("plugins"),
             "workers": kwargs["args"]["daemon"].get("workers"),
+            "executor": kwargs["args"]["daemon"].get("executor") or "thread",
+            "scheduler": bool(kwargs["args"]["daemon"].get("scheduler")),
         }
 
         self._verify_trident_config()
@@ -76,6 +79,11 @@ class TridentConfig:
                 f"Invalid amount of workers specified: '{self.trident_daemon_config['workers']}', value must be greater than 0"
             )
 
+        if self.trident_daemon_config["executor"] not in RUNNER_EXECUTORS:
+            raise ValueError(
+                f"Unsupported executor: '{self.trident_daemon_config['executor']}', expected any of: {RUNNER_EXECUTORS}"
+            )
+
         if not self.trident_daemon_config["plugins"]:
             logger.warning("No plugins was specified")
 
@@ -108,11 +116,15 @@ class Trident:
 
     def start_trident_daemon(self) -> NoReturn:
         """Start the :class:`TridentDaemon` by starting each :class:`TridentRunner` and wait for them to end.
+        In scheduler mode the runners are run according to their schedules until interrupted.
 
         :raises Exception: If any error occurs when starting/waiting for the runners.
         """
         try:
-            self.trident_daemon.start_all_runners()
+            if self.trident_daemon.daemon_config.scheduler:
+                self.trident_daemon.start_scheduler()
+            else:
+                self.trident_daemon.start_all_runners()
         except Exception as e:
             raise e
 